@@ -0,0 +1,7 @@
+-- 만료 경매 정리(auction-service AUCTION_EXPIRY_SWEEP_INTERVAL) 용 인덱스
+-- 'active' 경매만 expires_at 순으로 찾으므로 부분 인덱스로 만들어 만료/완료된 행이 늘어나도 크기가 일정합니다.
+
+CREATE INDEX IF NOT EXISTS idx_auctions_active_expires_at
+  ON auctions(expires_at)
+  WHERE status = 'active';
+
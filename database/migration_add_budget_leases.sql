@@ -0,0 +1,24 @@
+-- 광고주 예산 리스 테이블 마이그레이션 (auction-service 예산 페이싱 모드: AUCTION_BUDGET_LEDGER=1)
+-- 각 경매 워커가 광고주 일일 예산의 일부를 리스로 확보하고, 사용액은 주기적으로
+-- advertiser_daily_spend 에 반영합니다.
+-- 불변식: advertiser_daily_spend.amount + SUM(outstanding) <= auto_bid_settings.daily_budget
+
+CREATE TABLE IF NOT EXISTS advertiser_budget_leases (
+    worker_id VARCHAR(128) NOT NULL,
+    advertiser_id INTEGER NOT NULL REFERENCES advertisers(id) ON DELETE CASCADE,
+    spend_date DATE NOT NULL,
+    outstanding BIGINT NOT NULL DEFAULT 0 CHECK (outstanding >= 0),
+    heartbeat_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (worker_id, advertiser_id, spend_date)
+);
+
+-- 리스 발급 시 광고주·일자별 outstanding 합계 조회
+CREATE INDEX IF NOT EXISTS idx_advertiser_budget_leases_advertiser_date
+  ON advertiser_budget_leases(advertiser_id, spend_date);
+
+-- heartbeat 가 끊긴 리스 회수
+CREATE INDEX IF NOT EXISTS idx_advertiser_budget_leases_heartbeat
+  ON advertiser_budget_leases(heartbeat_at);
+
+COMMENT ON TABLE advertiser_budget_leases IS '경매 워커별 광고주 일일 예산 리스';
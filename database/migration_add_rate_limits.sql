@@ -0,0 +1,15 @@
+-- /start 레이트리밋 공유 테이블 마이그레이션 (auction-service: AUCTION_RATE_LIMIT_BACKEND=postgres)
+-- 키(IP + 쿼리 해시)별 최근 요청 시각을 저장하여 모든 경매 워커가 같은 한도를 적용합니다.
+-- 유실되어도 무방한 단기 데이터이므로 WAL 을 쓰지 않는 UNLOGGED 테이블로 생성합니다.
+
+CREATE UNLOGGED TABLE IF NOT EXISTS auction_rate_limits (
+    key VARCHAR(128) PRIMARY KEY,
+    hits TIMESTAMPTZ[] NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+-- 만료 행 정리
+CREATE INDEX IF NOT EXISTS idx_auction_rate_limits_expires_at
+  ON auction_rate_limits(expires_at);
+
+COMMENT ON TABLE auction_rate_limits IS '경매 /start 레이트리밋 (워커 간 공유, UNLOGGED)';
@@ -0,0 +1,10 @@
+-- advertiser_matching_cache 매칭 점수 정밀도 확장 마이그레이션
+-- 매칭 점수는 가중치 곱(예: 0.85 * 1.5 = 1.275)으로 소수 셋째 자리 이상이 필요하므로
+-- NUMERIC(5,2) 에서는 캐시 적중 시 점수가 달라집니다. 소수 넷째 자리까지 저장합니다.
+
+-- 1. match_score 타입 확장 (최대 점수 상한 3.0)
+ALTER TABLE advertiser_matching_cache
+  ALTER COLUMN match_score TYPE NUMERIC(6,4);
+
+-- 2. 기존 캐시는 정밀도가 낮으므로 비움 (캐시 테이블이라 안전)
+DELETE FROM advertiser_matching_cache;
@@ -0,0 +1,20 @@
+@echo off
+echo Running Auction Expiry Migration...
+
+REM PostgreSQL connection settings
+set PGHOST=localhost
+set PGPORT=5432
+set PGDATABASE=search_exchange_db
+set PGUSER=admin
+set PGPASSWORD=your_secure_password_123
+
+echo Creating idx_auctions_active_expires_at index...
+psql -h %PGHOST% -p %PGPORT% -U %PGUSER% -d %PGDATABASE% -f migration_add_auction_expiry_index.sql
+if %ERRORLEVEL% NEQ 0 (
+    echo Error creating idx_auctions_active_expires_at index
+    exit /b 1
+)
+
+echo Auction Expiry Migration completed successfully!
+echo - Created idx_auctions_active_expires_at for the expired auction sweeper
+pause
@@ -0,0 +1,20 @@
+#!/bin/bash
+
+echo "Running Auction Expiry Migration..."
+
+# PostgreSQL connection settings
+export PGHOST=localhost
+export PGPORT=5432
+export PGDATABASE=search_exchange_db
+export PGUSER=admin
+export PGPASSWORD=your_secure_password_123
+
+echo "Creating idx_auctions_active_expires_at index..."
+psql -h $PGHOST -p $PGPORT -U $PGUSER -d $PGDATABASE -f migration_add_auction_expiry_index.sql
+if [ $? -ne 0 ]; then
+    echo "Error creating idx_auctions_active_expires_at index"
+    exit 1
+fi
+
+echo "Auction Expiry Migration completed successfully!"
+echo "- Created idx_auctions_active_expires_at for the expired auction sweeper"
@@ -0,0 +1,20 @@
+@echo off
+echo Running Budget Lease Migration...
+
+REM PostgreSQL connection settings
+set PGHOST=localhost
+set PGPORT=5432
+set PGDATABASE=search_exchange_db
+set PGUSER=admin
+set PGPASSWORD=your_secure_password_123
+
+echo Creating advertiser_budget_leases table...
+psql -h %PGHOST% -p %PGPORT% -U %PGUSER% -d %PGDATABASE% -f migration_add_budget_leases.sql
+if %ERRORLEVEL% NEQ 0 (
+    echo Error creating advertiser_budget_leases table
+    exit /b 1
+)
+
+echo Budget Lease Migration completed successfully!
+echo - Created advertiser_budget_leases table for AUCTION_BUDGET_LEDGER mode
+pause
@@ -0,0 +1,20 @@
+#!/bin/bash
+
+echo "Running Budget Lease Migration..."
+
+# PostgreSQL connection settings
+export PGHOST=localhost
+export PGPORT=5432
+export PGDATABASE=search_exchange_db
+export PGUSER=admin
+export PGPASSWORD=your_secure_password_123
+
+echo "Creating advertiser_budget_leases table..."
+psql -h $PGHOST -p $PGPORT -U $PGUSER -d $PGDATABASE -f migration_add_budget_leases.sql
+if [ $? -ne 0 ]; then
+    echo "Error creating advertiser_budget_leases table"
+    exit 1
+fi
+
+echo "Budget Lease Migration completed successfully!"
+echo "- Created advertiser_budget_leases table for AUCTION_BUDGET_LEDGER mode"
@@ -0,0 +1,20 @@
+@echo off
+echo Running Matching Cache Migration...
+
+REM PostgreSQL connection settings
+set PGHOST=localhost
+set PGPORT=5432
+set PGDATABASE=search_exchange_db
+set PGUSER=admin
+set PGPASSWORD=your_secure_password_123
+
+echo Widening match_score precision on advertiser_matching_cache...
+psql -h %PGHOST% -p %PGPORT% -U %PGUSER% -d %PGDATABASE% -f migration_widen_matching_cache_score.sql
+if %ERRORLEVEL% NEQ 0 (
+    echo Error widening match_score column
+    exit /b 1
+)
+
+echo Matching Cache Migration completed successfully!
+echo - advertiser_matching_cache.match_score is now NUMERIC(6,4)
+pause
@@ -0,0 +1,20 @@
+#!/bin/bash
+
+echo "Running Matching Cache Migration..."
+
+# PostgreSQL connection settings
+export PGHOST=localhost
+export PGPORT=5432
+export PGDATABASE=search_exchange_db
+export PGUSER=admin
+export PGPASSWORD=your_secure_password_123
+
+echo "Widening match_score precision on advertiser_matching_cache..."
+psql -h $PGHOST -p $PGPORT -U $PGUSER -d $PGDATABASE -f migration_widen_matching_cache_score.sql
+if [ $? -ne 0 ]; then
+    echo "Error widening match_score column"
+    exit 1
+fi
+
+echo "Matching Cache Migration completed successfully!"
+echo "- advertiser_matching_cache.match_score is now NUMERIC(6,4)"
@@ -0,0 +1,20 @@
+@echo off
+echo Running Rate Limit Migration...
+
+REM PostgreSQL connection settings
+set PGHOST=localhost
+set PGPORT=5432
+set PGDATABASE=search_exchange_db
+set PGUSER=admin
+set PGPASSWORD=your_secure_password_123
+
+echo Creating auction_rate_limits table...
+psql -h %PGHOST% -p %PGPORT% -U %PGUSER% -d %PGDATABASE% -f migration_add_rate_limits.sql
+if %ERRORLEVEL% NEQ 0 (
+    echo Error creating auction_rate_limits table
+    exit /b 1
+)
+
+echo Rate Limit Migration completed successfully!
+echo - Created auction_rate_limits table for AUCTION_RATE_LIMIT_BACKEND=postgres
+pause
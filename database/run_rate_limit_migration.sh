@@ -0,0 +1,20 @@
+#!/bin/bash
+
+echo "Running Rate Limit Migration..."
+
+# PostgreSQL connection settings
+export PGHOST=localhost
+export PGPORT=5432
+export PGDATABASE=search_exchange_db
+export PGUSER=admin
+export PGPASSWORD=your_secure_password_123
+
+echo "Creating auction_rate_limits table..."
+psql -h $PGHOST -p $PGPORT -U $PGUSER -d $PGDATABASE -f migration_add_rate_limits.sql
+if [ $? -ne 0 ]; then
+    echo "Error creating auction_rate_limits table"
+    exit 1
+fi
+
+echo "Rate Limit Migration completed successfully!"
+echo "- Created auction_rate_limits table for AUCTION_RATE_LIMIT_BACKEND=postgres"
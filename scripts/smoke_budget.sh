@@ -47,7 +47,7 @@ curl -sf "${API_BASE}/auto-bid-settings/${ADVERTISER_ID}" \
   -H "Authorization: ${AUTH_HEADER_VALUE}" \
   | ${JQ}
 
-echo ">>> [3/3] Triggering auction-service reverse auction (verify _reserve_budget_tx in logs)"
+echo ">>> [3/3] Triggering auction-service reverse auction (verify budget_reservation in /metrics, budget_insufficient in logs)"
 curl -sf -X POST "${AUCTION_BASE}/start" \
   -H "Content-Type: application/json" \
   -d '{"query": "budget smoke test", "quality_score": 60}' \
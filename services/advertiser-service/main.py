@@ -1,6 +1,7 @@
 # app.py
 import os
 import re
+import json
 import random
 import logging
 from datetime import datetime, timedelta
@@ -122,6 +123,32 @@ async def shutdown():
     await disconnect_from_database()
 
 
+# ------------------------------------------------------------------------------
+# 매칭 데이터 변경 이벤트 (auction-service 인메모리 매칭 캐시 갱신용)
+# ------------------------------------------------------------------------------
+MATCHING_CHANGES_CHANNEL = os.getenv(
+    "MATCHING_CHANGES_CHANNEL", "auction_matching_changes"
+)
+
+
+async def publish_matching_change(advertiser_id: int, *kinds: str) -> None:
+    """
+    광고주의 키워드/카테고리/자동입찰 설정 변경을 Postgres NOTIFY 로 알립니다.
+    kinds: "keywords" | "categories" | "settings" | "profile"
+    발행 실패는 원 요청을 실패시키지 않습니다.
+    """
+    payload = json.dumps({"advertiser_id": advertiser_id, "kinds": list(kinds)})
+    try:
+        await database.execute(
+            "SELECT pg_notify(:channel, :payload)",
+            {"channel": MATCHING_CHANGES_CHANNEL, "payload": payload},
+        )
+    except Exception as e:
+        logger.warning(
+            "matching change publish failed (advertiser_id=%s): %r", advertiser_id, e
+        )
+
+
 # ------------------------------------------------------------------------------
 # CORS
 # ------------------------------------------------------------------------------
@@ -694,6 +721,9 @@ async def save_business_setup_data(
                 "excluded_keywords": [],  # TEXT[] 배열은 Python 리스트
             },
         )
+        await publish_matching_change(
+            advertiser_id, "keywords", "categories", "settings", "profile"
+        )
     except Exception as e:
         logger.exception("save_business_setup_data error: %r", e)
         raise
@@ -950,6 +980,7 @@ async def confirm_suggestions(
                     "is_primary": cat.get("is_primary", False),
                 },
             )
+        await publish_matching_change(advertiser_id, "keywords", "categories")
 
         return {
             "success": True,
@@ -1206,6 +1237,7 @@ async def update_review_status(
                 {"id": advertiser_id},
             )
             logger.info(f"광고주 {advertiser_id} 심사 승인으로 자동 입찰 활성화")
+        await publish_matching_change(advertiser_id, "settings", "profile")
 
         return {"success": True, "message": "심사 상태가 업데이트되었습니다."}
     except HTTPException:
@@ -1256,6 +1288,7 @@ async def update_advertiser_data(
                     "is_primary": False,
                 },
             )
+        await publish_matching_change(advertiser_id, "keywords", "categories")
         return {"success": True, "message": "광고주 데이터가 업데이트되었습니다."}
     except HTTPException:
         raise
@@ -1736,6 +1769,7 @@ async def update_account_info(
                 "daily_budget": float(daily_budget),
             },
         )
+        await publish_matching_change(advertiser_id, "settings", "profile")
 
         return {
             "success": True,
@@ -1860,6 +1894,7 @@ async def update_auto_bid_settings(
             min_quality_score,
             is_enabled,
         )
+        await publish_matching_change(advertiser_id, "settings")
 
         return {"success": True, "data": dict(updated)}
     except HTTPException:
@@ -1964,6 +1999,7 @@ async def update_advertiser_keywords(advertiser_id: int, request: Request):
                     "mt": item["match_type"],
                 },
             )
+        await publish_matching_change(advertiser_id, "keywords")
         return {"success": True, "message": "키워드가 업데이트되었습니다"}
     except HTTPException:
         raise
@@ -2031,12 +2067,9 @@ async def get_bid_history(
     resultFilter: str = "all",
 ):
     try:
-        time_conditions = {
-            "today": "AND abl.created_at >= CURRENT_DATE",
-            "week": "AND abl.created_at >= CURRENT_DATE - INTERVAL '7 days'",
-            "month": "AND abl.created_at >= CURRENT_DATE - INTERVAL '30 days'",
-        }
-        time_condition = time_conditions.get(timeRange, time_conditions["week"])
+        # 기간/결과 필터는 고정 SQL 의 바인드 파라미터로 전달 (조합마다 SQL 텍스트가 달라지지 않도록)
+        days_by_range = {"today": 0, "week": 7, "month": 30}
+        days = days_by_range.get(timeRange, days_by_range["week"])
 
         if filter not in {"all", "auto", "manual"}:
             logger.warning("Unknown filter '%s' received; defaulting to 'all'", filter)
@@ -2047,16 +2080,16 @@ async def get_bid_history(
             )
             return []
 
-        result_condition = ""
+        bid_result = None
         if resultFilter in {"won", "lost"}:
-            result_condition = f"AND abl.bid_result = '{resultFilter}'"
+            bid_result = resultFilter
         elif resultFilter != "all":
             logger.warning(
                 "Unknown resultFilter '%s' received; defaulting to 'all'", resultFilter
             )
 
         rows = await database.fetch_all(
-            f"""
+            """
             SELECT abl.id,
                    abl.search_query,
                    abl.bid_amount,
@@ -2067,11 +2100,12 @@ async def get_bid_history(
                    TRUE AS is_auto_bid
             FROM auto_bid_logs abl
             WHERE abl.advertiser_id = :id
-              {time_condition} {result_condition}
+              AND abl.created_at >= CURRENT_DATE - CAST(:days AS integer) * INTERVAL '1 day'
+              AND (CAST(:bid_result AS text) IS NULL OR abl.bid_result = :bid_result)
             ORDER BY abl.created_at DESC
             LIMIT 100
             """,
-            {"id": advertiser_id},
+            {"id": advertiser_id, "days": days, "bid_result": bid_result},
         )
         history = []
         for row in rows:
@@ -2975,6 +3009,9 @@ async def delete_advertiser(
             await database.execute(
                 "DELETE FROM advertisers WHERE id = :id", {"id": advertiser_id}
             )
+        await publish_matching_change(
+            advertiser_id, "keywords", "categories", "settings", "profile"
+        )
         return {"success": True, "message": "Advertiser deleted successfully"}
     except HTTPException:
         raise
@@ -2,7 +2,7 @@
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import Response, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, cast
 from jose import jwt, JWTError
@@ -282,6 +282,73 @@ async def proxy_request(
     raise HTTPException(status_code=500, detail="Internal proxy error")
 
 
+async def proxy_stream_request(
+    service_name: str,
+    path: str,
+    data: Optional[dict] = None,
+    request: Optional[Request] = None,
+    method: str = "POST",
+) -> Response:
+    """
+    스트리밍 응답(text/event-stream 등)을 버퍼링 없이 그대로 전달 (재시도 없음)
+    업스트림 응답이 끝나면 연결을 닫습니다.
+    """
+    if service_name not in SERVICE_URLS:
+        raise HTTPException(status_code=404, detail=f"Service {service_name} not found")
+
+    url = f"{SERVICE_URLS[service_name].rstrip('/')}{path}"
+    headers = _collect_forward_headers(request, auth_required=True)
+    params = dict(request.query_params) if request else None
+
+    # 스트림은 이벤트 사이 간격이 길 수 있으므로 read 타임아웃 없음
+    client = httpx.AsyncClient(
+        timeout=httpx.Timeout(connect=5.0, read=None, write=15.0, pool=5.0)
+    )
+    try:
+        upstream = await client.send(
+            client.build_request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=(data or {}) if method.upper() in {"POST", "PUT", "PATCH"} else None,
+            ),
+            stream=True,
+        )
+    except httpx.RequestError as e:
+        await client.aclose()
+        logger.error(
+            "업스트림 서비스 연결 오류 (service=%s, url=%s): %s",
+            service_name,
+            url,
+            repr(e),
+        )
+        raise HTTPException(
+            status_code=503, detail=f"Service {service_name} is unavailable"
+        ) from e
+
+    async def body():
+        try:
+            async for chunk in upstream.aiter_raw():
+                yield chunk
+        finally:
+            await upstream.aclose()
+            await client.aclose()
+
+    out_headers = {
+        k: v
+        for k, v in upstream.headers.items()
+        if k.lower() not in HOP_BY_HOP
+        and k.lower() not in ("set-cookie", "content-length")
+    }
+    return StreamingResponse(
+        body(),
+        status_code=upstream.status_code,
+        media_type=upstream.headers.get("content-type"),
+        headers=out_headers,
+    )
+
+
 # ----------------------------- 라우트 정의 -----------------------------
 # 사용자 서비스
 @app.post("/api/auth/register")
@@ -432,6 +499,27 @@ async def start_auction(request: Request):
     )
 
 
+@app.post("/api/auction/start/stream", dependencies=[Depends(verify_token)])
+async def start_auction_stream(request: Request):
+    body = await request.json()
+    return await proxy_stream_request("auction", "/start/stream", data=body, request=request)
+
+
+@app.get("/api/auction/status/{search_id}/wait", dependencies=[Depends(verify_token)])
+async def wait_auction_status(search_id: str, request: Request):
+    # long-poll: 경매 서비스 대기 시간(기본 10초)이 proxy read 타임아웃(15초)보다 짧음
+    return await proxy_request(
+        "auction", f"/status/{search_id}/wait", "GET", auth_required=True, request=request
+    )
+
+
+@app.get("/api/auction/status/{search_id}/events", dependencies=[Depends(verify_token)])
+async def stream_auction_status(search_id: str, request: Request):
+    return await proxy_stream_request(
+        "auction", f"/status/{search_id}/events", request=request, method="GET"
+    )
+
+
 @app.get("/api/auction/{search_id}", dependencies=[Depends(verify_token)])
 async def get_auction_status(search_id: str, request: Request):
     return await proxy_request(
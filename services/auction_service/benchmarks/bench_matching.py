@@ -0,0 +1,275 @@
+"""
+합성 규모별 매칭 / 경매 시작 벤치마크
+
+로컬 Postgres(init.sql 적용)에 키워드 1k ~ 1M 개 규모의 합성 데이터를 넣고
+- find_matching_advertisers (매칭만)
+- POST /start (매칭 + 입찰 생성 + 저장 전체)
+의 지연 시간(p50/p95/p99)과 처리량을 측정해 JSON 으로 저장합니다.
+커밋 간 비교는 --baseline 으로 이전 결과 파일을 넘기면 됩니다.
+
+실행 예:
+    BENCH_DATABASE_URL=postgresql://admin:pw@localhost:5432/search_exchange_db \\
+    python -m services.auction_service.benchmarks.bench_matching \\
+        --scales 1000,10000,100000 --output bench-$(git rev-parse --short HEAD).json
+
+pytest 수집 대상이 아니며(bench_ 접두사), 합성 데이터는 실행 전후로 정리합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from .synthetic import cleanup, generate_dataset, sample_queries, seed
+
+SUITE = "auction-matching"
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1", ""}
+BENCHMARKS = ("find_matching_advertisers", "start_auction")
+# 매칭 벤치마크에 쓰는 품질 점수 (합성 광고주 min_quality_score 는 30~80)
+BENCH_QUALITY_SCORE = 80
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", default="1000,10000,100000,1000000")
+    parser.add_argument("--queries", type=int, default=500, help="규모별 측정 검색어 수")
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8, help="처리량 측정 동시 요청 수")
+    parser.add_argument("--modes", default="sql,index", help="sql: DB 조회, index: 인메모리 인덱스")
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="", help="결과 JSON 경로 (없으면 stdout)")
+    parser.add_argument("--baseline", default="", help="비교할 이전 결과 JSON")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.0,
+        help="p95 가 baseline 대비 이 비율(예: 0.2)보다 느려지면 종료 코드 1",
+    )
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL", ""))
+    parser.add_argument("--allow-remote", action="store_true", help="localhost 외 DB 허용")
+    parser.add_argument("--keep-data", action="store_true", help="마지막 규모 데이터를 남김")
+    return parser.parse_args(argv)
+
+
+def _csv(value: str) -> List[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _summarize(latencies: List[float], wall_seconds: float) -> Dict[str, Any]:
+    from ..utils.metrics import percentile
+
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "count": count,
+        "mean_ms": round(sum(ordered) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "throughput_qps": round(count / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+    }
+
+
+async def _measure(
+    call: Callable[[str], Awaitable[Any]],
+    warmup: List[str],
+    queries: List[str],
+    concurrency: int,
+) -> Dict[str, Any]:
+    """warmup 검색어를 먼저 호출한 뒤 concurrency 개씩 동시에 호출하며 지연 시간을 잽니다."""
+    for q in warmup:
+        await call(q)
+
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(q: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call(q)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(q) for q in queries))
+    return _summarize(latencies, time.perf_counter() - started)
+
+
+async def _prepare_mode(main: Any, mode: str) -> None:
+    """측정 모드 설정. 결과/프로필 캐시는 끄고 매칭 자체 비용을 잽니다."""
+    main._match_cache = None
+    main._profile_cache = None
+    if mode == "index":
+        await main.load_matching_index()
+    else:
+        main._matching_index = None
+        main._category_index = None
+        main._settings_cache = None
+
+
+async def _run_scale(
+    main: Any, client: Any, scale: int, args: argparse.Namespace
+) -> List[Dict[str, Any]]:
+    data = generate_dataset(scale, seed=args.seed)
+    queries = sample_queries(data, args.warmup + args.queries)
+    warmup, measured = queries[: args.warmup], queries[args.warmup :]
+
+    async with main.database.connection() as connection:
+        raw = connection.raw_connection
+        mark = await raw.fetchval("SELECT COALESCE(MAX(id), 0) FROM auctions")
+        await cleanup(raw, mark)
+        started = time.perf_counter()
+        await seed(raw, data)
+        seed_seconds = round(time.perf_counter() - started, 3)
+
+    async def match(q: str) -> Any:
+        return await main.find_matching_advertisers(q, BENCH_QUALITY_SCORE)
+
+    async def start(q: str) -> Any:
+        response = await client.post("/start", json={"query": q, "valueScore": BENCH_QUALITY_SCORE})
+        if response.status_code != 200:
+            raise RuntimeError(f"/start {response.status_code}: {response.text[:200]}")
+        return response
+
+    calls = {"find_matching_advertisers": match, "start_auction": start}
+    results = []
+    try:
+        for mode in _csv(args.modes):
+            load_started = time.perf_counter()
+            await _prepare_mode(main, mode)
+            load_seconds = round(time.perf_counter() - load_started, 3)
+            for name in _csv(args.benchmarks):
+                stats = await _measure(calls[name], warmup, measured, args.concurrency)
+                results.append(
+                    {
+                        "scale": scale,
+                        "mode": mode,
+                        "benchmark": name,
+                        "advertisers": len(data.advertisers),
+                        "seed_seconds": seed_seconds,
+                        "load_seconds": load_seconds,
+                        **stats,
+                    }
+                )
+                print(
+                    f"scale={scale:>8} mode={mode:<5} {name:<26} "
+                    f"p50={stats['p50_ms']:>8.2f}ms p95={stats['p95_ms']:>8.2f}ms "
+                    f"qps={stats['throughput_qps']:>8.1f}",
+                    file=sys.stderr,
+                )
+    finally:
+        if not args.keep_data or scale != int(_csv(args.scales)[-1]):
+            async with main.database.connection() as connection:
+                await cleanup(connection.raw_connection, mark)
+    return results
+
+
+def _compare(results: List[Dict[str, Any]], baseline_path: str, max_regression: float) -> bool:
+    """baseline 대비 p95 / 처리량 변화를 출력하고, 허용치를 넘는 회귀가 없으면 True"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    key = lambda r: (r["scale"], r["mode"], r["benchmark"])  # noqa: E731
+    previous = {key(r): r for r in baseline.get("results", [])}
+    ok = True
+    print(f"\nbaseline {baseline.get('commit', '')[:12]}", file=sys.stderr)
+    for r in results:
+        before = previous.get(key(r))
+        if before is None or not before["p95_ms"]:
+            continue
+        p95_delta = r["p95_ms"] / before["p95_ms"] - 1
+        qps_delta = (
+            r["throughput_qps"] / before["throughput_qps"] - 1 if before["throughput_qps"] else 0.0
+        )
+        regressed = max_regression > 0 and p95_delta > max_regression
+        ok = ok and not regressed
+        print(
+            f"scale={r['scale']:>8} mode={r['mode']:<5} {r['benchmark']:<26} "
+            f"p95 {p95_delta:+.1%} qps {qps_delta:+.1%}{'  REGRESSION' if regressed else ''}",
+            file=sys.stderr,
+        )
+    return ok
+
+
+async def run(args: argparse.Namespace) -> int:
+    if not args.database_url:
+        print("BENCH_DATABASE_URL 또는 --database-url 이 필요합니다.", file=sys.stderr)
+        return 2
+    host = urlparse(args.database_url).hostname or ""
+    if host not in LOCAL_HOSTS and not args.allow_remote:
+        print(f"로컬 DB 가 아닙니다 ({host}). --allow-remote 로 허용하세요.", file=sys.stderr)
+        return 2
+
+    # main 은 import 시점에 DATABASE_URL 로 연결 객체를 만듦
+    os.environ["DATABASE_URL"] = args.database_url
+    from httpx import ASGITransport, AsyncClient
+
+    from .. import main
+    from ..utils.rate_limit import SlidingWindowRateLimiter
+
+    main.app.dependency_overrides[main.get_user_id_from_token] = lambda: None
+    main._rate_limiter = SlidingWindowRateLimiter(60, 10**9)
+    main._shared_rate_limiter = None
+
+    await main.connect_to_database()
+    results: List[Dict[str, Any]] = []
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=main.app), base_url="http://bench"
+        ) as client:
+            for scale in _csv(args.scales):
+                results.extend(await _run_scale(main, client, int(scale), args))
+    finally:
+        await main.disconnect_from_database()
+
+    report = {
+        "suite": SUITE,
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "params": {
+            "queries": args.queries,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "quality_score": BENCH_QUALITY_SCORE,
+        },
+        "results": results,
+    }
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+    if args.baseline and not _compare(results, args.baseline, args.max_regression):
+        return 1
+    return 0
+
+
+def cli(argv: Optional[List[str]] = None) -> int:
+    return asyncio.run(run(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,130 @@
+"""
+/status 응답 생성 시간 비교 (20개 입찰 경매, DB 없이 응답 구성만 측정)
+
+- before : SELECT * 행(user_id / dest_url 포함) -> AuctionStatusResponse 검증
+           -> jsonable_encoder -> 표준 json JSONResponse
+- after  : 필요한 컬럼만 담은 dict -> FastJSONResponse (orjson 이 있으면 orjson)
+
+실행 예:
+    python -m services.auction_service.benchmarks.bench_status_response --output status-response.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+SUITE = "auction-status-response"
+BID_COUNT = 20
+
+
+def _rows(bid_count: int, full: bool) -> Dict[str, Any]:
+    """full=True 면 SELECT * 결과와 같은 컬럼"""
+    now = datetime(2024, 5, 1, 12, 0, 0, 123456)
+    auction = {
+        "id": 101,
+        "search_id": "search_1714564800_ab12cd34",
+        "query_text": "제주도 항공권 최저가",
+        "user_id": 7,
+        "status": "active",
+        "created_at": now,
+        "expires_at": now + timedelta(minutes=30),
+        "selected_bid_id": None,
+    }
+    bids = []
+    for i in range(bid_count):
+        bid = {
+            "id": f"bid_real_{1000 + i}_1714564800_{i:08x}",
+            "auction_id": 101,
+            "buyer_name": f"광고주 {i}",
+            "price": 5000 - i * 120,
+            "bonus_description": "구매 시 5% 추가 적립 + 무료 배송",
+            "landing_url": f"https://adv{i}.example.com/landing?utm_source=intendex",
+            "type": "ADVERTISER",
+            "advertiser_id": 1000 + i,
+            "created_at": now,
+        }
+        if full:
+            bid["user_id"] = 7
+            bid["dest_url"] = bid["landing_url"]
+        bids.append(bid)
+    status = {
+        "status": "active",
+        "selectedBidId": None,
+        "participants": bid_count,
+        "searchId": auction["search_id"],
+        "version": "active:",
+    }
+    return {"auction": auction, "bids": bids, "status": status}
+
+
+def build_before(data: Dict[str, Any]) -> bytes:
+    from ..main import AuctionStatusResponse
+
+    model = AuctionStatusResponse(
+        success=True, data=data, message="경매 상태 조회가 완료되었습니다."
+    )
+    return JSONResponse(jsonable_encoder(model)).body
+
+
+def build_after(data: Dict[str, Any]) -> bytes:
+    from ..utils.json_response import FastJSONResponse
+
+    return FastJSONResponse(
+        {"success": True, "data": data, "message": "경매 상태 조회가 완료되었습니다."}
+    ).body
+
+
+def _measure(fn: Any, data: Dict[str, Any], number: int, repeat: int) -> Dict[str, Any]:
+    times = timeit.repeat(lambda: fn(data), number=number, repeat=repeat)
+    per_call_us = [t / number * 1e6 for t in times]
+    return {
+        "best_us": round(min(per_call_us), 2),
+        "median_us": round(sorted(per_call_us)[len(per_call_us) // 2], 2),
+        "bytes": len(fn(data)),
+    }
+
+
+def run(bid_count: int, number: int, repeat: int) -> Dict[str, Any]:
+    from ..utils.json_response import json_backend
+
+    before = _measure(build_before, _rows(bid_count, full=True), number, repeat)
+    after = _measure(build_after, _rows(bid_count, full=False), number, repeat)
+    return {
+        "suite": SUITE,
+        "python": platform.python_version(),
+        "json_backend": json_backend(),
+        "params": {"bids": bid_count, "number": number, "repeat": repeat},
+        "results": {
+            "before": before,
+            "after": after,
+            "speedup": round(before["median_us"] / after["median_us"], 2),
+        },
+    }
+
+
+def cli(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bids", type=int, default=BID_COUNT)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", default="", help="결과 JSON 경로 (없으면 stdout)")
+    args = parser.parse_args(argv)
+
+    payload = json.dumps(run(args.bids, args.number, args.repeat), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,356 @@
+"""
+auto_bid_logs 기반 경매 리플레이
+
+기간 내 auto_bid_logs 행(과 대응하는 auctions 행)을 database.iterate 로 스트리밍하면서
+경매 단위로 묶고, 기록 당시의 검색어 / 품질 점수로 매칭과 입찰가 계산을 다시 실행합니다.
+경매 저장, 예산 예약, auto_bid_logs 기록은 하지 않습니다 (generate_real_advertiser_bids 만 호출).
+
+- 지연 시간: 경매별 리플레이 시간의 균등 표본(reservoir)으로 p50/p95/p99 계산
+- 입찰 차이: 광고주 집합 추가/제거, 공통 광고주의 입찰가 변화, 1위 광고주 변경
+- 메모리: 스트림 → 크기 제한 큐 → 워커 구조이고 집계는 누적값만 보관하므로 기간 크기와 무관
+  (경매별 상세 차이는 --diffs 로 JSONL 파일에 바로 기록)
+
+매칭/가격 정보는 리플레이 시점의 DB 상태를 사용하므로, 기록 이후 광고주 설정이 바뀐 만큼의
+차이도 함께 나타납니다.
+
+실행 예:
+    DATABASE_URL=postgresql://... python -m services.auction_service.benchmarks.replay \\
+        --since 2024-05-01T00:00 --until 2024-05-02T00:00 --concurrency 16 --output replay.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, TextIO
+
+# auto_bid_logs 행과, 같은 검색어로 가장 가까운 시각에 생성된 경매
+# (auto_bid_logs 에는 경매 ID 가 없어 검색어 + 생성 시각으로 대응시킴)
+REPLAY_LOGS_SQL = """
+    SELECT l.id, l.advertiser_id, l.search_query, l.bid_amount, l.match_score,
+           l.quality_score, l.competitor_count, l.created_at,
+           a.id AS auction_id, a.search_id
+    FROM auto_bid_logs l
+    LEFT JOIN LATERAL (
+        SELECT a.id, a.search_id
+        FROM auctions a
+        WHERE a.query_text = l.search_query
+          AND a.created_at BETWEEN l.created_at - make_interval(secs => :match_window)
+                               AND l.created_at + make_interval(secs => :match_window)
+        ORDER BY abs(extract(epoch FROM a.created_at - l.created_at)), a.id
+        LIMIT 1
+    ) a ON true
+    WHERE l.created_at >= :since AND l.created_at < :until
+    ORDER BY l.id
+"""
+
+
+@dataclass
+class LoggedAuction:
+    """auto_bid_logs 에 기록된 경매 한 건"""
+
+    search_query: str
+    quality_score: int
+    auction_id: Optional[int]
+    search_id: Optional[str]
+    created_at: Any
+    # 광고주 ID -> 기록된 입찰가 (플랫폼 폴백 입찰은 advertiser_id 가 NULL 이라 제외)
+    bids: Dict[int, int] = field(default_factory=dict)
+    row_count: int = 0
+
+
+def _starts_new_group(pending: List[Any], r: Any) -> bool:
+    """
+    한 경매의 행은 연속으로 기록되므로 (경매, 검색어, 품질 점수)가 바뀌거나
+    competitor_count 만큼 모이면 다음 경매로 봅니다.
+    """
+    first = pending[0]
+    return (
+        (r["auction_id"], r["search_query"], r["quality_score"])
+        != (first["auction_id"], first["search_query"], first["quality_score"])
+        or len(pending) >= (first["competitor_count"] or 1)
+    )
+
+
+def _to_logged(pending: List[Any]) -> LoggedAuction:
+    first = pending[0]
+    return LoggedAuction(
+        search_query=first["search_query"],
+        quality_score=first["quality_score"],
+        auction_id=first["auction_id"],
+        search_id=first["search_id"],
+        created_at=first["created_at"],
+        bids={r["advertiser_id"]: r["bid_amount"] for r in pending if r["advertiser_id"] is not None},
+        row_count=len(pending),
+    )
+
+
+def group_logged_auctions(rows: Iterable[Any]) -> Iterator[LoggedAuction]:
+    """id 순 auto_bid_logs 행을 경매 단위로 묶습니다."""
+    pending: List[Any] = []
+    for r in rows:
+        if pending and _starts_new_group(pending, r):
+            yield _to_logged(pending)
+            pending = []
+        pending.append(r)
+    if pending:
+        yield _to_logged(pending)
+
+
+async def _agroup(rows: AsyncIterator[Any]) -> AsyncIterator[LoggedAuction]:
+    """group_logged_auctions 의 비동기 스트림 버전 (경매 하나 분량만 버퍼링)"""
+    pending: List[Any] = []
+    async for r in rows:
+        if pending and _starts_new_group(pending, r):
+            yield _to_logged(pending)
+            pending = []
+        pending.append(r)
+    if pending:
+        yield _to_logged(pending)
+
+
+def diff_bids(logged: Dict[int, int], replayed: Dict[int, int]) -> Dict[str, Any]:
+    """광고주 ID -> 입찰가 맵 두 개의 차이"""
+    added = sorted(replayed.keys() - logged.keys())
+    removed = sorted(logged.keys() - replayed.keys())
+    common = logged.keys() & replayed.keys()
+    union = logged.keys() | replayed.keys()
+    price_changes = {
+        adv_id: replayed[adv_id] - logged[adv_id]
+        for adv_id in sorted(common)
+        if replayed[adv_id] != logged[adv_id]
+    }
+    top = lambda bids: max(bids, key=lambda a: (bids[a], -a)) if bids else None  # noqa: E731
+    return {
+        "added": added,
+        "removed": removed,
+        "price_changes": price_changes,
+        "jaccard": round(len(common) / len(union), 4) if union else 1.0,
+        "top_changed": top(logged) != top(replayed),
+        "identical": not added and not removed and not price_changes,
+    }
+
+
+class LatencyReservoir:
+    """고정 크기 균등 표본 (Algorithm R) - 샘플 수와 무관하게 메모리 일정"""
+
+    def __init__(self, size: int = 10000, rng: Optional[random.Random] = None) -> None:
+        self._size = size
+        self._rng = rng or random.Random(0)
+        self.samples: List[float] = []
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        if len(self.samples) < self._size:
+            self.samples.append(value)
+            return
+        slot = self._rng.randrange(self.count)
+        if slot < self._size:
+            self.samples[slot] = value
+
+    def summary(self) -> Dict[str, Any]:
+        from ..utils.metrics import percentile
+
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class ReplayReport:
+    """경매별 결과 누적 (상세 차이는 diffs_file 에 한 줄씩 기록)"""
+
+    def __init__(self, diffs_file: Optional[TextIO] = None, latency_samples: int = 10000) -> None:
+        self.latency = LatencyReservoir(latency_samples)
+        self._diffs_file = diffs_file
+        self.auctions = 0
+        self.unmatched_auctions = 0
+        self.errors = 0
+        self.identical = 0
+        self.set_changed = 0
+        self.top_changed = 0
+        self.price_changed = 0
+        self.added = 0
+        self.removed = 0
+        self.jaccard_sum = 0.0
+        self.abs_price_delta_sum = 0
+
+    def add(self, logged: LoggedAuction, diff: Dict[str, Any], seconds: float) -> None:
+        self.auctions += 1
+        self.latency.add(seconds)
+        if logged.auction_id is None:
+            self.unmatched_auctions += 1
+        self.identical += diff["identical"]
+        self.set_changed += bool(diff["added"] or diff["removed"])
+        self.top_changed += diff["top_changed"]
+        self.price_changed += bool(diff["price_changes"])
+        self.added += len(diff["added"])
+        self.removed += len(diff["removed"])
+        self.jaccard_sum += diff["jaccard"]
+        self.abs_price_delta_sum += sum(abs(d) for d in diff["price_changes"].values())
+        if self._diffs_file is not None and not diff["identical"]:
+            record = {
+                "search_id": logged.search_id,
+                "query": logged.search_query,
+                "quality_score": logged.quality_score,
+                "logged_at": str(logged.created_at),
+                **diff,
+            }
+            self._diffs_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def add_error(self) -> None:
+        self.errors += 1
+
+    def summary(self) -> Dict[str, Any]:
+        n = self.auctions
+        return {
+            "auctions": n,
+            "errors": self.errors,
+            "unmatched_auctions": self.unmatched_auctions,
+            "latency": self.latency.summary(),
+            "bids": {
+                "identical": self.identical,
+                "identical_rate": round(self.identical / n, 4) if n else 0.0,
+                "set_changed": self.set_changed,
+                "top_changed": self.top_changed,
+                "price_changed": self.price_changed,
+                "advertisers_added": self.added,
+                "advertisers_removed": self.removed,
+                "mean_jaccard": round(self.jaccard_sum / n, 4) if n else 0.0,
+                "abs_price_delta_total": self.abs_price_delta_sum,
+            },
+        }
+
+
+async def replay(
+    main: Any,
+    since: datetime,
+    until: datetime,
+    *,
+    concurrency: int = 8,
+    match_window: float = 5.0,
+    limit: int = 0,
+    report: Optional[ReplayReport] = None,
+) -> ReplayReport:
+    """
+    since <= created_at < until 의 경매를 concurrency 개 워커로 다시 실행합니다.
+    스트림은 별도 태스크(별도 연결)에서 읽고, 큐 크기를 concurrency * 2 로 제한합니다.
+    """
+    report = report or ReplayReport()
+    queue: "asyncio.Queue[Optional[LoggedAuction]]" = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def produce() -> None:
+        produced = 0
+        try:
+            rows = main.database.iterate(
+                REPLAY_LOGS_SQL,
+                {"since": since, "until": until, "match_window": match_window},
+            )
+            async for logged in _agroup(rows):
+                await queue.put(logged)
+                produced += 1
+                if limit and produced >= limit:
+                    break
+        finally:
+            for _ in range(concurrency):
+                await queue.put(None)
+
+    async def work() -> None:
+        while True:
+            logged = await queue.get()
+            if logged is None:
+                return
+            started = time.perf_counter()
+            try:
+                bids = await main.generate_real_advertiser_bids(
+                    logged.search_query, logged.quality_score
+                )
+            except Exception as e:
+                report.add_error()
+                print(f"replay_error query={logged.search_query!r}: {e}", file=sys.stderr)
+                continue
+            seconds = time.perf_counter() - started
+            replayed = {b.advertiserId: b.price for b in bids if b.advertiserId}
+            report.add(logged, diff_bids(logged.bids, replayed), seconds)
+
+    await asyncio.gather(produce(), *(work() for _ in range(concurrency)))
+    return report
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--since", required=True, type=datetime.fromisoformat, help="UTC (tz 없음)")
+    parser.add_argument("--until", required=True, type=datetime.fromisoformat, help="UTC (tz 없음)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=0, help="최대 경매 수 (0: 제한 없음)")
+    parser.add_argument(
+        "--match-window", type=float, default=5.0, help="로그 ↔ 경매 대응 허용 시각 차이(초)"
+    )
+    parser.add_argument("--latency-samples", type=int, default=10000)
+    parser.add_argument("--output", default="", help="요약 JSON 경로 (없으면 stdout)")
+    parser.add_argument("--diffs", default="", help="달라진 경매별 상세를 기록할 JSONL 경로")
+    parser.add_argument("--database-url", default=os.getenv("REPLAY_DATABASE_URL", ""))
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> int:
+    if args.database_url:
+        # main 은 import 시점에 DATABASE_URL 로 연결 객체를 만듦
+        os.environ["DATABASE_URL"] = args.database_url
+    from .. import main
+
+    diffs_file = open(args.diffs, "w", encoding="utf-8") if args.diffs else None
+    await main.connect_to_database()
+    started = time.perf_counter()
+    try:
+        report = await replay(
+            main,
+            args.since,
+            args.until,
+            concurrency=args.concurrency,
+            match_window=args.match_window,
+            limit=args.limit,
+            report=ReplayReport(diffs_file, args.latency_samples),
+        )
+    finally:
+        await main.disconnect_from_database()
+        if diffs_file is not None:
+            diffs_file.close()
+
+    result = {
+        "since": args.since.isoformat(),
+        "until": args.until.isoformat(),
+        "concurrency": args.concurrency,
+        "wall_seconds": round(time.perf_counter() - started, 3),
+        **report.summary(),
+    }
+    payload = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+    return 0
+
+
+def cli(argv: Optional[List[str]] = None) -> int:
+    return asyncio.run(run(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,198 @@
+"""
+벤치마크용 합성 데이터 (광고주 / 키워드 / 카테고리 / 자동입찰 설정 / 심사)
+
+같은 (scale, seed) 면 항상 같은 데이터와 검색어를 생성합니다.
+합성 행은 username 'bench_' 접두사와 카테고리 경로 '벤치>' 접두사로 구분하며,
+cleanup() 은 이 행들과 벤치 실행 중 생성된 경매/입찰만 지웁니다.
+"""
+
+import random
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple
+
+BENCH_USER_PREFIX = "bench_"
+BENCH_CATEGORY_ROOT = "벤치"
+KEYWORDS_PER_ADVERTISER = 20
+
+KOREAN_WORDS = [
+    "제주도", "항공권", "호텔", "렌터카", "맛집", "카페", "노트북", "스마트폰", "이어폰",
+    "운동화", "원피스", "화장품", "선크림", "캠핑", "텐트", "자전거", "골프", "필라테스",
+    "영어회화", "코딩", "부동산", "인테리어", "이사", "청소", "세탁", "꽃배달", "반려견",
+    "사료", "유모차", "장난감", "보험", "대출", "적금", "여행", "패키지", "숙소", "펜션",
+    "중고차", "타이어", "치과", "피부과", "한의원", "헬스장", "도시락", "커피", "와인",
+]
+ENGLISH_WORDS = [
+    "fast", "api", "cloud", "laptop", "phone", "travel", "hotel", "flight", "coffee",
+    "yoga", "fitness", "camera", "gaming", "design", "marketing", "seo", "crm", "saas",
+    "python", "react", "shoes", "bag", "watch", "kids", "pet", "insurance", "loan",
+]
+MODIFIERS = ["추천", "할인", "가격", "후기", "예약", "최저가", "best", "cheap", "2024", "online"]
+CATEGORY_TOPS = [
+    "여행", "쇼핑", "IT", "교육", "금융", "건강", "생활", "자동차", "반려동물", "음식",
+]
+MATCH_TYPE_WEIGHTS = (("exact", 2), ("phrase", 3), ("broad", 5))
+
+
+@dataclass
+class Dataset:
+    scale: int
+    seed: int
+    advertisers: List[Dict[str, Any]] = field(default_factory=list)
+    # (광고주 순번, keyword, priority, match_type)
+    keywords: List[Tuple[int, str, int, str]] = field(default_factory=list)
+    # (name, path, level)
+    categories: List[Tuple[str, str, int]] = field(default_factory=list)
+    # (광고주 순번, category_path, level, is_primary)
+    advertiser_categories: List[Tuple[int, str, int, bool]] = field(default_factory=list)
+
+
+def _keyword(rng: random.Random) -> str:
+    words = KOREAN_WORDS if rng.random() < 0.7 else ENGLISH_WORDS
+    parts = rng.sample(words, rng.choice((1, 1, 2, 2, 3)))
+    if rng.random() < 0.4:
+        parts.append(rng.choice(MODIFIERS))
+    return " ".join(parts)
+
+
+def generate_dataset(scale: int, seed: int = 42) -> Dataset:
+    """키워드 scale 개 규모의 합성 데이터 (광고주당 키워드 KEYWORDS_PER_ADVERTISER 개)"""
+    rng = random.Random(f"{seed}:{scale}")
+    data = Dataset(scale=scale, seed=seed)
+
+    subs_by_top: Dict[str, List[str]] = {}
+    for top in CATEGORY_TOPS:
+        top_path = f"{BENCH_CATEGORY_ROOT}>{top}"
+        data.categories.append((top, top_path, 1))
+        subs = rng.sample(KOREAN_WORDS, 8)
+        subs_by_top[top] = [f"{top_path}>{s}" for s in subs]
+        data.categories.extend((s, f"{top_path}>{s}", 2) for s in subs)
+
+    advertiser_count = max(1, scale // KEYWORDS_PER_ADVERTISER)
+    types, weights = zip(*MATCH_TYPE_WEIGHTS)
+    for i in range(advertiser_count):
+        data.advertisers.append(
+            {
+                "username": f"{BENCH_USER_PREFIX}{seed}_{i}",
+                "company_name": f"벤치광고주 {i}",
+                "website_url": f"https://bench{i}.example.com",
+                "daily_budget": 10_000_000,
+                "max_bid_per_keyword": rng.randint(500, 5000),
+                "min_quality_score": rng.randint(30, 80),
+                "is_enabled": rng.random() < 0.9,
+            }
+        )
+        top = rng.choice(CATEGORY_TOPS)
+        for j, path in enumerate(rng.sample(subs_by_top[top], rng.randint(1, 3))):
+            data.advertiser_categories.append((i, path, 2, j == 0))
+
+    for n in range(scale):
+        data.keywords.append(
+            (
+                n % advertiser_count,
+                _keyword(rng),
+                rng.randint(1, 5),
+                rng.choices(types, weights)[0],
+            )
+        )
+    return data
+
+
+def sample_queries(data: Dataset, count: int) -> List[str]:
+    """키워드 기반 70%, 카테고리 이름 20%, 매칭 없는 검색어 10%"""
+    rng = random.Random(f"{data.seed}:{data.scale}:queries")
+    queries = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.7:
+            keyword = rng.choice(data.keywords)[1]
+            if rng.random() < 0.5:
+                keyword = f"{keyword} {rng.choice(MODIFIERS)}"
+            queries.append(keyword)
+        elif roll < 0.9:
+            queries.append(f"{rng.choice(data.categories)[0]} {rng.choice(MODIFIERS)}")
+        else:
+            queries.append(f"zq{rng.randint(0, 10**6)} 없는검색어")
+    return queries
+
+
+async def cleanup(conn: Any, auction_id_mark: int = 0) -> None:
+    """
+    합성 데이터 삭제 (광고주 하위 테이블은 ON DELETE CASCADE)
+    auction_id_mark 보다 큰 경매와 그 입찰도 지웁니다 (벤치 실행 전 max(id) 를 넘겨줌).
+    """
+    bench_ids = "SELECT id FROM advertisers WHERE username LIKE 'bench\\_%'"
+    await conn.execute(
+        f"DELETE FROM bids WHERE advertiser_id IN ({bench_ids}) OR auction_id > $1",
+        auction_id_mark,
+    )
+    await conn.execute("DELETE FROM auctions WHERE id > $1", auction_id_mark)
+    await conn.execute(f"DELETE FROM advertisers WHERE id IN ({bench_ids})")
+    await conn.execute(
+        "DELETE FROM business_categories WHERE path LIKE $1",
+        f"{BENCH_CATEGORY_ROOT}>%",
+    )
+
+
+async def seed(conn: Any, data: Dataset) -> None:
+    """asyncpg 연결에 합성 데이터를 COPY 로 적재합니다 (기존 합성 데이터는 호출 전에 cleanup)."""
+    async with conn.transaction():
+        await conn.copy_records_to_table(
+            "advertisers",
+            columns=["username", "email", "hashed_password", "company_name", "website_url", "daily_budget"],
+            records=[
+                (
+                    a["username"],
+                    f"{a['username']}@bench.invalid",
+                    "!",
+                    a["company_name"],
+                    a["website_url"],
+                    Decimal(a["daily_budget"]),
+                )
+                for a in data.advertisers
+            ],
+        )
+        rows = await conn.fetch(
+            "SELECT id, username FROM advertisers WHERE username LIKE 'bench\\_%'"
+        )
+        id_by_username = {r["username"]: r["id"] for r in rows}
+        ids = [id_by_username[a["username"]] for a in data.advertisers]
+
+        await conn.copy_records_to_table(
+            "auto_bid_settings",
+            columns=["advertiser_id", "is_enabled", "daily_budget", "max_bid_per_keyword", "min_quality_score"],
+            records=[
+                (
+                    ids[i],
+                    a["is_enabled"],
+                    Decimal(a["daily_budget"]),
+                    a["max_bid_per_keyword"],
+                    a["min_quality_score"],
+                )
+                for i, a in enumerate(data.advertisers)
+            ],
+        )
+        await conn.copy_records_to_table(
+            "advertiser_reviews",
+            columns=["advertiser_id", "review_status", "recommended_bid_min", "recommended_bid_max"],
+            records=[(adv_id, "approved", 100, 5000) for adv_id in ids],
+        )
+        await conn.copy_records_to_table(
+            "advertiser_keywords",
+            columns=["advertiser_id", "keyword", "priority", "match_type"],
+            records=[(ids[i], kw, p, mt) for i, kw, p, mt in data.keywords],
+        )
+        await conn.copy_records_to_table(
+            "business_categories",
+            columns=["name", "path", "level", "is_active"],
+            records=[(name, path, level, True) for name, path, level in data.categories],
+        )
+        await conn.copy_records_to_table(
+            "advertiser_categories",
+            columns=["advertiser_id", "category_path", "category_level", "is_primary"],
+            records=[(ids[i], path, level, primary) for i, path, level, primary in data.advertiser_categories],
+        )
+    await conn.execute(
+        "ANALYZE advertisers, auto_bid_settings, advertiser_reviews, "
+        "advertiser_keywords, business_categories, advertiser_categories"
+    )
@@ -1,8 +1,9 @@
 from fastapi import FastAPI, HTTPException, Depends, status, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
-from typing import Any, Dict, List, Literal, Optional, Sequence
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 
 
@@ -14,28 +15,180 @@ def _utc_naive(dt: datetime | None = None) -> datetime:
 
 
 from contextlib import asynccontextmanager
+from functools import lru_cache
 import random
 import asyncio
 from decimal import Decimal
 import os
 import json
-import re
 import jwt
 from jwt import PyJWTError
 import structlog
 import time
 from urllib.parse import urlparse
-from collections import defaultdict
 
 # HMAC 서명 import (패키지/스크립트 실행 모두 대응)
 try:
-    from utils.sign import sign_click  # type: ignore
+    from utils.sign import sign_click, sign_clicks  # type: ignore
 except ImportError:  # pragma: no cover
-    from services.auction_service.utils.sign import sign_click  # type: ignore
+    from services.auction_service.utils.sign import (  # type: ignore
+        sign_click,
+        sign_clicks,
+    )
+
+# 인메모리 키워드 매칭 인덱스 import (패키지/스크립트 실행 모두 대응)
+try:
+    from utils.matching_index import (  # type: ignore
+        AutoBidSettingsCache,
+        KeywordMatchIndex,
+        build_like_terms,
+        like_pattern,
+    )
+    from utils.category_trie import CategoryMatchIndex  # type: ignore
+    from utils.change_events import MatchingChangeListener  # type: ignore
+    from utils.index_snapshot import IndexSnapshot, write_snapshot  # type: ignore
+    from utils.prepared import PreparedStatementRegistry  # type: ignore
+    from utils.match_cache import MatchResultCache, normalize_score  # type: ignore
+    from utils.budget_ledger import BudgetLedger  # type: ignore
+    from utils.auction_sweeper import AuctionExpirySweeper  # type: ignore
+    from utils.auction_status import (  # type: ignore
+        TERMINAL_STATUSES,
+        AuctionStatusBroker,
+        AuctionStatusListener,
+        status_payload,
+    )
+    from utils.batch_writer import BatchWriter  # type: ignore
+    from utils.profile_cache import AdvertiserProfileCache  # type: ignore
+    from utils.rate_limit import (  # type: ignore
+        PostgresRateLimiter,
+        SlidingWindowRateLimiter,
+    )
+    from utils.metrics import StageMetrics, render_counter  # type: ignore
+    from utils.json_response import FastJSONResponse, json_backend  # type: ignore
+except ImportError:  # pragma: no cover
+    from services.auction_service.utils.matching_index import (  # type: ignore
+        AutoBidSettingsCache,
+        KeywordMatchIndex,
+        build_like_terms,
+        like_pattern,
+    )
+    from services.auction_service.utils.category_trie import (  # type: ignore
+        CategoryMatchIndex,
+    )
+    from services.auction_service.utils.change_events import (  # type: ignore
+        MatchingChangeListener,
+    )
+    from services.auction_service.utils.index_snapshot import (  # type: ignore
+        IndexSnapshot,
+        write_snapshot,
+    )
+    from services.auction_service.utils.prepared import (  # type: ignore
+        PreparedStatementRegistry,
+    )
+    from services.auction_service.utils.match_cache import (  # type: ignore
+        MatchResultCache,
+        normalize_score,
+    )
+    from services.auction_service.utils.budget_ledger import (  # type: ignore
+        BudgetLedger,
+    )
+    from services.auction_service.utils.auction_sweeper import (  # type: ignore
+        AuctionExpirySweeper,
+    )
+    from services.auction_service.utils.auction_status import (  # type: ignore
+        TERMINAL_STATUSES,
+        AuctionStatusBroker,
+        AuctionStatusListener,
+        status_payload,
+    )
+    from services.auction_service.utils.batch_writer import (  # type: ignore
+        BatchWriter,
+    )
+    from services.auction_service.utils.profile_cache import (  # type: ignore
+        AdvertiserProfileCache,
+    )
+    from services.auction_service.utils.rate_limit import (  # type: ignore
+        PostgresRateLimiter,
+        SlidingWindowRateLimiter,
+    )
+    from services.auction_service.utils.metrics import (  # type: ignore
+        StageMetrics,
+        render_counter,
+    )
+    from services.auction_service.utils.json_response import (  # type: ignore
+        FastJSONResponse,
+        json_backend,
+    )
 
 REDIRECT_BASE_URL = os.getenv("REDIRECT_BASE_URL", "http://api-gateway:8000")
 PLATFORM_ADVERTISER_ID = int(os.getenv("PLATFORM_ADVERTISER_ID", "1"))
 
+
+def _env_flag(name: str, default: bool) -> bool:
+    """환경 변수 불리언 플래그 (1/true/yes/on)"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# 인메모리 매칭 인덱스 사용 여부 (비활성화 시 SQL 경로만 사용)
+MATCHING_INDEX_ENABLED = _env_flag("AUCTION_MATCHING_INDEX", True)
+# 광고주 데이터 변경 알림 채널 (advertiser-service / website-analysis-service 가 발행)
+MATCHING_CHANGES_CHANNEL = os.getenv(
+    "MATCHING_CHANGES_CHANNEL", "auction_matching_changes"
+)
+# 키워드 인덱스 스냅샷 파일 경로 (같은 호스트 워커들이 mmap 으로 공유, 비우면 매번 DB 에서 구축)
+INDEX_SNAPSHOT_PATH = os.getenv("AUCTION_INDEX_SNAPSHOT_PATH", "").strip()
+# 검색어 단위 매칭 결과 캐시 (TTL 0 이면 비활성화)
+MATCH_CACHE_TTL = float(os.getenv("AUCTION_MATCH_CACHE_TTL", "60"))
+MATCH_CACHE_SIZE = int(os.getenv("AUCTION_MATCH_CACHE_SIZE", "10000"))
+MATCH_CACHE_DB_TTL = float(os.getenv("AUCTION_MATCH_CACHE_DB_TTL", "300"))
+# build_tokens 결과 LRU 캐시 크기 (검색어 단위)
+TOKEN_CACHE_SIZE = int(os.getenv("AUCTION_TOKEN_CACHE_SIZE", "4096"))
+# 입찰가 계산용 광고주 프로필 캐시 (TTL 0 이면 비활성화, 변경 이벤트로 광고주 단위 무효화)
+PROFILE_CACHE_TTL = float(os.getenv("AUCTION_PROFILE_CACHE_TTL", "60"))
+PROFILE_CACHE_SIZE = int(os.getenv("AUCTION_PROFILE_CACHE_SIZE", "50000"))
+# 예산 페이싱 모드 (워커별 예산 리스 + 주기 반영). 모든 경매 워커에 동일하게 설정해야 함
+BUDGET_LEDGER_ENABLED = _env_flag("AUCTION_BUDGET_LEDGER", False)
+BUDGET_LEASE_FRACTION = float(os.getenv("AUCTION_BUDGET_LEASE_FRACTION", "0.1"))
+BUDGET_FLUSH_INTERVAL = float(os.getenv("AUCTION_BUDGET_FLUSH_INTERVAL", "1.0"))
+BUDGET_LEASE_TTL = float(os.getenv("AUCTION_BUDGET_LEASE_TTL", "30"))
+# 만료 경매 정리 주기(초, 0 이면 비활성화)와 한 문장/한 주기에 처리할 양
+EXPIRY_SWEEP_INTERVAL = float(os.getenv("AUCTION_EXPIRY_SWEEP_INTERVAL", "30"))
+EXPIRY_SWEEP_BATCH_SIZE = int(os.getenv("AUCTION_EXPIRY_SWEEP_BATCH_SIZE", "500"))
+EXPIRY_SWEEP_MAX_BATCHES = int(os.getenv("AUCTION_EXPIRY_SWEEP_MAX_BATCHES", "20"))
+# 경매 상태 푸시 (SSE / long-poll). 워커 간 변경 전달용 NOTIFY 채널
+AUCTION_STATUS_CHANNEL = os.getenv("AUCTION_STATUS_CHANNEL", "auction_status_changes")
+AUCTION_STATUS_LISTENER_ENABLED = _env_flag("AUCTION_STATUS_LISTENER", True)
+# long-poll 최대 대기(초). 게이트웨이 read 타임아웃(15초)보다 짧아야 함
+STATUS_LONG_POLL_TIMEOUT = float(os.getenv("AUCTION_STATUS_LONG_POLL_TIMEOUT", "10"))
+# SSE keep-alive 주석 전송 주기(초). 이때 DB 상태도 다시 확인
+STATUS_STREAM_KEEPALIVE = float(os.getenv("AUCTION_STATUS_STREAM_KEEPALIVE", "15"))
+# 동시 경매들의 bid INSERT 를 모으는 시간 창 (0 이면 경매별로 즉시 저장)
+BID_BATCH_WINDOW_MS = float(os.getenv("AUCTION_BID_BATCH_WINDOW_MS", "0"))
+BID_BATCH_MAX_ROWS = int(os.getenv("AUCTION_BID_BATCH_MAX_ROWS", "500"))
+# auto_bid_logs write-behind 큐. 기본(ENQUEUE_TIMEOUT_MS=0)은 가득 차면 기다리지 않고 로그를 버림
+# (/metrics 의 auction_batch_writer_dropped_rows_total). 0 보다 크게 주면 그 시간만큼 경매 응답이
+# 로그 기록 속도에 묶이는 대신 버리는 로그가 줄어듦
+AUTO_BID_LOG_QUEUE_SIZE = int(os.getenv("AUCTION_AUTO_BID_LOG_QUEUE_SIZE", "10000"))
+AUTO_BID_LOG_ENQUEUE_TIMEOUT_MS = float(
+    os.getenv("AUCTION_AUTO_BID_LOG_ENQUEUE_TIMEOUT_MS", "0")
+)
+AUTO_BID_LOG_FLUSH_MS = float(os.getenv("AUCTION_AUTO_BID_LOG_FLUSH_MS", "200"))
+AUTO_BID_LOG_BATCH_MAX_ROWS = 1000
+# /start-batch 한 번에 처리할 최대 검색어 수
+START_BATCH_MAX_ITEMS = int(os.getenv("AUCTION_START_BATCH_MAX_ITEMS", "500"))
+# /start 레이트리밋 저장소 (local: 워커별 LRU, postgres: 워커 간 공유)
+RATE_LIMIT_BACKEND = os.getenv("AUCTION_RATE_LIMIT_BACKEND", "local").strip().lower()
+RATE_LIMIT_MAX_KEYS = int(os.getenv("AUCTION_RATE_LIMIT_MAX_KEYS", "100000"))
+# 단계별 지연 시간 집계를 auction_performance_metrics 에 저장하는 주기 (0 이면 저장 안 함)
+METRICS_ROLLUP_INTERVAL = float(os.getenv("AUCTION_METRICS_ROLLUP_INTERVAL", "60"))
+# /system-status DB 집계 스냅샷 갱신 주기(초)
+SYSTEM_STATUS_REFRESH_INTERVAL = float(
+    os.getenv("AUCTION_SYSTEM_STATUS_REFRESH_INTERVAL", "30")
+)
+
 # JWT 설정
 SECRET_KEY = os.getenv(
     "JWT_SECRET_KEY", "your-super-secret-jwt-key-change-in-production"
@@ -46,10 +199,23 @@ security = HTTPBearer()
 # 구조적 로깅 설정
 logger = structlog.get_logger()
 
-# 간단한 레이트리밋 (IP + 쿼리 해시 기준)
-_rate_limit_store: Dict[str, List[float]] = defaultdict(list)
+# 경매 파이프라인 단계별 지연 시간 (/metrics, /system-status, 주기 롤업)
+stage_metrics = StageMetrics()
+
+# 레이트리밋 (IP + 쿼리 해시 기준)
 _RATE_LIMIT_WINDOW = 10  # 10초
 _RATE_LIMIT_MAX_REQUESTS = 3  # 최대 3회
+_rate_limiter = SlidingWindowRateLimiter(
+    _RATE_LIMIT_WINDOW, _RATE_LIMIT_MAX_REQUESTS, max_keys=RATE_LIMIT_MAX_KEYS
+)
+# postgres: 모든 워커가 auction_rate_limits 테이블로 한도를 공유 (DB 오류 시 로컬 리미터 사용)
+_shared_rate_limiter: Optional[PostgresRateLimiter] = (
+    PostgresRateLimiter(
+        _RATE_LIMIT_WINDOW, _RATE_LIMIT_MAX_REQUESTS, fallback=_rate_limiter
+    )
+    if RATE_LIMIT_BACKEND == "postgres"
+    else None
+)
 
 
 async def check_rate_limit(client_ip: str, query: str) -> bool:
@@ -59,21 +225,9 @@ async def check_rate_limit(client_ip: str, query: str) -> bool:
     query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
     key = f"{client_ip}:{query_hash}"
 
-    now = time.time()
-    # 오래된 요청 제거
-    _rate_limit_store[key] = [
-        req_time
-        for req_time in _rate_limit_store[key]
-        if now - req_time < _RATE_LIMIT_WINDOW
-    ]
-
-    # 레이트리밋 확인
-    if len(_rate_limit_store[key]) >= _RATE_LIMIT_MAX_REQUESTS:
-        return False
-
-    # 요청 시간 기록
-    _rate_limit_store[key].append(now)
-    return True
+    if _shared_rate_limiter is not None:
+        return await _shared_rate_limiter.allow(database, key)
+    return _rate_limiter.allow(key)
 
 
 # 최적화된 매칭 로직 import
@@ -168,17 +322,25 @@ async def get_user_id_from_token(
 
 
 def build_tokens(q: str, *, max_tokens: int = 25) -> list[str]:
-    """사용자 검색어로부터 매칭에 사용할 토큰 리스트를 생성합니다."""
+    """
+    사용자 검색어로부터 매칭에 사용할 토큰 리스트를 생성합니다.
+    (1) 정규화된 전체 쿼리 → (2) 공백 분리 토큰 → (3) 한글 3-gram → (4) 한글 2-gram 순으로
+    중복 없이 나열한 뒤 앞에서부터 max_tokens 개를 사용하므로, 같은 검색어는 항상 같은 토큰이 됩니다.
+    """
+    return list(_build_tokens_cached(q, max_tokens))
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _build_tokens_cached(q: str, max_tokens: int) -> Tuple[str, ...]:
     q_norm = _normalize(q)
-    tokens = set()
+    ranked: List[str] = []
     if q_norm:
-        tokens.add(q_norm)  # (1) 정규화된 전체 쿼리
-    tokens.update([t for t in q.lower().split() if t])  # (2) 공백 분리 토큰
-    if any(ord(c) > 127 for c in q):  # (3) 한글 2-gram 및 3-gram
-        for n in (2, 3):
-            if len(q_norm) >= n:
-                tokens.update([q_norm[i : i + n] for i in range(len(q_norm) - n + 1)])
-    return list(tokens)[:max_tokens]
+        ranked.append(q_norm)
+    ranked.extend(t for t in q.lower().split() if t)
+    if any(ord(c) > 127 for c in q):
+        for n in (3, 2):
+            ranked.extend(q_norm[i : i + n] for i in range(len(q_norm) - n + 1))
+    return tuple(dict.fromkeys(ranked))[:max_tokens]
 
 
 # Lifespan 이벤트 핸들러 정의
@@ -186,12 +348,52 @@ def build_tokens(q: str, *, max_tokens: int = 25) -> list[str]:
 async def lifespan(app: FastAPI):
     # 시작 이벤트
     await connect_to_database()
+    init_match_cache()
+    init_profile_cache()
+    ledger = await start_budget_ledger() if BUDGET_LEDGER_ENABLED else None
+    bid_writer = await start_bid_writer() if BID_BATCH_WINDOW_MS > 0 else None
+    sweeper = await start_expiry_sweeper() if EXPIRY_SWEEP_INTERVAL > 0 else None
+    status_listener = (
+        await start_status_listener() if AUCTION_STATUS_LISTENER_ENABLED else None
+    )
+    await detect_auto_bid_logs_schema()
+    auto_bid_log_writer = await start_auto_bid_log_writer()
+    rollup_task = (
+        asyncio.create_task(_metrics_rollup_loop())
+        if METRICS_ROLLUP_INTERVAL > 0
+        else None
+    )
+    status_task = asyncio.create_task(_system_status_refresh_loop())
+    listener = await start_matching_listener()
     yield
     # 종료 이벤트
+    status_task.cancel()
+    await asyncio.gather(status_task, return_exceptions=True)
+    if listener is not None:
+        await listener.stop()
+    if rollup_task is not None:
+        rollup_task.cancel()
+        await asyncio.gather(rollup_task, return_exceptions=True)
+        await rollup_stage_metrics()
+    if sweeper is not None:
+        await sweeper.stop()
+    if status_listener is not None:
+        await status_listener.stop()
+    if bid_writer is not None:
+        await bid_writer.stop()
+    # 큐에 남은 자동 입찰 로그를 DB 연결 해제 전에 기록
+    await auto_bid_log_writer.stop()
+    if ledger is not None:
+        await ledger.stop()
     await disconnect_from_database()
 
 
-app = FastAPI(title="Auction Service", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="Auction Service",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 
 # CORS 설정 (보안 강화)
@@ -244,6 +446,16 @@ class StartAuctionResponse(BaseModel):
     message: str
 
 
+class StartBatchRequest(BaseModel):
+    items: List[StartAuctionRequest]
+
+
+class StartBatchResponse(BaseModel):
+    success: bool
+    data: List[AuctionResponse]
+    message: str
+
+
 class SelectBidRequest(BaseModel):
     searchId: str
     selectedBidId: str
@@ -313,40 +525,6 @@ SCORES = {"exact": 1.0, "phrase": 0.85, "broad": 0.7}
 SCORE_CAP = 3.0  # 최대 점수 상한
 
 
-def _make_in_clause(
-    column_expr: str, values: Sequence[Any], prefix: str
-) -> tuple[str, dict]:
-    """
-    IN (:p0, :p1, ...) 동적 생성
-    """
-    params: Dict[str, Any] = {}
-    parts: list[str] = []
-    for i, v in enumerate(values):
-        key = f"{prefix}{i}"
-        parts.append(f":{key}")
-        params[key] = v
-    if not parts:
-        return "FALSE", {}
-    return f"{column_expr} IN (" + ", ".join(parts) + ")", params
-
-
-def _make_like_clause(
-    column_expr: str, tokens_like: list[str], prefix: str
-) -> tuple[str, dict]:
-    """
-    (column LIKE :kw0 OR column LIKE :kw1 ...) 동적 생성
-    """
-    parts = []
-    params = {}
-    for i, tok in enumerate(tokens_like):
-        key = f"{prefix}{i}"
-        parts.append(f"{column_expr} LIKE :{key}")
-        params[key] = tok
-    if not parts:
-        return "FALSE", {}
-    return "(" + " OR ".join(parts) + ")", params
-
-
 def _ensure_aggregator(agg: dict, adv_id: int):
     if adv_id not in agg:
         agg[adv_id] = {"score": 0.0, "reasons": [], "seen_keys": set()}
@@ -367,20 +545,321 @@ def _add_keyword_score(
     agg[adv_id]["reasons"].append(f"KW_{match_type.upper()}:{keyword}")
 
 
-async def find_matching_advertisers(
-    search_query: str, quality_score: int
-) -> List[Dict[str, Any]]:
+def _add_category_score(agg: dict, adv_id: int, category_path: str, is_primary: bool):
+    _ensure_aggregator(agg, adv_id)
+    cat_score = 0.6 * (1.2 if is_primary else 1.0)
+    seen_key = f"CAT:{category_path}"
+    if seen_key in agg[adv_id]["seen_keys"]:
+        return
+    agg[adv_id]["score"] = min(agg[adv_id]["score"] + cat_score, SCORE_CAP)
+    agg[adv_id]["seen_keys"].add(seen_key)
+    agg[adv_id]["reasons"].append(seen_key)
+
+
+# === In-memory keyword matching index ===
+# 시작 시 advertiser_keywords / advertiser_categories / auto_bid_settings 전체로 구축되며,
+# 이후에는 LISTEN/NOTIFY 변경 이벤트로 광고주 단위 갱신. 준비되지 않았으면 None (SQL 경로 사용)
+_matching_index: Optional[KeywordMatchIndex] = None
+_category_index: Optional[CategoryMatchIndex] = None
+_settings_cache: Optional[AutoBidSettingsCache] = None
+
+_KEYWORD_ROWS_SQL = """
+    SELECT advertiser_id, keyword, priority, match_type
+    FROM advertiser_keywords
+"""
+# 스냅샷이 현재 advertiser_keywords 와 같은지 판단하는 지문 (행 전송 없이 DB 안에서 계산)
+# 테이블을 훑어 해시하지 않는 가벼운 지문. advertiser-service 는 키워드를 DELETE 후 INSERT 로
+# 바꾸므로 count(*) 와 max(id)(SERIAL) 로 추가·삭제·교체가 드러나고, 직접 UPDATE 는
+# max(updated_at) 으로 잡습니다. (updated_at 을 건드리지 않는 수동 UPDATE 는 감지하지 못함)
+_KEYWORD_FINGERPRINT_SQL = """
+    SELECT count(*) AS row_count, max(id) AS max_id, max(updated_at) AS max_updated_at
+    FROM advertiser_keywords
+"""
+_ACTIVE_CATEGORIES_SQL = """
+    SELECT name, path
+    FROM business_categories
+    WHERE is_active = true
+"""
+_ADVERTISER_CATEGORY_ROWS_SQL = """
+    SELECT advertiser_id, category_path, is_primary
+    FROM advertiser_categories
+"""
+_ENABLED_SETTINGS_SQL = """
+    SELECT advertiser_id, min_quality_score
+    FROM auto_bid_settings
+    WHERE is_enabled = true
+"""
+
+
+async def _build_keyword_index() -> Tuple[KeywordMatchIndex, str]:
     """
-    주어진 검색 쿼리에 대한 광고주 매칭(배치 쿼리, N+1 제거)
+    키워드 인덱스를 구축하고 (index, source) 를 반환합니다.
+    스냅샷 지문이 현재 DB 와 같으면 스냅샷에서, 아니면 DB 에서 구축한 뒤 스냅샷을 새로 씁니다.
+    스냅샷은 advertiser_keywords 전체 행 전송만 줄여 줄 뿐, 인덱스는 워커마다 따로 만듭니다.
+    (지문을 행 조회보다 먼저 계산하므로, 그 사이 변경이 있으면 다음 시작 때 다시 구축될 뿐입니다)
+    """
+    if not INDEX_SNAPSHOT_PATH:
+        rows = await database.fetch_all(_KEYWORD_ROWS_SQL + " ORDER BY id")
+        return KeywordMatchIndex.from_rows(rows), "database"
+
+    row = await database.fetch_one(_KEYWORD_FINGERPRINT_SQL)
+    fingerprint = f"{row['row_count']}:{row['max_id']}:{row['max_updated_at']}"
+    snapshot = IndexSnapshot.open(INDEX_SNAPSHOT_PATH)
+    if snapshot is not None:
+        with snapshot:
+            if snapshot.fingerprint == fingerprint:
+                return KeywordMatchIndex.from_rows(snapshot.rows()), "snapshot"
+
+    rows = await database.fetch_all(_KEYWORD_ROWS_SQL + " ORDER BY id")
+    index = KeywordMatchIndex.from_rows(rows)
+    try:
+        await asyncio.to_thread(write_snapshot, INDEX_SNAPSHOT_PATH, rows, fingerprint)
+    except OSError as e:
+        logger.warning(
+            "matching_index_snapshot_write_failed",
+            service="auction-service",
+            path=INDEX_SNAPSHOT_PATH,
+            error=str(e),
+        )
+    return index, "database"
+
+
+async def load_matching_index() -> Optional[KeywordMatchIndex]:
+    """
+    advertiser_keywords / advertiser_categories / auto_bid_settings 전체를 읽어
+    인메모리 매칭 데이터를 (재)구축합니다.
+    business_categories 는 광고주 단위 변경 이벤트가 없으므로 이 전체 적재 때만 반영됩니다.
+    """
+    global _matching_index, _category_index, _settings_cache
+    log = logger.bind(service="auction-service")
+    started = time.perf_counter()
+    try:
+        index, source = await _build_keyword_index()
+        category_index = CategoryMatchIndex.from_rows(
+            await database.fetch_all(_ACTIVE_CATEGORIES_SQL),
+            await database.fetch_all(_ADVERTISER_CATEGORY_ROWS_SQL + " ORDER BY id"),
+        )
+        settings_rows = await database.fetch_all(_ENABLED_SETTINGS_SQL)
+        settings_cache = AutoBidSettingsCache.from_rows(settings_rows)
+    except Exception as e:
+        log.error("matching_index_load_failed", error=str(e), exc_info=True)
+        return None
+
+    _matching_index = index
+    _category_index = category_index
+    _settings_cache = settings_cache
+    log.info(
+        "matching_index_loaded",
+        source=source,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+        settings=len(settings_cache),
+        **index.stats(),
+        **category_index.stats(),
+    )
+    return index
+
+
+async def start_matching_listener() -> Optional[MatchingChangeListener]:
+    """
+    인메모리 인덱스, 매칭 결과 캐시, 프로필 캐시 중 하나라도 켜져 있으면 변경 이벤트를 LISTEN 합니다.
+    (인덱스를 끈 경우에도 캐시는 이벤트로 무효화해야 TTL 동안 이전 광고주/설정을 쓰지 않음)
+    인덱스 적재는 AUCTION_MATCHING_INDEX 가 켜져 있을 때만 합니다.
+    """
+    if not (MATCHING_INDEX_ENABLED or _match_cache is not None or _profile_cache is not None):
+        return None
+    # LISTEN 을 먼저 시작해야 전체 적재 도중 발생한 변경도 놓치지 않음
+    listener = MatchingChangeListener(
+        str(database.url),
+        MATCHING_CHANGES_CHANNEL,
+        on_changes=apply_matching_changes,
+        on_resync=resync_matching_data,
+    )
+    await listener.start()
+    if MATCHING_INDEX_ENABLED:
+        await load_matching_index()
+    listener.mark_ready()
+    return listener
+
+
+async def resync_matching_data() -> None:
+    """변경 이벤트 유실 가능 시(재연결) 매칭 결과/프로필 캐시를 비우고 전체 재적재합니다."""
+    if _match_cache is not None:
+        await _match_cache.invalidate(database)
+    if _profile_cache is not None:
+        _profile_cache.invalidate()
+    if MATCHING_INDEX_ENABLED:
+        await load_matching_index()
+
+
+async def apply_matching_changes(changes: Dict[int, set]) -> None:
+    """
+    변경 이벤트({advertiser_id: {kinds}})를 인메모리 매칭 데이터에 광고주 단위로 반영합니다.
     """
-    raw_tokens = build_tokens(search_query)
+    index, category_index, settings_cache = (
+        _matching_index,
+        _category_index,
+        _settings_cache,
+    )
+    keyword_ids = [a for a, kinds in changes.items() if "keywords" in kinds]
+    category_ids = [a for a, kinds in changes.items() if "categories" in kinds]
+    settings_ids = [a for a, kinds in changes.items() if "settings" in kinds]
+    profile_ids = [a for a, kinds in changes.items() if kinds & {"settings", "profile"}]
+
+    if index is not None and keyword_ids:
+        rows = await database.fetch_all(
+            _KEYWORD_ROWS_SQL + " WHERE advertiser_id = ANY(:ids) ORDER BY id",
+            {"ids": keyword_ids},
+        )
+        index.replace_advertisers(keyword_ids, rows)
+
+    if category_index is not None and category_ids:
+        rows = await database.fetch_all(
+            _ADVERTISER_CATEGORY_ROWS_SQL + " WHERE advertiser_id = ANY(:ids) ORDER BY id",
+            {"ids": category_ids},
+        )
+        category_index.replace_advertisers(category_ids, rows)
+
+    if settings_cache is not None and settings_ids:
+        rows = await database.fetch_all(
+            _ENABLED_SETTINGS_SQL + " AND advertiser_id = ANY(:ids)",
+            {"ids": settings_ids},
+        )
+        settings_cache.replace_advertisers(settings_ids, rows)
+
+    # 프로필은 다음 경매에서 필요할 때 다시 조회
+    if _profile_cache is not None and profile_ids:
+        _profile_cache.invalidate(profile_ids)
+
+    # 키워드/카테고리가 바뀌면 어떤 검색어 결과가 달라질지 알 수 없으므로 전체 무효화.
+    # 캐시되는 매칭 결과는 is_enabled 인 광고주만 포함하므로(MATCHING_SQL 등) 설정 변경도 무효화
+    # (min_quality_score 는 조회 시 다시 적용하지만 자동 입찰 on/off 는 결과 집합 자체를 바꿈)
+    if _match_cache is not None and any(
+        kinds & {"keywords", "categories", "settings"} for kinds in changes.values()
+    ):
+        await _match_cache.invalidate(database)
+
+    logger.info(
+        "matching_changes_applied",
+        service="auction-service",
+        advertisers=len(changes),
+        keywords=len(keyword_ids),
+        categories=len(category_ids),
+        settings=len(settings_ids),
+        profiles=len(profile_ids),
+    )
+
+
+# === Match result cache ===
+# lifespan 에서 생성되며, 생성 전(또는 비활성화 시)에는 None
+_match_cache: Optional[MatchResultCache] = None
+
+
+def init_match_cache() -> Optional[MatchResultCache]:
+    global _match_cache
+    if MATCH_CACHE_TTL > 0:
+        _match_cache = MatchResultCache(
+            ttl_seconds=MATCH_CACHE_TTL,
+            max_entries=MATCH_CACHE_SIZE,
+            db_ttl_seconds=MATCH_CACHE_DB_TTL,
+        )
+    return _match_cache
+
+
+# === Advertiser profile cache ===
+# lifespan 에서 생성되며, 생성 전(또는 비활성화 시)에는 None (매 경매 ADVERTISER_DETAILS_SQL 조회)
+_profile_cache: Optional[AdvertiserProfileCache] = None
+
+
+def init_profile_cache() -> Optional[AdvertiserProfileCache]:
+    global _profile_cache
+    if PROFILE_CACHE_TTL > 0:
+        _profile_cache = AdvertiserProfileCache(
+            ttl_seconds=PROFILE_CACHE_TTL, max_entries=PROFILE_CACHE_SIZE
+        )
+    return _profile_cache
+
+
+# === Prepared statements ===
+# 핫 패스의 고정 SQL 은 연결별로 한 번만 PREPARE 하여 재사용 (적중률은 /system-status)
+_prepared_statements = PreparedStatementRegistry()
+
+
+async def _fetch_all_prepared(query: str, values: Dict[str, Any]) -> list:
+    """연결되어 있으면 prepared statement 로, 아니면 database.fetch_all 로 조회합니다."""
+    if database.is_connected is not True:
+        return await database.fetch_all(query, values)
+    async with database.connection() as connection:
+        return await _prepared_statements.fetch(
+            connection.raw_connection, query, values
+        )
+
+
+# SQL 경로 단일 매칭 쿼리: EXACT / PHRASE / BROAD / 카테고리 매칭을 UNION ALL 로 묶고
+# 활성화된 auto_bid_settings 를 함께 조인하여 왕복 1회로 처리합니다.
+MATCHING_SQL = """
+    WITH matched AS (
+        SELECT 1 AS stage, id AS ord, advertiser_id, keyword, priority, match_type,
+               NULL::text AS category_path, NULL::boolean AS is_primary
+        FROM advertiser_keywords
+        WHERE match_type = 'exact'
+          AND lower(replace(keyword, ' ', '')) = ANY(CAST(:tokens_norm AS text[]))
+        UNION ALL
+        SELECT 2, id, advertiser_id, keyword, priority, match_type, NULL, NULL
+        FROM advertiser_keywords
+        WHERE match_type = 'phrase'
+          AND (lower(replace(keyword, ' ', '')) = ANY(CAST(:tokens_norm AS text[]))
+               OR lower(replace(keyword, ' ', '')) LIKE ANY(CAST(:tokens_like AS text[])))
+        UNION ALL
+        SELECT 3, id, advertiser_id, keyword, priority, match_type, NULL, NULL
+        FROM advertiser_keywords
+        WHERE match_type = 'broad'
+          AND lower(keyword) LIKE ANY(CAST(:tokens_like AS text[]))
+        UNION ALL
+        SELECT 4, ac.id, ac.advertiser_id, NULL, NULL, NULL, ac.category_path, ac.is_primary
+        FROM advertiser_categories ac
+        JOIN (
+            SELECT DISTINCT path
+            FROM business_categories
+            WHERE is_active = true
+              AND lower(name) LIKE ANY(CAST(:tokens_like AS text[]))
+        ) mc ON starts_with(ac.category_path, mc.path)
+    )
+    SELECT m.stage, m.advertiser_id, m.keyword, m.priority, m.match_type,
+           m.category_path, m.is_primary, abs.min_quality_score
+    FROM matched m
+    JOIN auto_bid_settings abs
+      ON abs.advertiser_id = m.advertiser_id AND abs.is_enabled = true
+    ORDER BY m.stage, m.ord
+"""
+
+CATEGORY_MATCH_SQL = """
+    WITH matched_categories AS (
+        SELECT DISTINCT path
+        FROM business_categories
+        WHERE is_active = true
+          AND lower(name) LIKE ANY(CAST(:tokens_like AS text[]))
+    )
+    SELECT ac.advertiser_id, ac.category_path, ac.is_primary
+    FROM advertiser_categories ac
+    JOIN matched_categories mc ON starts_with(ac.category_path, mc.path)
+"""
+
+
+def _query_terms(
+    search_query: str,
+) -> Optional[Tuple[List[str], List[str], List[str]]]:
+    """검색어의 (tokens_norm, like_terms, tokens_like). 토큰이 없으면 None"""
+    with stage_metrics.timer("build_tokens"):
+        raw_tokens = build_tokens(search_query)
     if not raw_tokens:
-        return []
+        return None
 
     tokens_norm = list(
-        set([_normalize(t) for t in raw_tokens] + [_normalize(search_query)])
+        dict.fromkeys([_normalize(t) for t in raw_tokens] + [_normalize(search_query)])
     )
-    tokens_like = list(set([f"%{t}%" for t in raw_tokens if len(t) >= 2]))
+    like_terms = build_like_terms(raw_tokens)
+    # '%', '_' 는 이스케이프하여 인메모리 인덱스와 같은 문자 그대로의 부분 문자열 비교
+    tokens_like = [like_pattern(t) for t in like_terms]
 
     log = logger.bind(service="auction-service")
     log.debug(
@@ -389,133 +868,260 @@ async def find_matching_advertisers(
         tokens_norm=tokens_norm,
         tokens_like=tokens_like,
     )
+    return tokens_norm, like_terms, tokens_like
 
+
+def _score_matches(
+    keyword_rows: List[Any], category_rows: List[Any]
+) -> List[Dict[str, Any]]:
+    """키워드/카테고리 매칭 행을 광고주별 점수와 사유로 집계"""
     aggregator: Dict[int, Dict[str, Any]] = {}
+    for r in keyword_rows:
+        _add_keyword_score(
+            aggregator,
+            r["advertiser_id"],
+            r["match_type"],
+            r["priority"],
+            r["keyword"],
+        )
+    for r in category_rows:
+        _add_category_score(
+            aggregator, r["advertiser_id"], r["category_path"], r["is_primary"]
+        )
 
-    # === EXACT (동적 IN) ===
-    exact_in, exact_params = _make_in_clause(
-        "lower(replace(keyword, ' ', ''))", tokens_norm, "ex"
-    )
-    exact_sql_dynamic = f"""
-        SELECT advertiser_id, keyword, priority, match_type
-        FROM advertiser_keywords
-        WHERE match_type = 'exact' AND {exact_in}
-    """
-    exact_rows = await database.fetch_all(exact_sql_dynamic, exact_params)
-
-    # === PHRASE (동적 IN + 동적 LIKE) ===
-    phrase_in, phrase_in_params = _make_in_clause(
-        "lower(replace(keyword, ' ', ''))", tokens_norm, "ph"
-    )
-    phrase_like, phrase_like_params = _make_like_clause(
-        "lower(replace(keyword, ' ', ''))", tokens_like, "pl"
-    )
-    # IN 또는 LIKE 중 하나만이라도 있으면 조건 생성
-    if phrase_in != "FALSE" and phrase_like != "FALSE":
-        phrase_cond = f"({phrase_in} OR {phrase_like})"
-        phrase_params = {**phrase_in_params, **phrase_like_params}
-    elif phrase_in != "FALSE":
-        phrase_cond = phrase_in
-        phrase_params = phrase_in_params
-    elif phrase_like != "FALSE":
-        phrase_cond = phrase_like
-        phrase_params = phrase_like_params
-    else:
-        phrase_cond = "FALSE"
-        phrase_params = {}
+    return [
+        {
+            "advertiser_id": adv_id,
+            # 캐시에 저장되는 값과 같은 자릿수 (적중/미스 간 입찰가 일치)
+            "match_score": normalize_score(data["score"]),
+            "reasons": data["reasons"],
+        }
+        for adv_id, data in aggregator.items()
+    ]
 
-    phrase_sql_dynamic = f"""
-        SELECT advertiser_id, keyword, priority, match_type
-        FROM advertiser_keywords
-        WHERE match_type = 'phrase' AND {phrase_cond}
-    """
-    phrase_rows = await database.fetch_all(phrase_sql_dynamic, phrase_params)
 
-    # === BROAD (동적 LIKE) ===
-    broad_like, broad_params = _make_like_clause("lower(keyword)", tokens_like, "br")
-    broad_sql_dynamic = f"""
-        SELECT advertiser_id, keyword, priority, match_type
-        FROM advertiser_keywords
-        WHERE match_type = 'broad' AND {broad_like}
+async def _compute_matches(
+    search_query: str,
+) -> tuple[List[Dict[str, Any]], Optional[Dict[int, Any]]]:
+    """
+    품질 필터 적용 전 매칭 결과와 (SQL 경로인 경우) 자동 입찰 설정 맵을 반환합니다.
+    키워드 매칭은 인메모리 인덱스가 준비되어 있으면 DB 없이 수행하고,
+    그렇지 않으면 MATCHING_SQL 단일 쿼리(왕복 1회)로 수행합니다.
     """
-    broad_rows = (
-        await database.fetch_all(broad_sql_dynamic, broad_params) if tokens_like else []
-    )
-
-    # 점수 반영
-    for rows in (exact_rows, phrase_rows, broad_rows):
-        for r in rows:
-            _add_keyword_score(
-                aggregator,
-                r["advertiser_id"],
-                r["match_type"],
-                r["priority"],
-                r["keyword"],
+    terms = _query_terms(search_query)
+    if terms is None:
+        return [], None
+    tokens_norm, like_terms, tokens_like = terms
+
+    index, category_index = _matching_index, _category_index
+    abs_map: Optional[Dict[int, Any]] = None
+    if index is not None:
+        # === EXACT / PHRASE / BROAD (인메모리) + 카테고리 (트라이, 없으면 SQL) ===
+        with stage_metrics.timer("match_keywords_index"):
+            keyword_rows = index.match(tokens_norm, like_terms)
+        category_rows = []
+        if category_index is not None:
+            with stage_metrics.timer("match_categories_index"):
+                category_rows = category_index.match(like_terms)
+        elif tokens_like:
+            with stage_metrics.timer("match_categories_sql"):
+                category_rows = await _fetch_all_prepared(
+                    CATEGORY_MATCH_SQL, {"tokens_like": tokens_like}
+                )
+    else:
+        # === SQL 경로: 키워드/카테고리/자동입찰 설정을 한 번에 조회 ===
+        with stage_metrics.timer("match_sql"):
+            rows = await _fetch_all_prepared(
+                MATCHING_SQL, {"tokens_norm": tokens_norm, "tokens_like": tokens_like}
             )
+        keyword_rows = [r for r in rows if r["stage"] != 4]
+        category_rows = [r for r in rows if r["stage"] == 4]
+        abs_map = {r["advertiser_id"]: r for r in rows}
 
-    # === 카테고리 매칭 (동적 LIKE) ===
-    if tokens_like:
-        cat_like, cat_params = _make_like_clause("lower(name)", tokens_like, "cat")
-        category_sql_dynamic = f"""
-            WITH matched_categories AS (
-                SELECT DISTINCT path
-                FROM business_categories
-                WHERE is_active = true
-                  AND {cat_like}
-            )
-            SELECT ac.advertiser_id, ac.category_path, ac.is_primary
-            FROM advertiser_categories ac
-            JOIN matched_categories mc ON ac.category_path LIKE mc.path || '%'
-        """
-        rows_cat = await database.fetch_all(category_sql_dynamic, cat_params)
-        for r in rows_cat:
-            adv_id = r["advertiser_id"]
-            _ensure_aggregator(aggregator, adv_id)
-            cat_score = 0.6 * (1.2 if r["is_primary"] else 1.0)
-            seen_key = f"CAT:{r['category_path']}"
-            if seen_key not in aggregator[adv_id]["seen_keys"]:
-                aggregator[adv_id]["score"] = min(
-                    aggregator[adv_id]["score"] + cat_score, SCORE_CAP
-                )
-                aggregator[adv_id]["seen_keys"].add(seen_key)
-                aggregator[adv_id]["reasons"].append(seen_key)
+    return _score_matches(keyword_rows, category_rows), abs_map
 
-    if not aggregator:
-        return []
 
-    # 3) 자동 입찰 설정 일괄 조회
-    advertiser_ids = list(aggregator.keys())
-    abs_in_clause, abs_params = _make_in_clause("advertiser_id", advertiser_ids, "abs")
-    abs_query = f"""
-        SELECT advertiser_id, min_quality_score
-        FROM auto_bid_settings
-        WHERE is_enabled = true AND {abs_in_clause}
-    """
-    abs_rows = await database.fetch_all(abs_query, abs_params)
-    abs_map = {r["advertiser_id"]: r for r in abs_rows}
+async def _enabled_settings(advertiser_ids: List[int]) -> Dict[int, Any]:
+    """광고주별 활성 자동 입찰 설정 (min_quality_score), 설정 캐시가 없으면 SQL 1회"""
+    settings_cache = _settings_cache
+    if settings_cache is not None:
+        return {
+            adv_id: {"min_quality_score": min_quality}
+            for adv_id in advertiser_ids
+            if (min_quality := settings_cache.get(adv_id)) is not None
+        }
+    with stage_metrics.timer("match_settings_sql"):
+        abs_rows = await _fetch_all_prepared(
+            _ENABLED_SETTINGS_SQL + " AND advertiser_id = ANY(:ids)",
+            {"ids": advertiser_ids},
+        )
+    return {r["advertiser_id"]: r for r in abs_rows}
 
-    # 4) 정책 필터링 및 정렬
+
+def _apply_quality_filter(
+    matches: List[Dict[str, Any]], abs_map: Dict[int, Any], quality_score: int
+) -> List[Dict[str, Any]]:
+    """정책 필터링 및 정렬"""
     final_advertisers = []
-    for adv_id, data in aggregator.items():
-        settings = abs_map.get(adv_id)
+    for match in matches:
+        settings = abs_map.get(match["advertiser_id"])
         if not settings:
             continue
-        match_score = data["score"]
-        passes = (match_score >= 0.8) or (
+        passes = (match["match_score"] >= 0.8) or (
             quality_score >= settings["min_quality_score"]
         )
         if passes:
-            final_advertisers.append(
-                {
-                    "advertiser_id": adv_id,
-                    "match_score": match_score,
-                    "reasons": data["reasons"],
-                }
-            )
+            final_advertisers.append(match)
 
     return sorted(final_advertisers, key=lambda x: x["match_score"], reverse=True)
 
 
+async def find_matching_advertisers(
+    search_query: str, quality_score: int
+) -> List[Dict[str, Any]]:
+    """
+    주어진 검색 쿼리에 대한 광고주 매칭(배치 쿼리, N+1 제거)
+    매칭 결과는 검색어 단위로 캐시하고, 품질 점수 필터는 매 요청 최신 설정으로 적용합니다.
+    """
+    cache = _match_cache
+    cache_key = cache.key(search_query) if cache is not None else ""
+    matches = None
+    if cache is not None:
+        with stage_metrics.timer("match_cache_lookup"):
+            matches = await cache.get(database, cache_key)
+    abs_map: Optional[Dict[int, Any]] = None
+    if matches is None:
+        generation = cache.generation if cache is not None else 0
+        matches, abs_map = await _compute_matches(search_query)
+        if cache is not None:
+            cache.put(database, cache_key, matches, generation)
+
+    if not matches:
+        return []
+
+    # 3) 자동 입찰 설정 (SQL 경로에서는 매칭 쿼리에 이미 포함)
+    if abs_map is None:
+        abs_map = await _enabled_settings([m["advertiser_id"] for m in matches])
+
+    # 4) 정책 필터링 및 정렬
+    return _apply_quality_filter(matches, abs_map, quality_score)
+
+
+# 여러 검색어의 키워드 후보를 한 번에 조회 (MATCHING_SQL 의 키워드 단계와 같은 조건)
+BATCH_KEYWORD_CANDIDATES_SQL = """
+    SELECT ak.advertiser_id, ak.keyword, ak.priority, ak.match_type
+    FROM advertiser_keywords ak
+    JOIN auto_bid_settings abs
+      ON abs.advertiser_id = ak.advertiser_id AND abs.is_enabled = true
+    WHERE (ak.match_type = 'exact'
+           AND lower(replace(ak.keyword, ' ', '')) = ANY(CAST(:tokens_norm AS text[])))
+       OR (ak.match_type = 'phrase'
+           AND (lower(replace(ak.keyword, ' ', '')) = ANY(CAST(:tokens_norm AS text[]))
+                OR lower(replace(ak.keyword, ' ', '')) LIKE ANY(CAST(:tokens_like AS text[]))))
+       OR (ak.match_type = 'broad'
+           AND lower(ak.keyword) LIKE ANY(CAST(:tokens_like AS text[])))
+    ORDER BY ak.id
+"""
+
+# 여러 검색어의 카테고리 매칭을 한 번에 조회 (어떤 LIKE 패턴으로 매칭됐는지 함께 반환)
+BATCH_CATEGORY_MATCH_SQL = """
+    SELECT t.term, ac.advertiser_id, ac.category_path, ac.is_primary
+    FROM unnest(CAST(:tokens_like AS text[])) AS t(term)
+    JOIN LATERAL (
+        SELECT DISTINCT path
+        FROM business_categories
+        WHERE is_active = true
+          AND lower(name) LIKE t.term
+    ) mc ON true
+    JOIN advertiser_categories ac ON starts_with(ac.category_path, mc.path)
+"""
+
+
+async def find_matching_advertisers_batch(
+    items: List[Tuple[str, int]],
+) -> List[List[Dict[str, Any]]]:
+    """
+    여러 (검색어, 품질 점수)의 매칭을 한 번에 수행 (결과는 items 순서)
+    캐시에 없는 검색어들의 토큰을 합쳐 키워드 후보/카테고리를 각각 한 번만 조회하고,
+    점수 계산과 품질 필터는 find_matching_advertisers 와 같은 함수를 사용합니다.
+    """
+    cache = _match_cache
+    matches_by_query: Dict[str, List[Dict[str, Any]]] = {}
+    pending: Dict[str, Tuple[str, int]] = {}  # 정규화 키 -> (검색어, generation)
+    for query, _ in items:
+        key = cache.key(query) if cache is not None else query
+        if key in matches_by_query or key in pending:
+            continue
+        cached = None
+        if cache is not None:
+            with stage_metrics.timer("match_cache_lookup"):
+                cached = await cache.get(database, key)
+        if cached is not None:
+            matches_by_query[key] = cached
+        else:
+            pending[key] = (query, cache.generation if cache is not None else 0)
+
+    terms_by_key = {}
+    for key, (query, _) in pending.items():
+        terms = _query_terms(query)
+        if terms is None:
+            matches_by_query[key] = []
+        else:
+            terms_by_key[key] = terms
+
+    if terms_by_key:
+        all_norm = sorted({t for norm, _, _ in terms_by_key.values() for t in norm})
+        all_like = sorted({t for _, _, like in terms_by_key.values() for t in like})
+
+        index = _matching_index
+        if index is None:
+            # 후보 키워드로 임시 인덱스를 만들어 검색어별 판정은 메모리에서 수행
+            with stage_metrics.timer("match_sql"):
+                candidate_rows = await _fetch_all_prepared(
+                    BATCH_KEYWORD_CANDIDATES_SQL,
+                    {"tokens_norm": all_norm, "tokens_like": all_like},
+                )
+            index = KeywordMatchIndex.from_rows(candidate_rows)
+
+        category_index = _category_index
+        categories_by_term: Dict[str, List[Any]] = {}
+        if category_index is None and all_like:
+            with stage_metrics.timer("match_categories_sql"):
+                category_rows = await _fetch_all_prepared(
+                    BATCH_CATEGORY_MATCH_SQL, {"tokens_like": all_like}
+                )
+            for r in category_rows:
+                categories_by_term.setdefault(r["term"], []).append(r)
+
+        for key, (tokens_norm, like_terms, tokens_like) in terms_by_key.items():
+            with stage_metrics.timer("match_keywords_index"):
+                keyword_rows = index.match(tokens_norm, like_terms)
+            if category_index is not None:
+                with stage_metrics.timer("match_categories_index"):
+                    query_category_rows = category_index.match(like_terms)
+            else:
+                query_category_rows = [
+                    r for term in tokens_like for r in categories_by_term.get(term, [])
+                ]
+            matches = _score_matches(keyword_rows, query_category_rows)
+            matches_by_query[key] = matches
+            if cache is not None:
+                cache.put(database, key, matches, pending[key][1])
+
+    advertiser_ids = sorted(
+        {m["advertiser_id"] for ms in matches_by_query.values() for m in ms}
+    )
+    abs_map = await _enabled_settings(advertiser_ids) if advertiser_ids else {}
+    return [
+        _apply_quality_filter(
+            matches_by_query[cache.key(query) if cache is not None else query],
+            abs_map,
+            quality_score,
+        )
+        for query, quality_score in items
+    ]
+
+
 # --- 2. 자동 입찰가 계산 알고리즘 ---
 
 
@@ -540,111 +1146,204 @@ async def calculate_auto_bid_price(
 # --- 3. 예산 확인 로직 ---
 
 
-async def _reserve_budget_tx(advertiser_id: int, bid_amount: int) -> bool:
-    """
-    예산 예약 (트랜잭션 내부에서만 호출)
-    KST 기준 일일 경계 사용: timezone('Asia/Seoul', now())::date
-    """
-    # KST 기준 오늘 날짜
-    current_spend = await database.fetch_one(
-        """
-        SELECT amount FROM advertiser_daily_spend
-        WHERE advertiser_id = :aid 
-          AND spend_date = (timezone('Asia/Seoul', now()))::date
-        FOR UPDATE
-        """,
-        {"aid": advertiser_id},
+# === Budget ledger (예산 페이싱 모드) ===
+# lifespan 에서 AUCTION_BUDGET_LEDGER=1 일 때만 생성, 그 외에는 None (DB 직접 예약)
+_budget_ledger: Optional[BudgetLedger] = None
+
+
+async def start_budget_ledger() -> BudgetLedger:
+    global _budget_ledger
+    _budget_ledger = BudgetLedger(
+        database,
+        lease_fraction=BUDGET_LEASE_FRACTION,
+        flush_interval=BUDGET_FLUSH_INTERVAL,
+        lease_ttl=BUDGET_LEASE_TTL,
     )
+    await _budget_ledger.start()
+    logger.info("budget_ledger_started", worker_id=_budget_ledger.worker_id)
+    return _budget_ledger
 
-    # 레코드가 없으면 생성
-    if not current_spend:
-        await database.execute(
-            """
-            INSERT INTO advertiser_daily_spend(advertiser_id, spend_date, amount)
-            VALUES (:aid, (timezone('Asia/Seoul', now()))::date, 0)
-            ON CONFLICT (advertiser_id, spend_date) DO NOTHING
-            """,
-            {"aid": advertiser_id},
-        )
-        # 다시 조회 (FOR UPDATE)
-        current_spend = await database.fetch_one(
-            """
-            SELECT amount FROM advertiser_daily_spend
-            WHERE advertiser_id = :aid 
-              AND spend_date = (timezone('Asia/Seoul', now()))::date
-            FOR UPDATE
-            """,
-            {"aid": advertiser_id},
-        )
-        if not current_spend:
-            return False
 
-    # 예산 설정 조회
-    budget = await database.fetch_one(
-        """
-        SELECT daily_budget FROM auto_bid_settings 
-        WHERE advertiser_id = :aid
-        """,
-        {"aid": advertiser_id},
+# === 경매 간 bid 배치 저장 ===
+# lifespan 에서 AUCTION_BID_BATCH_WINDOW_MS > 0 일 때만 생성, 그 외에는 경매별 즉시 저장
+_bid_writer: Optional[BatchWriter] = None
+
+
+async def start_bid_writer() -> BatchWriter:
+    global _bid_writer
+    _bid_writer = BatchWriter(
+        _insert_bid_rows,
+        name="bids",
+        window=BID_BATCH_WINDOW_MS / 1000,
+        max_batch=BID_BATCH_MAX_ROWS,
     )
-    if not budget:
-        return False
+    await _bid_writer.start()
+    return _bid_writer
 
-    current_amount = int(current_spend["amount"] or 0)
-    budget_limit = int(budget["daily_budget"] or 0)
 
-    # 예산 초과 확인
-    if (current_amount + bid_amount) > budget_limit:
-        return False
+# === 만료 경매 정리 ===
+# lifespan 에서 AUCTION_EXPIRY_SWEEP_INTERVAL > 0 일 때 생성 (모든 워커가 SKIP LOCKED 로 나눠 처리)
+_expiry_sweeper: Optional[AuctionExpirySweeper] = None
 
-    # 예산 업데이트
-    await database.execute(
-        """
-        UPDATE advertiser_daily_spend
-        SET amount = amount + :amt
-        WHERE advertiser_id = :aid 
-          AND spend_date = (timezone('Asia/Seoul', now()))::date
-        """,
-        {"aid": advertiser_id, "amt": bid_amount},
+
+async def start_expiry_sweeper() -> AuctionExpirySweeper:
+    global _expiry_sweeper
+    _expiry_sweeper = AuctionExpirySweeper(
+        database,
+        interval=EXPIRY_SWEEP_INTERVAL,
+        batch_size=EXPIRY_SWEEP_BATCH_SIZE,
+        max_batches=EXPIRY_SWEEP_MAX_BATCHES,
+        platform_advertiser_id=PLATFORM_ADVERTISER_ID,
+        on_expired=publish_expired_auctions,
+    )
+    await _expiry_sweeper.start()
+    return _expiry_sweeper
+
+
+# 광고주별 예약 금액을 한 문장으로 반영 (일일 지출 행이 없으면 생성)
+# - 예산 초과 광고주는 INSERT 대상에서 제외되거나 ON CONFLICT ... WHERE 에서 걸러져 반환되지 않음
+# - advertiser_id 순서로 처리하여 동시 경매 간 행 잠금 순서를 고정 (교착 방지)
+BATCH_RESERVE_SQL = """
+    INSERT INTO advertiser_daily_spend AS s (advertiser_id, spend_date, amount)
+    SELECT r.advertiser_id, (timezone('Asia/Seoul', now()))::date, r.amount
+    FROM unnest(CAST(:advertiser_ids AS integer[]), CAST(:amounts AS bigint[]))
+        AS r(advertiser_id, amount)
+    JOIN auto_bid_settings abs ON abs.advertiser_id = r.advertiser_id
+    WHERE r.amount <= abs.daily_budget
+    ORDER BY r.advertiser_id
+    ON CONFLICT (advertiser_id, spend_date) DO UPDATE
+    SET amount = s.amount + EXCLUDED.amount
+    WHERE s.amount + EXCLUDED.amount <= (
+        SELECT daily_budget FROM auto_bid_settings WHERE advertiser_id = s.advertiser_id
     )
-    return True
+    RETURNING s.advertiser_id
+"""
 
 
-async def reserve_and_insert_bid(
-    auction_id: int, user_id: int, bid: BidResponse
-) -> bool:
+async def _reserve_budgets_tx(amounts: Dict[int, int]) -> set[int]:
     """
-    예산 예약과 bid 저장을 하나의 트랜잭션으로 처리
+    여러 광고주의 예산을 한 번에 예약 (트랜잭션 내부에서만 호출)
+    amounts: {advertiser_id: 예약 금액}, 반환: 예약에 성공한 advertiser_id 집합
     """
-    async with database.transaction():
-        # 1) 예산 예약 (ADVERTISER만)
-        if (
-            not bid.id.startswith("platform_bid_")
-            and bid.advertiserId
-            and bid.advertiserId != PLATFORM_ADVERTISER_ID
-        ):
-            ok = await _reserve_budget_tx(bid.advertiserId, bid.price)
-            if not ok:
-                logger.warning(
-                    "budget_insufficient",
-                    advertiser_id=bid.advertiserId,
-                    bid_price=bid.price,
-                )
-                return False
+    if not amounts:
+        return set()
+    advertiser_ids = sorted(amounts)
+    rows = await database.fetch_all(
+        BATCH_RESERVE_SQL,
+        {
+            "advertiser_ids": advertiser_ids,
+            "amounts": [amounts[a] for a in advertiser_ids],
+        },
+    )
+    return {r["advertiser_id"] for r in rows}
 
-        # 2) bid 저장
-        bid_type = "PLATFORM" if bid.id.startswith("platform_bid_") else "ADVERTISER"
-        await database.execute(
-            """
-            INSERT INTO bids (
-                id, auction_id, buyer_name, price, bonus_description, 
-                landing_url, type, user_id, dest_url, advertiser_id, created_at
-            )
-            VALUES (
-                :id, :auction_id, :buyer_name, :price, :bonus_description,
-                :landing_url, :type, :user_id, :dest_url, :advertiser_id, NOW()
+
+def _needs_budget_reservation(bid: BidResponse) -> bool:
+    return (
+        not bid.id.startswith("platform_bid_")
+        and bool(bid.advertiserId)
+        and bid.advertiserId != PLATFORM_ADVERTISER_ID
+    )
+
+
+async def reserve_and_insert_bids(
+    auction_id: int, user_id: int, bids: List[BidResponse]
+) -> List[bool]:
+    """
+    경매의 모든 bid 에 대한 예산 예약과 저장
+    예산 예약은 광고주별 합계로 한 문장에서, 저장은 다중 행 INSERT 한 문장으로 수행하며
+    반환값은 bids 와 같은 순서의 성공 여부입니다.
+    (같은 광고주의 bid 가 여러 개면 합계 기준으로 함께 성공/실패)
+    """
+    return (await reserve_and_insert_bid_groups(user_id, [(auction_id, bids)]))[0]
+
+
+async def reserve_and_insert_bid_groups(
+    user_id: int, groups: List[Tuple[int, List[BidResponse]]]
+) -> List[List[bool]]:
+    """
+    여러 경매의 bid 를 한 번의 예산 예약 + 한 번의 다중 행 INSERT 로 저장
+    groups: [(auction_id, bids)], 반환값은 groups 와 같은 구조의 성공 여부입니다.
+    예산은 전체 경매에 걸친 광고주별 합계로 예약합니다.
+    """
+    pairs = [(auction_id, bid) for auction_id, bids in groups for bid in bids]
+    flat = await _reserve_and_insert_pairs(user_id, pairs)
+    results: List[List[bool]] = []
+    offset = 0
+    for _, bids in groups:
+        results.append(flat[offset : offset + len(bids)])
+        offset += len(bids)
+    return results
+
+
+async def _reserve_and_insert_pairs(
+    user_id: int, pairs: List[Tuple[int, BidResponse]]
+) -> List[bool]:
+    amounts: Dict[int, int] = {}
+    for _, bid in pairs:
+        if _needs_budget_reservation(bid):
+            amounts[bid.advertiserId] = amounts.get(bid.advertiserId, 0) + bid.price
+
+    ledger = _budget_ledger
+    writer = _bid_writer
+    if ledger is not None:
+        # 예산 페이싱 모드: 워커 리스에서 메모리 예약 (spend 행 잠금 없음)
+        with stage_metrics.timer("budget_reservation"):
+            reserved = await ledger.reserve_many(amounts)
+        rows, results = _accepted_bid_rows(user_id, pairs, reserved)
+        try:
+            with stage_metrics.timer("bid_insert"):
+                if writer is not None:
+                    await writer.write(rows)
+                else:
+                    await _insert_bid_rows(rows)
+        except Exception:
+            ledger.refund({a: amt for a, amt in amounts.items() if a in reserved})
+            raise
+        return results
+
+    if writer is None:
+        async with database.transaction():
+            with stage_metrics.timer("budget_reservation"):
+                reserved = await _reserve_budgets_tx(amounts)
+            rows, results = _accepted_bid_rows(user_id, pairs, reserved)
+            with stage_metrics.timer("bid_insert"):
+                await _insert_bid_rows(rows)
+            return results
+
+    # 경매 간 배치 저장: 예약을 먼저 커밋하고, 저장 실패 시 예약분을 되돌림
+    with stage_metrics.timer("budget_reservation"):
+        async with database.transaction():
+            reserved = await _reserve_budgets_tx(amounts)
+    rows, results = _accepted_bid_rows(user_id, pairs, reserved)
+    try:
+        with stage_metrics.timer("bid_insert"):
+            await writer.write(rows)
+    except Exception:
+        await _release_budgets({a: amt for a, amt in amounts.items() if a in reserved})
+        raise
+    return results
+
+
+def _accepted_bid_rows(
+    user_id: int, pairs: List[Tuple[int, BidResponse]], reserved: set[int]
+) -> Tuple[List[Dict[str, Any]], List[bool]]:
+    """
+    예약에 성공한 광고주(및 플랫폼)의 bid 를 bids 행으로 변환
+    pairs: [(auction_id, bid)], 반환: (저장할 행 목록, pairs 순서의 성공 여부)
+    """
+    rows: List[Dict[str, Any]] = []
+    results: List[bool] = []
+    for auction_id, bid in pairs:
+        if _needs_budget_reservation(bid) and bid.advertiserId not in reserved:
+            logger.warning(
+                "budget_insufficient",
+                advertiser_id=bid.advertiserId,
+                bid_price=bid.price,
             )
-            """,
+            results.append(False)
+            continue
+        rows.append(
             {
                 "id": bid.id,
                 "auction_id": auction_id,
@@ -652,21 +1351,115 @@ async def reserve_and_insert_bid(
                 "price": bid.price,
                 "bonus_description": bid.bonus,
                 "landing_url": bid.landingUrl,
-                "type": bid_type,
+                "type": "PLATFORM" if bid.id.startswith("platform_bid_") else "ADVERTISER",
                 "user_id": user_id,
-                "dest_url": bid.landingUrl,
                 "advertiser_id": bid.advertiserId,
-            },
+            }
         )
-        return True
+        results.append(True)
+    return rows, results
 
 
-# --- 4. 실제 광고주 자동 입찰 생성 ---
+# bids 다중 행 INSERT (열별 배열을 unnest 로 펼침, 행 수와 무관하게 같은 SQL)
+BULK_INSERT_BIDS_SQL = """
+    INSERT INTO bids (
+        id, auction_id, buyer_name, price, bonus_description,
+        landing_url, type, user_id, dest_url, advertiser_id, created_at
+    )
+    SELECT b.id, b.auction_id, b.buyer_name, b.price, b.bonus_description,
+           b.landing_url, b.type, b.user_id, b.landing_url, b.advertiser_id, NOW()
+    FROM unnest(
+        CAST(:ids AS text[]),
+        CAST(:auction_ids AS integer[]),
+        CAST(:buyer_names AS text[]),
+        CAST(:prices AS integer[]),
+        CAST(:bonus_descriptions AS text[]),
+        CAST(:landing_urls AS text[]),
+        CAST(:types AS text[]),
+        CAST(:user_ids AS integer[]),
+        CAST(:advertiser_ids AS integer[])
+    ) AS b(id, auction_id, buyer_name, price, bonus_description,
+           landing_url, type, user_id, advertiser_id)
+"""
 
 
-async def generate_real_advertiser_bids(
-    search_query: str, quality_score: int
-) -> List[BidResponse]:
+async def _insert_bid_rows(rows: List[Dict[str, Any]]) -> None:
+    """_accepted_bid_rows 가 만든 행들을 한 문장으로 저장 (경매 여러 개의 행이 섞여도 됨)"""
+    if not rows:
+        return
+    await database.execute(
+        BULK_INSERT_BIDS_SQL,
+        {
+            "ids": [r["id"] for r in rows],
+            "auction_ids": [r["auction_id"] for r in rows],
+            "buyer_names": [r["buyer_name"] for r in rows],
+            "prices": [r["price"] for r in rows],
+            "bonus_descriptions": [r["bonus_description"] for r in rows],
+            "landing_urls": [r["landing_url"] for r in rows],
+            "types": [r["type"] for r in rows],
+            "user_ids": [r["user_id"] for r in rows],
+            "advertiser_ids": [r["advertiser_id"] for r in rows],
+        },
+    )
+
+
+async def _release_budgets(amounts: Dict[int, int]) -> None:
+    """커밋된 예산 예약을 되돌림 (배치 저장 실패 시 보상)"""
+    if not amounts:
+        return
+    advertiser_ids = sorted(amounts)
+    await database.execute(
+        """
+        UPDATE advertiser_daily_spend s
+        SET amount = GREATEST(s.amount - r.amount, 0)
+        FROM unnest(CAST(:advertiser_ids AS integer[]), CAST(:amounts AS bigint[]))
+            AS r(advertiser_id, amount)
+        WHERE s.advertiser_id = r.advertiser_id
+          AND s.spend_date = (timezone('Asia/Seoul', now()))::date
+        """,
+        {
+            "advertiser_ids": advertiser_ids,
+            "amounts": [amounts[a] for a in advertiser_ids],
+        },
+    )
+
+
+# --- 4. 실제 광고주 자동 입찰 생성 ---
+
+
+ADVERTISER_DETAILS_SQL = """
+    SELECT
+        a.id as advertiser_id, a.company_name, a.website_url,
+        abs.daily_budget, abs.max_bid_per_keyword,
+        ar.recommended_bid_min, ar.recommended_bid_max
+    FROM advertisers a
+    LEFT JOIN auto_bid_settings abs ON a.id = abs.advertiser_id
+    LEFT JOIN advertiser_reviews ar ON a.id = ar.advertiser_id AND ar.review_status = 'approved'
+    WHERE abs.is_enabled = true AND a.id = ANY(:ids)
+"""
+
+
+async def fetch_advertiser_details(advertiser_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """광고주별 입찰가 계산 정보. 프로필 캐시에 없는 광고주만 ADVERTISER_DETAILS_SQL 로 조회"""
+    cache = _profile_cache
+    if cache is None:
+        with stage_metrics.timer("advertiser_details"):
+            rows = await _fetch_all_prepared(ADVERTISER_DETAILS_SQL, {"ids": advertiser_ids})
+        return {r["advertiser_id"]: dict(r) for r in rows}
+
+    info_map, missing = cache.get_many(advertiser_ids)
+    if missing:
+        generation = cache.generation
+        with stage_metrics.timer("advertiser_details"):
+            rows = await _fetch_all_prepared(ADVERTISER_DETAILS_SQL, {"ids": missing})
+        cache.put_rows(missing, rows, generation)
+        info_map.update((r["advertiser_id"], dict(r)) for r in rows)
+    return info_map
+
+
+async def generate_real_advertiser_bids(
+    search_query: str, quality_score: int
+) -> List[BidResponse]:
     """
     실제 광고주 자동 입찰 생성 (N+1 제거, 점수/사유 전달)
     """
@@ -682,26 +1475,31 @@ async def generate_real_advertiser_bids(
         log.warning("no_matching_advertisers", query=search_query)
         return generate_platform_fallback_bids(search_query, quality_score)
 
-    advertiser_ids = [m["advertiser_id"] for m in matching_advertisers]
-    details_in_clause, details_params = _make_in_clause("a.id", advertiser_ids, "adv")
-    details_query = f"""
-        SELECT 
-            a.id as advertiser_id, a.company_name, a.website_url,
-            abs.daily_budget, abs.max_bid_per_keyword,
-            ar.recommended_bid_min, ar.recommended_bid_max
-        FROM advertisers a
-        LEFT JOIN auto_bid_settings abs ON a.id = abs.advertiser_id
-        LEFT JOIN advertiser_reviews ar ON a.id = ar.advertiser_id AND ar.review_status = 'approved'
-        WHERE abs.is_enabled = true AND {details_in_clause}
-    """
-    rows = await database.fetch_all(details_query, details_params)
-    info_map = {r["advertiser_id"]: dict(r) for r in rows}
+    info_map = await fetch_advertiser_details(
+        [m["advertiser_id"] for m in matching_advertisers]
+    )
 
-    real_bids: List[BidResponse] = []
+    return await _build_advertiser_bids(
+        search_query, quality_score, matching_advertisers, info_map
+    )
+
+
+async def _build_advertiser_bids(
+    search_query: str,
+    quality_score: int,
+    matching_advertisers: List[Dict[str, Any]],
+    info_map: Dict[int, Dict[str, Any]],
+) -> List[BidResponse]:
+    """매칭 결과와 광고주 상세 정보로 입찰 생성 (유효한 입찰이 없으면 플랫폼 폴백)"""
+    log = logger.bind(service="auction-service")
+
+    import uuid
+
+    # (bid_id, 가격, 광고주 ID, 매칭 결과, 상세 정보) - 서명은 경매 단위로 한 번에
+    priced: List[Tuple[str, int, int, Dict[str, Any], Dict[str, Any]]] = []
     for m in matching_advertisers:
         adv_id = m["advertiser_id"]
         match_score = m["match_score"]
-        reasons = m["reasons"]
         info = info_map.get(adv_id)
         if not info:
             continue
@@ -726,13 +1524,19 @@ async def generate_real_advertiser_bids(
         if bid_price <= 0:
             continue
 
-        # 예산 확인은 나중에 reserve_and_insert_bid에서 트랜잭션으로 처리
+        # 예산 확인은 나중에 reserve_and_insert_bids에서 트랜잭션으로 처리
         # 여기서는 BidResponse만 생성
+        bid_id = f"bid_real_{adv_id}_{int(datetime.now(timezone.utc).timestamp())}_{uuid.uuid4().hex[:8]}"
+        priced.append((bid_id, bid_price, adv_id, m, info))
 
-        import uuid
+    with stage_metrics.timer("sign_click"):
+        sigs = sign_clicks(
+            [(bid_id, bid_price, "ADVERTISER") for bid_id, bid_price, *_ in priced]
+        )
 
-        bid_id = f"bid_real_{adv_id}_{int(datetime.now(timezone.utc).timestamp())}_{uuid.uuid4().hex[:8]}"
-        sig = sign_click(bid_id, bid_price, "ADVERTISER")
+    real_bids: List[BidResponse] = []
+    for (bid_id, bid_price, adv_id, m, info), sig in zip(priced, sigs):
+        match_score = m["match_score"]
         click_url = f"{REDIRECT_BASE_URL}/api/redirect/{bid_id}?sig={sig}"
 
         real_bids.append(
@@ -747,7 +1551,7 @@ async def generate_real_advertiser_bids(
                 landingUrl=_validate_url(info.get("website_url"))
                 or f"https://www.google.com/search?q={search_query}",
                 clickUrl=click_url,
-                reasons=reasons,
+                reasons=m["reasons"],
                 matchScore=match_score,
                 advertiserId=adv_id,
             )
@@ -900,7 +1704,8 @@ async def start_reverse_auction(query: str, value_score: int) -> List[BidRespons
         bids = generate_platform_fallback_bids(query, value_score)
 
     # 자동 입찰 결과 DB에 기록
-    await log_auto_bids(bids, query, value_score)
+    with stage_metrics.timer("log_auto_bids"):
+        await log_auto_bids(bids, query, value_score)
 
     log.info("reverse_auction_complete", bid_count=len(bids))
     for i, bid in enumerate(bids):
@@ -980,80 +1785,174 @@ async def generate_simulation_bids(
     return bids
 
 
-# 쿼리 내 바인더(:name) 추출을 위한 정규식
-_BIND_RE = re.compile(r":([a-zA-Z_][a-zA-Z0-9_]*)")
+# auto_bid_logs 다중 행 INSERT (열별 배열을 unnest 로 펼침)
+AUTO_BID_LOGS_INSERT_SQL = """
+    INSERT INTO auto_bid_logs (
+        advertiser_id, search_query, match_type, match_score,
+        bid_amount, bid_result, quality_score, competitor_count,
+        created_at, reasons
+    )
+    SELECT * FROM unnest(
+        CAST(:advertiser_ids AS integer[]),
+        CAST(:search_queries AS text[]),
+        CAST(:match_types AS text[]),
+        CAST(:match_scores AS double precision[]),
+        CAST(:bid_amounts AS integer[]),
+        CAST(:bid_results AS text[]),
+        CAST(:quality_scores AS integer[]),
+        CAST(:competitor_counts AS integer[]),
+        CAST(:created_ats AS timestamp[]),
+        CAST(:reasons AS jsonb[])
+    )
+"""
 
+# 폴백: reasons 없이 (구버전 테이블 호환)
+AUTO_BID_LOGS_INSERT_SQL_WITHOUT_REASONS = """
+    INSERT INTO auto_bid_logs (
+        advertiser_id, search_query, match_type, match_score,
+        bid_amount, bid_result, quality_score, competitor_count,
+        created_at
+    )
+    SELECT * FROM unnest(
+        CAST(:advertiser_ids AS integer[]),
+        CAST(:search_queries AS text[]),
+        CAST(:match_types AS text[]),
+        CAST(:match_scores AS double precision[]),
+        CAST(:bid_amounts AS integer[]),
+        CAST(:bid_results AS text[]),
+        CAST(:quality_scores AS integer[]),
+        CAST(:competitor_counts AS integer[]),
+        CAST(:created_ats AS timestamp[])
+    )
+"""
 
-def _filter_params_for_query(sql: str, params: dict) -> dict:
-    """SQL 쿼리에 실제로 존재하는 바인더만 파라미터 딕셔너리에서 필터링"""
-    names = set(_BIND_RE.findall(sql))
-    return {k: v for k, v in params.items() if k in names}
+# === auto_bid_logs write-behind 큐 ===
+# lifespan 에서 생성, 없으면(스크립트/테스트) 호출 시점에 바로 기록
+_auto_bid_log_writer: Optional[BatchWriter] = None
 
 
-async def log_auto_bids(bids: List[BidResponse], query: str, value_score: int):
-    """자동 입찰 결과를 로그 테이블에 기록 (reasons JSONB / matchScore 반영)"""
-    log = logger.bind(service="auction-service")
+async def start_auto_bid_log_writer() -> BatchWriter:
+    global _auto_bid_log_writer
+    _auto_bid_log_writer = BatchWriter(
+        write_auto_bid_logs,
+        name="auto_bid_logs",
+        window=AUTO_BID_LOG_FLUSH_MS / 1000,
+        max_batch=AUTO_BID_LOG_BATCH_MAX_ROWS,
+        max_pending=AUTO_BID_LOG_QUEUE_SIZE,
+    )
+    await _auto_bid_log_writer.start()
+    return _auto_bid_log_writer
+
+
+# auto_bid_logs 스키마 (lifespan 에서 한 번 감지)
+# True: reasons 컬럼 있음, False: 구버전 테이블, None: 감지 전/실패 (기록 시 폴백 시도)
+_auto_bid_logs_has_reasons: Optional[bool] = None
+
+
+async def detect_auto_bid_logs_schema() -> Optional[bool]:
+    """
+    information_schema 에서 auto_bid_logs.reasons 컬럼 존재 여부를 확인합니다.
+    서비스 실행 중 마이그레이션을 적용했다면 재시작해야 reasons 가 기록됩니다.
+    """
+    global _auto_bid_logs_has_reasons
     try:
-        # 1차: reasons 포함 쿼리 (정상 케이스)
-        sql_with_reasons = """
-            INSERT INTO auto_bid_logs (
-                advertiser_id, search_query, match_type, match_score,
-                bid_amount, bid_result, quality_score, competitor_count,
-                created_at, reasons
-            ) VALUES (
-                :advertiser_id, :search_query, :match_type, :match_score,
-                :bid_amount, :bid_result, :quality_score, :competitor_count,
-                :created_at, CAST(:reasons AS jsonb)
-            )
-        """
+        row = await database.fetch_one(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'auto_bid_logs'
+                  AND column_name = 'reasons'
+            ) AS ok
+            """
+        )
+    except Exception as e:
+        logger.warning("auto_bid_logs_schema_detection_failed", error=str(e))
+        return None
+    _auto_bid_logs_has_reasons = bool(row and row["ok"])
+    logger.info(
+        "auto_bid_logs_schema_detected", schema_version=auto_bid_logs_schema_version()
+    )
+    return _auto_bid_logs_has_reasons
 
-        # 2차 폴백: reasons 없이 (구버전 테이블 호환)
-        sql_without_reasons = """
-            INSERT INTO auto_bid_logs (
-                advertiser_id, search_query, match_type, match_score,
-                bid_amount, bid_result, quality_score, competitor_count,
-                created_at
-            ) VALUES (
-                :advertiser_id, :search_query, :match_type, :match_score,
-                :bid_amount, :bid_result, :quality_score, :competitor_count,
-                :created_at
-            )
-        """
 
-        for bid in bids:
-            # BidResponse에 advertiserId가 지정되지 않았다면 NULL 로깅
-            advertiser_id = bid.advertiserId if bid.advertiserId else None
-            match_score = float(bid.matchScore or 0.0)
-            reasons_value = bid.reasons or []
+def auto_bid_logs_schema_version() -> str:
+    if _auto_bid_logs_has_reasons is None:
+        return "unknown"
+    return "reasons" if _auto_bid_logs_has_reasons else "legacy"
 
-            # created_at은 tz-naive UTC로
-            created_at = _utc_naive(bid.timestamp)
-
-            # 기본 파라미터 준비 (reasons는 JSON 문자열로 직렬화)
-            base_params = {
-                "advertiser_id": advertiser_id,
-                "search_query": query,
-                "match_type": "complex",
-                "match_score": match_score,
-                "bid_amount": bid.price,
-                "bid_result": ("won" if bid.price > 500 else "lost"),
-                "quality_score": value_score,
-                "competitor_count": len(bids),
-                "created_at": created_at,
-                "reasons": json.dumps(reasons_value),
-            }
 
+async def write_auto_bid_logs(rows: List[Dict[str, Any]]) -> None:
+    """auto_bid_logs 행들을 한 문장으로 기록 (여러 경매의 행이 섞여도 됨)"""
+    if not rows:
+        return
+    params = {
+        "advertiser_ids": [r["advertiser_id"] for r in rows],
+        "search_queries": [r["search_query"] for r in rows],
+        "match_types": [r["match_type"] for r in rows],
+        "match_scores": [r["match_score"] for r in rows],
+        "bid_amounts": [r["bid_amount"] for r in rows],
+        "bid_results": [r["bid_result"] for r in rows],
+        "quality_scores": [r["quality_score"] for r in rows],
+        "competitor_counts": [r["competitor_count"] for r in rows],
+        "created_ats": [r["created_at"] for r in rows],
+    }
+    has_reasons = _auto_bid_logs_has_reasons
+    with stage_metrics.timer("auto_bid_logs_write"):
+        if has_reasons is False:
+            await database.execute(AUTO_BID_LOGS_INSERT_SQL_WITHOUT_REASONS, params)
+        elif has_reasons is True:
+            await database.execute(
+                AUTO_BID_LOGS_INSERT_SQL,
+                {**params, "reasons": [r["reasons"] for r in rows]},
+            )
+        else:
+            # 스키마를 모르는 경우에만 reasons 포함 시도 후 폴백
             try:
-                # 1차 시도: reasons 포함
-                params = _filter_params_for_query(sql_with_reasons, base_params)
-                await database.execute(sql_with_reasons, params)
+                await database.execute(
+                    AUTO_BID_LOGS_INSERT_SQL,
+                    {**params, "reasons": [r["reasons"] for r in rows]},
+                )
             except Exception as e1:
-                log.warning("reasons_column_not_found_fallback", error=str(e1))
-                # 2차 시도: reasons 제거 쿼리 (파라미터도 필터링하여 reasons 키 제거)
-                params_fb = _filter_params_for_query(sql_without_reasons, base_params)
-                await database.execute(sql_without_reasons, params_fb)
+                logger.warning("reasons_column_not_found_fallback", error=str(e1))
+                await database.execute(AUTO_BID_LOGS_INSERT_SQL_WITHOUT_REASONS, params)
+    logger.debug("auto_bid_logs_recorded", row_count=len(rows))
+
 
-        log.info("auto_bid_logs_recorded", bid_count=len(bids))
+async def log_auto_bids(bids: List[BidResponse], query: str, value_score: int):
+    """
+    자동 입찰 결과를 로그 큐에 넣음 (reasons JSONB / matchScore 반영)
+    실제 기록은 백그라운드 writer 가 여러 경매를 모아 수행하므로 경매 응답을 지연시키지 않습니다.
+    큐가 가득 차면 AUTO_BID_LOG_ENQUEUE_TIMEOUT_MS(기본 0: 기다리지 않음) 동안만 자리를 기다리고,
+    그래도 자리가 없으면 해당 경매의 로그를 버립니다 (버린 행 수는 /metrics 에 노출).
+    """
+    log = logger.bind(service="auction-service")
+    rows = [
+        {
+            # BidResponse에 advertiserId가 지정되지 않았다면 NULL 로깅
+            "advertiser_id": bid.advertiserId if bid.advertiserId else None,
+            "search_query": query,
+            "match_type": "complex",
+            "match_score": float(bid.matchScore or 0.0),
+            "bid_amount": bid.price,
+            "bid_result": ("won" if bid.price > 500 else "lost"),
+            "quality_score": value_score,
+            "competitor_count": len(bids),
+            # created_at은 tz-naive UTC로
+            "created_at": _utc_naive(bid.timestamp),
+            "reasons": json.dumps(bid.reasons or []),
+        }
+        for bid in bids
+    ]
+
+    writer = _auto_bid_log_writer
+    if writer is not None:
+        if not await writer.enqueue(rows, AUTO_BID_LOG_ENQUEUE_TIMEOUT_MS / 1000):
+            log.warning("auto_bid_logs_dropped", bid_count=len(rows))
+        return
+
+    try:
+        await write_auto_bid_logs(rows)
     except Exception as e:
         log.error("auto_bid_logging_error", error=str(e), exc_info=True)
 
@@ -1091,10 +1990,197 @@ async def simulate_real_time_delay():
     await asyncio.sleep(delay)
 
 
-async def simulate_auction_update(auction_id: str) -> dict:
-    """경매 상태 업데이트 시뮬레이션"""
-    await asyncio.sleep(random.uniform(0.5, 1.5))
-    return {"status": "active", "participants": random.randint(1, 10)}
+# === 경매 상태 푸시 ===
+# 이 워커의 상태 broker (lifespan 없이도 사용 가능) 와 다른 워커의 변경을 받는 LISTEN 리스너
+_status_broker = AuctionStatusBroker()
+_status_listener: Optional[AuctionStatusListener] = None
+
+AUCTION_STATUS_SQL = """
+    SELECT a.status, a.selected_bid_id,
+           (SELECT COUNT(*) FROM bids b WHERE b.auction_id = a.id) AS participants
+    FROM auctions a
+    WHERE a.search_id = :search_id
+"""
+
+
+async def start_status_listener() -> AuctionStatusListener:
+    global _status_listener
+    _status_listener = AuctionStatusListener(
+        str(database.url), AUCTION_STATUS_CHANNEL, _status_broker
+    )
+    await _status_listener.start()
+    return _status_listener
+
+
+def _status_state(
+    status: str, selected_bid_id: Optional[str], participants: Optional[int]
+) -> dict:
+    return {
+        "status": status,
+        "selectedBidId": selected_bid_id,
+        "participants": int(participants) if participants is not None else None,
+    }
+
+
+async def load_auction_status(search_id: str) -> Optional[dict]:
+    """DB 의 현재 상태를 broker 에 반영하고 반환 (경매가 없으면 None)"""
+    row = await database.fetch_one(AUCTION_STATUS_SQL, {"search_id": search_id})
+    if not row:
+        return None
+    _status_broker.publish(
+        search_id,
+        _status_state(row["status"], row["selected_bid_id"], row["participants"]),
+    )
+    return _status_broker.current(search_id)[1]
+
+
+async def publish_auction_status(
+    search_id: str, state: dict, *, notify: bool = True
+) -> None:
+    """
+    상태 변경을 이 워커의 대기자에게 바로 알리고, notify 면 다른 워커에도 NOTIFY
+    (알림 실패는 요청을 실패시키지 않음 - 다른 워커의 대기자는 DB 재확인으로 보정)
+    """
+    _status_broker.publish(search_id, state)
+    if not notify:
+        return
+    try:
+        await database.execute(
+            "SELECT pg_notify(:channel, :payload)",
+            {"channel": AUCTION_STATUS_CHANNEL, "payload": status_payload(search_id, state)},
+        )
+    except Exception as e:
+        logger.warning("auction_status_notify_failed", search_id=search_id, error=str(e))
+
+
+async def publish_expired_auctions(search_ids: List[str]) -> None:
+    """
+    만료 sweeper 가 만료시킨 경매를 구독자에게 알림 (NOTIFY 는 묶음당 한 문장)
+    이 워커의 broker 에는 이미 알고 있는 경매만 반영해 LRU 를 밀어내지 않음
+    """
+    states = [(search_id, _status_state("expired", None, None)) for search_id in search_ids]
+    for search_id, state in states:
+        _status_broker.publish(search_id, state, create=False)
+    await database.execute(
+        """
+        SELECT pg_notify(:channel, payload)
+        FROM unnest(CAST(:payloads AS text[])) AS payload
+        """,
+        {
+            "channel": AUCTION_STATUS_CHANNEL,
+            "payloads": [status_payload(search_id, state) for search_id, state in states],
+        },
+    )
+
+
+def _new_search_id() -> str:
+    return f"search_{int(datetime.now(timezone.utc).timestamp())}_{random.randint(1000, 9999)}"
+
+
+def _fill_advertiser_ids(bids: List[BidResponse]) -> None:
+    for bid in bids:
+        # 광고주 ID가 BidResponse에 없으면 bid_id에서 추출 시도
+        if not bid.advertiserId and bid.id.startswith("bid_real_"):
+            try:
+                parts = bid.id.split("_")
+                if len(parts) >= 3:
+                    bid.advertiserId = int(parts[2])
+            except (ValueError, IndexError):
+                pass
+
+
+async def persist_auction(
+    query: str, value_score: int, user_id: Optional[int], bids: List[BidResponse]
+) -> Tuple[AuctionResponse, List[BidResponse]]:
+    """
+    경매 행 생성 + 예산 예약 + bid 저장
+    반환: (클라이언트에 보여줄 경매 정보, 실제로 저장된 bids)
+    모든 bid 저장이 실패하면 플랫폼 폴백 bid 로 대체합니다.
+    """
+    log = logger.bind(service="auction-service")
+
+    # 경매 정보 생성
+    search_id = _new_search_id()
+    now = _utc_naive()
+    expires_at = now + timedelta(minutes=30)  # 30분 후 만료
+
+    # 경매 정보를 DB에 저장
+    auction_query = """
+        INSERT INTO auctions (search_id, query_text, user_id, status, expires_at, created_at)
+        VALUES (:search_id, :query_text, :user_id, :status, :expires_at, :created_at)
+        RETURNING id
+    """
+
+    try:
+        auction_result = await database.fetch_one(
+            auction_query,
+            {
+                "search_id": search_id,
+                "query_text": query.strip(),
+                "user_id": (
+                    user_id if user_id else 1
+                ),  # JWT에서 추출하거나 기본값 사용
+                "status": "active",
+                "expires_at": expires_at,
+                "created_at": now,
+            },
+        )
+    except Exception as db_error:
+        log.error(
+            "auction_creation_error",
+            error=str(db_error),
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500, detail=f"데이터베이스 오류: {str(db_error)}"
+        )
+
+    if not auction_result:
+        raise HTTPException(status_code=500, detail="경매 생성에 실패했습니다.")
+
+    auction_id = auction_result["id"]
+
+    # 입찰 정보를 DB에 저장 (예산 예약과 함께 하나의 트랜잭션으로 처리)
+    _fill_advertiser_ids(bids)
+
+    # 예산 예약 + bid 저장 (전체 bid 를 한 트랜잭션에서 일괄 처리)
+    results = await reserve_and_insert_bids(
+        auction_id, user_id if user_id else 1, bids
+    )
+    successful_bids = []
+    for bid, success in zip(bids, results):
+        if success:
+            successful_bids.append(bid)
+        else:
+            logger.warning(
+                "bid_insert_failed",
+                bid_id=bid.id,
+                advertiser_id=bid.advertiserId,
+                reason="budget_insufficient_or_db_error",
+            )
+
+    # 최소한 하나의 bid라도 저장되어야 함 (없으면 플랫폼 폴백 처리)
+    if not successful_bids:
+        logger.error("no_bids_stored", auction_id=auction_id)
+        # 모든 입찰이 실패했을 경우 빈 리스트 반환 또는 플랫폼 폴백 재생성
+        bids = generate_platform_fallback_bids(query, value_score)
+        await reserve_and_insert_bids(auction_id, user_id if user_id else 1, bids)
+        successful_bids = bids
+
+    # 성공적으로 저장된 bids만 반환 (또는 원본 bids - 클라이언트에는 모두 보여줌)
+    auction = AuctionResponse(
+        searchId=search_id,
+        query=query.strip(),
+        bids=bids,  # 원본 bids 반환 (클라이언트 표시용)
+        status="active",
+        createdAt=now,
+        expiresAt=expires_at,
+    )
+    # 생성 직후 상태는 이 워커에만 반영 (다른 워커는 첫 대기 요청에서 DB 로 확인하므로 NOTIFY 생략)
+    await publish_auction_status(
+        search_id, _status_state("active", None, len(successful_bids)), notify=False
+    )
+    return auction, successful_bids
 
 
 @app.post("/start", response_model=StartAuctionResponse)
@@ -1104,6 +2190,7 @@ async def start_auction(
     user_id: Optional[int] = Depends(get_user_id_from_token),
 ):
     """역경매를 시작합니다."""
+    started = time.perf_counter()
     try:
         log = logger.bind(service="auction-service")
 
@@ -1125,103 +2212,265 @@ async def start_auction(
         )
 
         # 역경매 시작 (실제 광고주 매칭 시스템 사용)
-        bids = await start_reverse_auction(request.query, request.valueScore)
+        with stage_metrics.timer("reverse_auction"):
+            bids = await start_reverse_auction(request.query, request.valueScore)
 
-        # 경매 정보 생성
-        search_id = f"search_{int(datetime.now(timezone.utc).timestamp())}_{random.randint(1000, 9999)}"
-        now = _utc_naive()
-        expires_at = now + timedelta(minutes=30)  # 30분 후 만료
+        auction, _ = await persist_auction(
+            request.query, request.valueScore, user_id, bids
+        )
 
-        # 경매 정보를 DB에 저장
-        auction_query = """
-            INSERT INTO auctions (search_id, query_text, user_id, status, expires_at, created_at)
-            VALUES (:search_id, :query_text, :user_id, :status, :expires_at, :created_at)
-            RETURNING id
-        """
+        stage_metrics.observe("start_total", time.perf_counter() - started)
+        return StartAuctionResponse(
+            success=True, data=auction, message="역경매가 성공적으로 시작되었습니다."
+        )
 
-        try:
-            auction_result = await database.fetch_one(
-                auction_query,
-                {
-                    "search_id": search_id,
-                    "query_text": request.query.strip(),
-                    "user_id": (
-                        user_id if user_id else 1
-                    ),  # JWT에서 추출하거나 기본값 사용
-                    "status": "active",
-                    "expires_at": expires_at,
-                    "created_at": now,
-                },
-            )
-        except Exception as db_error:
-            log.error(
-                "auction_creation_error",
-                error=str(db_error),
-                exc_info=True,
-            )
-            raise HTTPException(
-                status_code=500, detail=f"데이터베이스 오류: {str(db_error)}"
-            )
+    except Exception as e:
+        logger.error("auction_service_error", error=str(e), exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
 
-        if not auction_result:
-            raise HTTPException(status_code=500, detail="경매 생성에 실패했습니다.")
-
-        auction_id = auction_result["id"]
-
-        # 입찰 정보를 DB에 저장 (예산 예약과 함께 하나의 트랜잭션으로 처리)
-        successful_bids = []
-        for bid in bids:
-            # 광고주 ID가 BidResponse에 없으면 bid_id에서 추출 시도
-            if not bid.advertiserId and bid.id.startswith("bid_real_"):
-                try:
-                    parts = bid.id.split("_")
-                    if len(parts) >= 3:
-                        bid.advertiserId = int(parts[2])
-                except (ValueError, IndexError):
-                    pass
-
-            # 예산 예약 + bid 저장 (트랜잭션으로 원자적 처리)
-            success = await reserve_and_insert_bid(
-                auction_id, user_id if user_id else 1, bid
-            )
-            if success:
-                successful_bids.append(bid)
-            else:
-                logger.warning(
-                    "bid_insert_failed",
-                    bid_id=bid.id,
-                    advertiser_id=bid.advertiserId,
-                    reason="budget_insufficient_or_db_error",
-                )
 
-        # 최소한 하나의 bid라도 저장되어야 함 (없으면 플랫폼 폴백 처리)
-        if not successful_bids:
-            logger.error("no_bids_stored", auction_id=auction_id)
-            # 모든 입찰이 실패했을 경우 빈 리스트 반환 또는 플랫폼 폴백 재생성
-            bids = generate_platform_fallback_bids(request.query, request.valueScore)
-            for bid in bids:
-                await reserve_and_insert_bid(auction_id, user_id if user_id else 1, bid)
+# 여러 경매 행을 한 문장으로 생성
+BULK_INSERT_AUCTIONS_SQL = """
+    INSERT INTO auctions (search_id, query_text, user_id, status, expires_at, created_at)
+    SELECT a.search_id, a.query_text, :user_id, 'active', :expires_at, :created_at
+    FROM unnest(CAST(:search_ids AS text[]), CAST(:query_texts AS text[]))
+        AS a(search_id, query_text)
+    RETURNING id, search_id
+"""
 
-        # 성공적으로 저장된 bids만 반환 (또는 원본 bids - 클라이언트에는 모두 보여줌)
-        auction = AuctionResponse(
+
+async def persist_auctions_batch(
+    items: List[StartAuctionRequest],
+    user_id: Optional[int],
+    bids_list: List[List[BidResponse]],
+) -> List[AuctionResponse]:
+    """
+    persist_auction 의 배치 버전: 경매 행 INSERT 1회 + 예산 예약/bid 저장 1회
+    (모든 bid 가 실패한 경매만 플랫폼 폴백으로 한 번 더 저장)
+    """
+    now = _utc_naive()
+    expires_at = now + timedelta(minutes=30)  # 30분 후 만료
+    uid = user_id if user_id else 1
+
+    search_ids: List[str] = []
+    used = set()
+    for _ in items:
+        search_id = _new_search_id()
+        while search_id in used:
+            search_id = _new_search_id()
+        used.add(search_id)
+        search_ids.append(search_id)
+
+    rows = await database.fetch_all(
+        BULK_INSERT_AUCTIONS_SQL,
+        {
+            "search_ids": search_ids,
+            "query_texts": [item.query.strip() for item in items],
+            "user_id": uid,
+            "expires_at": expires_at,
+            "created_at": now,
+        },
+    )
+    auction_ids = {r["search_id"]: r["id"] for r in rows}
+    if len(auction_ids) != len(search_ids):
+        raise HTTPException(status_code=500, detail="경매 생성에 실패했습니다.")
+
+    for bids in bids_list:
+        _fill_advertiser_ids(bids)
+    groups = [(auction_ids[sid], bids) for sid, bids in zip(search_ids, bids_list)]
+    results = await reserve_and_insert_bid_groups(uid, groups)
+
+    # 저장된 bid 가 하나도 없는 경매는 플랫폼 폴백으로 대체
+    final_bids = list(bids_list)
+    fallback_groups = []
+    for i, (item, group_results) in enumerate(zip(items, results)):
+        if not any(group_results):
+            logger.error("no_bids_stored", auction_id=groups[i][0])
+            final_bids[i] = generate_platform_fallback_bids(item.query, item.valueScore)
+            fallback_groups.append((groups[i][0], final_bids[i]))
+    if fallback_groups:
+        await reserve_and_insert_bid_groups(uid, fallback_groups)
+
+    return [
+        AuctionResponse(
             searchId=search_id,
-            query=request.query.strip(),
-            bids=bids,  # 원본 bids 반환 (클라이언트 표시용)
+            query=item.query.strip(),
+            bids=bids,
             status="active",
             createdAt=now,
             expiresAt=expires_at,
         )
+        for search_id, item, bids in zip(search_ids, items, final_bids)
+    ]
 
-        return StartAuctionResponse(
-            success=True, data=auction, message="역경매가 성공적으로 시작되었습니다."
+
+@app.post("/start-batch", response_model=StartBatchResponse)
+async def start_auction_batch(
+    request: StartBatchRequest,
+    user_id: Optional[int] = Depends(get_user_id_from_token),
+):
+    """
+    여러 검색어의 역경매를 한 번에 시작합니다. (오프라인 평가/프리워밍 작업용, 게이트웨이 미노출)
+    매칭은 find_matching_advertisers_batch 로 한 번에 수행하고, 광고주 상세 조회와 저장도
+    전체 검색어에 대해 한 번씩만 실행합니다. 결과는 items 순서의 /start 응답 data 목록입니다.
+    """
+    log = logger.bind(service="auction-service")
+    items = request.items
+    if len(items) > START_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {START_BATCH_MAX_ITEMS}개까지 요청할 수 있습니다.",
+        )
+    if not items:
+        return StartBatchResponse(success=True, data=[], message="요청된 검색어가 없습니다.")
+
+    log.info("auction_batch_start", item_count=len(items), user_id=user_id)
+    try:
+        with stage_metrics.timer("batch_matching"):
+            matches_list = await find_matching_advertisers_batch(
+                [(item.query, item.valueScore) for item in items]
+            )
+
+        advertiser_ids = sorted(
+            {m["advertiser_id"] for matches in matches_list for m in matches}
+        )
+        info_map = (
+            await fetch_advertiser_details(advertiser_ids) if advertiser_ids else {}
         )
 
+        bids_list: List[List[BidResponse]] = []
+        for item, matches in zip(items, matches_list):
+            if matches:
+                bids = await _build_advertiser_bids(
+                    item.query, item.valueScore, matches, info_map
+                )
+            else:
+                bids = generate_platform_fallback_bids(item.query, item.valueScore)
+            await log_auto_bids(bids, item.query, item.valueScore)
+            bids_list.append(bids)
+
+        auctions = await persist_auctions_batch(items, user_id, bids_list)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error("auction_service_error", error=str(e), exc_info=True)
+        log.error("auction_batch_error", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}"
         )
 
+    return StartBatchResponse(
+        success=True,
+        data=auctions,
+        message=f"{len(auctions)}개의 역경매가 시작되었습니다.",
+    )
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 한 건 (data 는 한 줄 JSON)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.post("/start/stream")
+async def start_auction_stream(
+    request: StartAuctionRequest,
+    http_request: Request,
+    user_id: Optional[int] = Depends(get_user_id_from_token),
+):
+    """
+    /start 의 스트리밍 버전 (text/event-stream)
+    - bid      : 매칭/가격 계산이 끝난 입찰 (저장 전)
+    - complete : 경매/입찰 저장 완료. data 는 /start 응답과 같고 storedBidIds 로 실제 저장된 입찰을 알려줌
+                 (예산 부족으로 빠진 입찰은 storedBidIds 에 없음, 전부 실패하면 data.bids 가 폴백 입찰)
+    - error    : 처리 중 오류
+    """
+    log = logger.bind(service="auction-service")
+
+    # 레이트리밋 확인 (스트림 시작 전에 일반 HTTP 오류로 응답)
+    client_ip = http_request.client.host if http_request.client else "unknown"
+    if not await check_rate_limit(client_ip, request.query):
+        log.warning("rate_limit_exceeded", ip=client_ip, query=request.query)
+        raise HTTPException(
+            status_code=429,
+            detail="너무 많은 요청입니다. 잠시 후 다시 시도해주세요.",
+        )
+
+    log.info(
+        "auction_stream_start",
+        query=request.query,
+        query_length=len(request.query),
+        value_score=request.valueScore,
+        user_id=user_id,
+    )
+
+    async def events():
+        started = time.perf_counter()
+        try:
+            with stage_metrics.timer("reverse_auction"):
+                bids = await start_reverse_auction(request.query, request.valueScore)
+            for bid in bids:
+                yield _sse_event("bid", bid.model_dump(mode="json"))
+            stage_metrics.observe("stream_first_bids", time.perf_counter() - started)
+
+            auction, stored_bids = await persist_auction(
+                request.query, request.valueScore, user_id, bids
+            )
+            yield _sse_event(
+                "complete",
+                {
+                    "success": True,
+                    "data": auction.model_dump(mode="json"),
+                    "storedBidIds": [b.id for b in stored_bids],
+                    "message": "역경매가 성공적으로 시작되었습니다.",
+                },
+            )
+            stage_metrics.observe("stream_total", time.perf_counter() - started)
+        except Exception as e:
+            log.error("auction_stream_error", error=str(e), exc_info=True)
+            yield _sse_event(
+                "error", {"success": False, "message": "서버 오류가 발생했습니다."}
+            )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# 입찰 선택 (status 가 'active' 이고 expires_at 이 지나지 않은 경매만, 갱신된 행이 없으면 행 없음)
+# :now 는 expires_at 과 같은 tz 없는 UTC (sweeper 가 아직 처리하지 않았거나 꺼져 있어도 만료 판정)
+# 같은 문장에서 선택되지 않은 광고주 bid 의 예약 예산을 bid 생성일(KST) 기준으로 돌려줌
+# (만료 sweeper 의 EXPIRE_AUCTIONS_SQL 과 같은 환불 규칙, completed 경매는 sweeper 대상이 아님)
+SELECT_BID_UPDATE_SQL = """
+    WITH selected AS (
+        UPDATE auctions
+        SET selected_bid_id = :selected_bid_id, status = 'completed'
+        WHERE search_id = :search_id AND status = 'active' AND expires_at > :now
+        RETURNING id
+    ), released AS (
+        SELECT b.advertiser_id,
+               (timezone('Asia/Seoul', CAST(b.created_at AS timestamptz)))::date AS spend_date,
+               SUM(b.price) AS amount
+        FROM bids b
+        JOIN selected s ON s.id = b.auction_id
+        WHERE b.type = 'ADVERTISER'
+          AND b.id <> :selected_bid_id
+          AND b.advertiser_id IS NOT NULL
+          AND b.advertiser_id <> :platform_advertiser_id
+        GROUP BY 1, 2
+    ), refunded AS (
+        UPDATE advertiser_daily_spend d
+        SET amount = GREATEST(d.amount - r.amount, 0)
+        FROM released r
+        WHERE d.advertiser_id = r.advertiser_id AND d.spend_date = r.spend_date
+        RETURNING r.amount
+    )
+    SELECT s.id, (SELECT COALESCE(SUM(amount), 0) FROM refunded) AS released_amount
+    FROM selected s
+"""
+
 
 @app.post("/select", response_model=SelectBidResponse)
 async def select_bid(request: SelectBidRequest):
@@ -1231,28 +2480,47 @@ async def select_bid(request: SelectBidRequest):
         if not request.searchId or not request.selectedBidId:
             raise HTTPException(status_code=400, detail="유효하지 않은 요청입니다.")
 
-        # 경매 존재 확인 (DB에서 조회)
-        auction_query = "SELECT * FROM auctions WHERE search_id = :search_id"
-        auction = await database.fetch_one(
-            auction_query, {"search_id": request.searchId}
-        )
-
-        if not auction:
-            raise HTTPException(status_code=404, detail="경매를 찾을 수 없습니다.")
-
-        # 선택된 입찰 정보 업데이트
-        update_query = """
-            UPDATE auctions 
-            SET selected_bid_id = :selected_bid_id, status = 'completed'
-            WHERE search_id = :search_id
-        """
-        await database.execute(
-            update_query,
+        # 진행 중인 경매만 선택 처리 (만료 sweeper 가 이미 예산을 돌려준 경매는 제외)
+        now = _utc_naive()
+        updated = await database.fetch_one(
+            SELECT_BID_UPDATE_SQL,
             {
                 "selected_bid_id": request.selectedBidId,
                 "search_id": request.searchId,
+                "now": now,
+                "platform_advertiser_id": PLATFORM_ADVERTISER_ID,
             },
         )
+        if not updated:
+            auction = await database.fetch_one(
+                """
+                SELECT status, expires_at <= :now AS past_expiry
+                FROM auctions WHERE search_id = :search_id
+                """,
+                {"search_id": request.searchId, "now": now},
+            )
+            if not auction:
+                raise HTTPException(status_code=404, detail="경매를 찾을 수 없습니다.")
+            if auction["status"] == "expired" or (
+                auction["status"] == "active" and auction["past_expiry"]
+            ):
+                raise HTTPException(status_code=409, detail="만료된 경매입니다.")
+            raise HTTPException(status_code=409, detail="이미 선택이 완료된 경매입니다.")
+        if updated["released_amount"]:
+            logger.info(
+                "unselected_bids_released",
+                search_id=request.searchId,
+                released_amount=int(updated["released_amount"]),
+            )
+        known = _status_broker.current(request.searchId)
+        await publish_auction_status(
+            request.searchId,
+            _status_state(
+                "completed",
+                request.selectedBidId,
+                known[1]["participants"] if known else None,
+            ),
+        )
 
         # (시뮬레이션) 처리 지연
         await simulate_real_time_delay()
@@ -1270,33 +2538,66 @@ async def select_bid(request: SelectBidRequest):
             message="1차 보상이 지급되었습니다.",
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}"
         )
 
 
+# /status 응답에 필요한 컬럼만 조회 (bids.user_id / dest_url 은 응답에서 제외)
+AUCTION_STATUS_ROW_SQL = """
+    SELECT id, search_id, query_text, user_id, status, created_at, expires_at, selected_bid_id
+    FROM auctions
+    WHERE search_id = :search_id
+"""
+AUCTION_STATUS_BIDS_SQL = """
+    SELECT id, auction_id, buyer_name, price, bonus_description, landing_url,
+           type, advertiser_id, created_at
+    FROM bids
+    WHERE auction_id = :auction_id
+"""
+
+
 @app.get("/status/{search_id}", response_model=AuctionStatusResponse)
 async def get_auction_status(search_id: str):
     """경매 상태를 조회합니다."""
     try:
         # DB에서 경매 정보 조회
-        auction_query = "SELECT * FROM auctions WHERE search_id = :search_id"
-        auction = await database.fetch_one(auction_query, {"search_id": search_id})
+        auction = await database.fetch_one(AUCTION_STATUS_ROW_SQL, {"search_id": search_id})
 
         if not auction:
             raise HTTPException(status_code=404, detail="경매를 찾을 수 없습니다.")
 
         # 입찰 정보 조회
-        bids_query = "SELECT * FROM bids WHERE auction_id = :auction_id"
-        bids = await database.fetch_all(bids_query, {"auction_id": auction["id"]})
+        bids = await database.fetch_all(
+            AUCTION_STATUS_BIDS_SQL, {"auction_id": auction["id"]}
+        )
 
-        status_update = await simulate_auction_update(search_id)
+        # 조회한 상태를 broker 에도 반영 (변경 대기는 /status/{search_id}/wait, /events 사용)
+        auction_row = dict(auction)
+        _status_broker.publish(
+            search_id,
+            _status_state(
+                auction_row.get("status") or "active",
+                auction_row.get("selected_bid_id"),
+                len(bids),
+            ),
+        )
+        status_update = _status_broker.current(search_id)[1]
 
-        return AuctionStatusResponse(
-            success=True,
-            data={"auction": auction, "bids": bids, "status": status_update},
-            message="경매 상태 조회가 완료되었습니다.",
+        # 행 dict 를 그대로 직렬화 (response_model 검증/jsonable_encoder 단계 생략, 형식은 같음)
+        return FastJSONResponse(
+            {
+                "success": True,
+                "data": {
+                    "auction": auction_row,
+                    "bids": [dict(b) for b in bids],
+                    "status": status_update,
+                },
+                "message": "경매 상태 조회가 완료되었습니다.",
+            }
         )
 
     except Exception as e:
@@ -1305,28 +2606,103 @@ async def get_auction_status(search_id: str):
         )
 
 
+@app.get("/status/{search_id}/wait")
+async def wait_auction_status(
+    search_id: str,
+    since: Optional[str] = None,
+    timeout: float = STATUS_LONG_POLL_TIMEOUT,
+):
+    """
+    경매 상태 long-poll
+    since(이전 응답의 data.version)와 현재 상태가 다르면 즉시, 같으면 바뀌는 즉시 응답합니다.
+    timeout 초(최대 AUCTION_STATUS_LONG_POLL_TIMEOUT) 동안 바뀌지 않으면 changed=false 로 응답하며
+    클라이언트는 같은 since 로 다시 요청하면 됩니다.
+    """
+    state = await load_auction_status(search_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="경매를 찾을 수 없습니다.")
+
+    timeout = min(max(timeout, 0.0), STATUS_LONG_POLL_TIMEOUT)
+    changed = state["version"] != since
+    if not changed and state["status"] not in TERMINAL_STATUSES:
+        with stage_metrics.timer("status_long_poll"):
+            updated = await _status_broker.wait_for_change(search_id, since, timeout)
+        if updated is not None:
+            state, changed = updated, True
+
+    return {
+        "success": True,
+        "changed": changed,
+        "data": state,
+        "message": "경매 상태 조회가 완료되었습니다.",
+    }
+
+
+@app.get("/status/{search_id}/events")
+async def stream_auction_status(search_id: str, http_request: Request):
+    """
+    경매 상태 SSE (text/event-stream)
+    - status : 연결 직후 현재 상태, 이후 상태가 바뀔 때마다 (data.version 으로 구분)
+    종료 상태(completed / expired)를 보내면 스트림을 닫습니다.
+    keep-alive 주기마다 DB 상태를 다시 확인하므로 다른 워커의 알림이 유실돼도 따라잡습니다.
+    """
+    state = await load_auction_status(search_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="경매를 찾을 수 없습니다.")
+
+    async def events():
+        current = state
+        yield _sse_event("status", current)
+        while current["status"] not in TERMINAL_STATUSES:
+            if await http_request.is_disconnected():
+                return
+            updated = await _status_broker.wait_for_change(
+                search_id, current["version"], STATUS_STREAM_KEEPALIVE
+            )
+            if updated is None:
+                yield ": keep-alive\n\n"
+                updated = await load_auction_status(search_id)
+                if updated is None or updated["version"] == current["version"]:
+                    continue
+            current = updated
+            yield _sse_event("status", current)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/bid/{bid_id}")
 async def get_bid_info(bid_id: str):
     """특정 입찰 정보를 조회합니다."""
     try:
-        # DB에서 입찰 정보 조회
-        bid_query = "SELECT * FROM bids WHERE id = :bid_id"
+        # DB에서 입찰 정보 조회 (응답 필드만)
+        bid_query = """
+            SELECT id, auction_id, buyer_name, price, bonus_description,
+                   landing_url, advertiser_id, type
+            FROM bids
+            WHERE id = :bid_id
+        """
         bid = await database.fetch_one(bid_query, {"bid_id": bid_id})
 
         if not bid:
             raise HTTPException(status_code=404, detail="입찰 정보를 찾을 수 없습니다.")
 
         row = dict(bid)
-        return {
-            "id": row.get("id"),
-            "auction_id": row.get("auction_id"),
-            "buyer_name": row.get("buyer_name"),
-            "price": row.get("price"),
-            "bonus_description": row.get("bonus_description"),
-            "landing_url": row.get("landing_url"),
-            "advertiser_id": row.get("advertiser_id"),
-            "type": row.get("type"),
-        }
+        return FastJSONResponse(
+            {
+                "id": row.get("id"),
+                "auction_id": row.get("auction_id"),
+                "buyer_name": row.get("buyer_name"),
+                "price": row.get("price"),
+                "bonus_description": row.get("bonus_description"),
+                "landing_url": row.get("landing_url"),
+                "advertiser_id": row.get("advertiser_id"),
+                "type": row.get("type"),
+            }
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -1367,57 +2743,189 @@ async def health_check():
     return {"status": "healthy", "service": "auction-service", "database": "connected"}
 
 
-@app.get("/system-status")
-async def get_system_status():
-    """실제 광고주 매칭 시스템 상태 확인 (성능 모니터링 포함)"""
-    start_time = time.time()
+# 단계별 집계를 (단계, 통계) 당 한 행으로 저장
+STAGE_METRICS_ROLLUP_SQL = """
+    INSERT INTO auction_performance_metrics
+        (metric_name, metric_value, measurement_time, additional_data)
+    SELECT m.metric_name, m.metric_value, NOW(), CAST(m.additional_data AS jsonb)
+    FROM unnest(
+        CAST(:metric_names AS text[]),
+        CAST(:metric_values AS double precision[]),
+        CAST(:additional_data AS text[])
+    ) AS m(metric_name, metric_value, additional_data)
+"""
+
+
+async def rollup_stage_metrics() -> int:
+    """마지막 롤업 이후의 단계별 p50/p95/p99/평균을 저장하고 저장한 행 수를 반환"""
+    rollup = stage_metrics.drain_rollup()
+    names: List[str] = []
+    values: List[float] = []
+    extra: List[str] = []
+    for stage, stats in rollup.items():
+        data = json.dumps(
+            {"count": stats["count"], "max_ms": stats["max_ms"], "pid": os.getpid()}
+        )
+        for stat in ("p50_ms", "p95_ms", "p99_ms", "avg_ms"):
+            names.append(f"stage.{stage}.{stat}")
+            values.append(stats[stat])
+            extra.append(data)
+    if not names:
+        return 0
     try:
-        # DB 응답 시간 측정 (p95/p99 계산을 위한 샘플)
-        db_start = time.time()
-        advertiser_count_query = """
-            SELECT COUNT(*) as count
+        await database.execute(
+            STAGE_METRICS_ROLLUP_SQL,
+            {"metric_names": names, "metric_values": values, "additional_data": extra},
+        )
+    except Exception as e:
+        logger.warning("stage_metrics_rollup_failed", error=str(e))
+        return 0
+    return len(names)
+
+
+async def _metrics_rollup_loop() -> None:
+    while True:
+        await asyncio.sleep(METRICS_ROLLUP_INTERVAL)
+        await rollup_stage_metrics()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus 텍스트 포맷 단계별 지연 시간 히스토그램 (워커 단위)"""
+    writers = {w.name: w for w in (_bid_writer, _auto_bid_log_writer) if w is not None}
+    return PlainTextResponse(
+        stage_metrics.render_prometheus()
+        + render_counter(
+            "auction_batch_writer_dropped_rows_total",
+            "Rows dropped because the batch writer queue stayed full",
+            "writer",
+            {name: w.dropped for name, w in writers.items()},
+        )
+        + render_counter(
+            "auction_batch_writer_rows_total",
+            "Rows written by the batch writer",
+            "writer",
+            {name: w.rows for name, w in writers.items()},
+        ),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+# /system-status 집계 (한 번의 왕복으로 조회)
+SYSTEM_STATISTICS_SQL = """
+    SELECT
+        (
+            SELECT COUNT(*)
             FROM advertisers a
             JOIN auto_bid_settings abs ON a.id = abs.advertiser_id
             WHERE abs.is_enabled = true
-        """
-        advertiser_count = await database.fetch_one(advertiser_count_query)
-        db_response_time = (time.time() - db_start) * 1000  # ms
-
-        approved_count_query = """
-            SELECT COUNT(*) as count
+        ) AS total_advertisers,
+        (
+            SELECT COUNT(*)
             FROM advertisers a
             JOIN advertiser_reviews ar ON a.id = ar.advertiser_id
             JOIN auto_bid_settings abs ON a.id = abs.advertiser_id
             WHERE ar.review_status = 'approved' AND abs.is_enabled = true
-        """
-        approved_count = await database.fetch_one(approved_count_query)
+        ) AS approved_advertisers,
+        (SELECT COUNT(*) FROM advertiser_keywords) AS registered_keywords,
+        (SELECT COUNT(*) FROM advertiser_categories) AS registered_categories,
+        b.total_bids,
+        b.avg_bid_price,
+        b.advertiser_bids,
+        b.platform_bids,
+        (
+            SELECT AVG(match_score)
+            FROM auto_bid_logs
+            WHERE created_at >= NOW() - INTERVAL '1 hour'
+              AND advertiser_id IS NOT NULL
+        ) AS avg_match_score
+    FROM (
+        SELECT
+            COUNT(*) as total_bids,
+            AVG(price) as avg_bid_price,
+            SUM(CASE WHEN type = 'ADVERTISER' THEN 1 ELSE 0 END) as advertiser_bids,
+            SUM(CASE WHEN type = 'PLATFORM' THEN 1 ELSE 0 END) as platform_bids
+        FROM bids
+        WHERE created_at >= NOW() - INTERVAL '1 hour'
+    ) b
+"""
 
-        keyword_count_query = "SELECT COUNT(*) as count FROM advertiser_keywords"
-        keyword_count = await database.fetch_one(keyword_count_query)
+# 백그라운드 태스크가 주기적으로 갱신하는 집계 스냅샷 (요청마다 집계 쿼리를 실행하지 않음)
+_system_status_snapshot: Optional[Dict[str, Any]] = None
+_system_status_refreshed_at = 0.0  # time.monotonic()
+_system_status_last_error: Optional[str] = None
+_system_status_lock = asyncio.Lock()
 
-        category_count_query = "SELECT COUNT(*) as count FROM advertiser_categories"
-        category_count = await database.fetch_one(category_count_query)
 
-        # 최근 1시간 입찰 통계
-        recent_bids_query = """
-            SELECT 
-                COUNT(*) as total_bids,
-                AVG(price) as avg_bid_price,
-                SUM(CASE WHEN type = 'ADVERTISER' THEN 1 ELSE 0 END) as advertiser_bids,
-                SUM(CASE WHEN type = 'PLATFORM' THEN 1 ELSE 0 END) as platform_bids
-            FROM bids
-            WHERE created_at >= NOW() - INTERVAL '1 hour'
-        """
-        recent_bids_stats = await database.fetch_one(recent_bids_query)
+async def refresh_system_status_snapshot() -> Dict[str, Any]:
+    """집계 쿼리를 실행해 스냅샷을 갱신 (동시 갱신 요청은 하나로 합침)"""
+    global _system_status_snapshot, _system_status_refreshed_at, _system_status_last_error
+    requested_at = time.monotonic()
+    async with _system_status_lock:
+        if (
+            _system_status_snapshot is not None
+            and _system_status_refreshed_at >= requested_at
+        ):
+            return _system_status_snapshot
+        db_start = time.time()
+        try:
+            row = await database.fetch_one(SYSTEM_STATISTICS_SQL)
+        except Exception as e:
+            _system_status_last_error = str(e)
+            raise
+        db_response_time = (time.time() - db_start) * 1000  # ms
+
+        stats = dict(row) if row else {}
+        _system_status_snapshot = {
+            "taken_at": _utc_naive().isoformat(),
+            "db_response_time_ms": round(db_response_time, 2),
+            "statistics": {
+                "total_advertisers": stats.get("total_advertisers") or 0,
+                "approved_advertisers": stats.get("approved_advertisers") or 0,
+                "registered_keywords": stats.get("registered_keywords") or 0,
+                "registered_categories": stats.get("registered_categories") or 0,
+            },
+            "recent_bids_last_hour": {
+                "total": stats.get("total_bids") or 0,
+                "avg_price": round(float(stats.get("avg_bid_price") or 0), 2),
+                "advertiser_bids": stats.get("advertiser_bids") or 0,
+                "platform_bids": stats.get("platform_bids") or 0,
+            },
+            "matching_performance": {
+                "avg_match_score": round(float(stats.get("avg_match_score") or 0), 3),
+            },
+        }
+        _system_status_refreshed_at = time.monotonic()
+        _system_status_last_error = None
+        return _system_status_snapshot
 
-        # 실제 광고주 매칭 성능 (최근 평균)
-        matching_perf_query = """
-            SELECT AVG(match_score) as avg_match_score
-            FROM auto_bid_logs
-            WHERE created_at >= NOW() - INTERVAL '1 hour'
-              AND advertiser_id IS NOT NULL
-        """
-        matching_perf = await database.fetch_one(matching_perf_query)
+
+async def _system_status_refresh_loop() -> None:
+    while True:
+        try:
+            await refresh_system_status_snapshot()
+        except Exception as e:
+            logger.warning("system_status_refresh_failed", error=str(e))
+        await asyncio.sleep(max(SYSTEM_STATUS_REFRESH_INTERVAL, 1.0))
+
+
+@app.get("/system-status")
+async def get_system_status(fresh: bool = False):
+    """
+    실제 광고주 매칭 시스템 상태 확인 (성능 모니터링 포함)
+    DB 집계는 백그라운드 스냅샷을 사용하며 snapshot.age_seconds 로 경과 시간을 알려줍니다.
+    ?fresh=1 이면 응답 전에 스냅샷을 갱신합니다.
+    """
+    start_time = time.time()
+    try:
+        snapshot = _system_status_snapshot
+        if fresh or snapshot is None:
+            try:
+                snapshot = await refresh_system_status_snapshot()
+            except Exception:
+                # 이전 스냅샷이 있으면 오래된 값이라도 반환
+                if snapshot is None:
+                    raise
 
         total_time = (time.time() - start_time) * 1000  # ms
 
@@ -1425,44 +2933,59 @@ async def get_system_status():
             "status": "operational",
             "service": "auction-service",
             "real_advertiser_matching": "enabled",
-            "statistics": {
-                "total_advertisers": (
-                    advertiser_count["count"] if advertiser_count else 0
-                ),
-                "approved_advertisers": (
-                    approved_count["count"] if approved_count else 0
-                ),
-                "registered_keywords": keyword_count["count"] if keyword_count else 0,
-                "registered_categories": (
-                    category_count["count"] if category_count else 0
-                ),
+            "snapshot": {
+                "taken_at": snapshot["taken_at"],
+                "age_seconds": round(time.monotonic() - _system_status_refreshed_at, 3),
+                "refresh_interval_seconds": SYSTEM_STATUS_REFRESH_INTERVAL,
+                "last_error": _system_status_last_error,
             },
+            "statistics": snapshot["statistics"],
             "performance": {
-                "db_response_time_ms": round(db_response_time, 2),
+                "db_response_time_ms": snapshot["db_response_time_ms"],
+                # 최근 요청 기준 단계별 p50/p95/p99 (이 워커)
+                "stage_latency_ms": stage_metrics.summary(),
                 "api_response_time_ms": round(total_time, 2),
-                "recent_bids_last_hour": {
-                    "total": (
-                        recent_bids_stats["total_bids"] if recent_bids_stats else 0
-                    ),
-                    "avg_price": (
-                        round(float(recent_bids_stats["avg_bid_price"] or 0), 2)
-                        if recent_bids_stats
-                        else 0
-                    ),
-                    "advertiser_bids": (
-                        recent_bids_stats["advertiser_bids"] if recent_bids_stats else 0
-                    ),
-                    "platform_bids": (
-                        recent_bids_stats["platform_bids"] if recent_bids_stats else 0
-                    ),
-                },
-                "matching_performance": {
-                    "avg_match_score": (
-                        round(float(matching_perf["avg_match_score"] or 0), 3)
-                        if matching_perf
-                        else 0
+                "recent_bids_last_hour": snapshot["recent_bids_last_hour"],
+                "matching_performance": snapshot["matching_performance"],
+                "prepared_statements": _prepared_statements.stats(),
+                "match_cache": (
+                    _match_cache.stats() if _match_cache is not None else None
+                ),
+                "token_cache": _build_tokens_cached.cache_info()._asdict(),
+                "json_serializer": json_backend(),
+                "profile_cache": (
+                    _profile_cache.stats() if _profile_cache is not None else None
+                ),
+                "budget_ledger": (
+                    _budget_ledger.stats() if _budget_ledger is not None else None
+                ),
+                "bid_writer": (
+                    _bid_writer.stats() if _bid_writer is not None else None
+                ),
+                "auction_status": {
+                    **_status_broker.stats(),
+                    "listener": (
+                        _status_listener.stats()
+                        if _status_listener is not None
+                        else None
                     ),
                 },
+                "expiry_sweeper": (
+                    _expiry_sweeper.stats() if _expiry_sweeper is not None else None
+                ),
+                "rate_limit": (
+                    _shared_rate_limiter.stats()
+                    if _shared_rate_limiter is not None
+                    else _rate_limiter.stats()
+                ),
+                "auto_bid_log_writer": (
+                    _auto_bid_log_writer.stats()
+                    if _auto_bid_log_writer is not None
+                    else None
+                ),
+            },
+            "schema": {
+                "auto_bid_logs": auto_bid_logs_schema_version(),
             },
             "features": {
                 "real_advertiser_matching": True,
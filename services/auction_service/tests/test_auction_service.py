@@ -4,18 +4,27 @@ auction_service의 핵심 기능에 대한 포괄적인 pytest 테스트 스위
 - 트랜잭션 로직 단위 테스트
 - API 엔드포인트 통합 테스트
 """
+import json
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch, ANY
 from datetime import datetime, timezone
 
+from services.auction_service.utils.batch_writer import BatchWriter
+
 # main.py에서 필요한 함수들 임포트
 from services.auction_service.main import (
     _validate_url,
     get_user_id_from_token,
-    _reserve_budget_tx,
-    reserve_and_insert_bid,
+    _reserve_budgets_tx,
+    reserve_and_insert_bids,
+    log_auto_bids,
+    write_auto_bid_logs,
+    detect_auto_bid_logs_schema,
+    auto_bid_logs_schema_version,
     BidResponse,
     StartAuctionRequest,
+    START_BATCH_MAX_ITEMS,
+    app,
     security,
 )
 
@@ -102,158 +111,200 @@ async def test_get_user_id_from_token_no_credentials():
 # ========================================
 
 @pytest.mark.asyncio
-async def test_reserve_budget_tx_success(mocker):
-    """예산이 충분할 때 성공"""
-    # Mock DB calls
-    mock_execute = AsyncMock()
-    mocker.patch("services.auction_service.main.database.fetch_one", new_callable=AsyncMock, side_effect=[
-        {"amount": 10000},  # 현재 지출액
-        {"daily_budget": 50000}  # 일일 예산
-    ])
-    mocker.patch("services.auction_service.main.database.execute", new=mock_execute)
-    
-    bid_amount = 5000
-    result = await _reserve_budget_tx(advertiser_id=1, bid_amount=bid_amount)
-    
-    assert result is True
-    # UPDATE 쿼리가 호출되었는지 확인
-    assert mock_execute.called
+async def test_reserve_budgets_tx_returns_reserved_advertisers(mocker):
+    """광고주별 금액을 advertiser_id 순서로 한 문장에 예약하고, 예약된 광고주만 반환"""
+    mock_fetch_all = mocker.patch(
+        "services.auction_service.main.database.fetch_all",
+        new_callable=AsyncMock,
+        return_value=[{"advertiser_id": 1}],
+    )
 
+    result = await _reserve_budgets_tx({2: 3000, 1: 5000})
 
-@pytest.mark.asyncio
-async def test_reserve_budget_tx_fail_insufficient(mocker):
-    """예산이 부족할 때 실패"""
-    mock_execute = AsyncMock()
-    mocker.patch("services.auction_service.main.database.fetch_one", new_callable=AsyncMock, side_effect=[
-        {"amount": 48000},  # 현재 지출액
-        {"daily_budget": 50000}  # 일일 예산
-    ])
-    mocker.patch("services.auction_service.main.database.execute", new=mock_execute)
-    
-    bid_amount = 3000  # 48000 + 3000 > 50000
-    result = await _reserve_budget_tx(advertiser_id=1, bid_amount=bid_amount)
-    
-    assert result is False
-    # UPDATE 쿼리가 호출되지 않았는지 확인
-    assert not mock_execute.called
+    assert result == {1}
+    mock_fetch_all.assert_awaited_once_with(
+        ANY, {"advertiser_ids": [1, 2], "amounts": [5000, 3000]}
+    )
 
 
 @pytest.mark.asyncio
-async def test_reserve_budget_tx_new_advertiser(mocker):
-    """당일 첫 지출이라 레코드가 없을 때 (INSERT + UPDATE)"""
-    mock_execute = AsyncMock()
-    mocker.patch("services.auction_service.main.database.fetch_one", new_callable=AsyncMock, side_effect=[
-        None,  # 1. 첫 SELECT (FOR UPDATE) -> 없음
-        {"amount": 0},  # 2. 두 번째 SELECT (FOR UPDATE) -> 0
-        {"daily_budget": 50000}  # 3. 예산 조회
-    ])
-    mocker.patch("services.auction_service.main.database.execute", new=mock_execute)
-    
-    bid_amount = 5000
-    result = await _reserve_budget_tx(advertiser_id=2, bid_amount=bid_amount)
-    
-    assert result is True
-    # 1. INSERT, 2. UPDATE 총 2번 호출
-    assert mock_execute.call_count == 2
+async def test_reserve_budgets_tx_skips_query_without_amounts(mocker):
+    """예약할 광고주가 없으면 DB 를 호출하지 않음"""
+    mock_fetch_all = mocker.patch(
+        "services.auction_service.main.database.fetch_all", new_callable=AsyncMock
+    )
 
-
-@pytest.mark.asyncio
-async def test_reserve_budget_tx_no_budget_setting(mocker):
-    """예산 설정이 없을 때 실패"""
-    mocker.patch("services.auction_service.main.database.fetch_one", new_callable=AsyncMock, side_effect=[
-        {"amount": 10000},
-        None  # 예산 설정 없음
-    ])
-    
-    bid_amount = 5000
-    result = await _reserve_budget_tx(advertiser_id=1, bid_amount=bid_amount)
-    
-    assert result is False
+    assert await _reserve_budgets_tx({}) == set()
+    assert not mock_fetch_all.called
 
 
-@pytest.mark.asyncio
-async def test_reserve_and_insert_bid_success(mocker):
-    """예산 예약과 bid 저장 성공"""
-    # database.transaction을 AsyncContextManager로 모킹
-    mock_transaction = AsyncMock()
-    mock_transaction.__aenter__ = AsyncMock()
-    mock_transaction.__aexit__ = AsyncMock(return_value=False)
-    
-    mocker.patch("services.auction_service.main.database.transaction", return_value=mock_transaction)
-    mocker.patch("services.auction_service.main._reserve_budget_tx", return_value=True)
-    mocker.patch("services.auction_service.main.database.execute", new_callable=AsyncMock)
-    
-    bid = BidResponse(
-        id="bid_real_1_123456",
+def _make_bid(bid_id, price, advertiser_id):
+    return BidResponse(
+        id=bid_id,
         buyerName="Test Ad",
-        price=1000,
+        price=price,
         bonus="Test Bonus",
         timestamp=datetime.now(timezone.utc),
         landingUrl="https://good.com",
         clickUrl="http://signed.url",
-        advertiserId=1
+        advertiserId=advertiser_id,
     )
-    
-    result = await reserve_and_insert_bid(auction_id=100, user_id=123, bid=bid)
-    
-    assert result is True
 
 
-@pytest.mark.asyncio
-async def test_reserve_and_insert_bid_budget_fail(mocker):
-    """예산 부족으로 실패"""
+def _mock_transaction(mocker):
     mock_transaction = AsyncMock()
     mock_transaction.__aenter__ = AsyncMock()
     mock_transaction.__aexit__ = AsyncMock(return_value=False)
-    
     mocker.patch("services.auction_service.main.database.transaction", return_value=mock_transaction)
-    mocker.patch("services.auction_service.main._reserve_budget_tx", return_value=False)
+
+
+@pytest.mark.asyncio
+async def test_reserve_and_insert_bids_single_bid_success(mocker):
+    """예산 예약과 bid 저장 성공"""
+    _mock_transaction(mocker)
+    mocker.patch(
+        "services.auction_service.main.database.fetch_all",
+        new_callable=AsyncMock,
+        return_value=[{"advertiser_id": 11}],
+    )
+    mock_execute = mocker.patch("services.auction_service.main.database.execute", new_callable=AsyncMock)
+
+    result = await reserve_and_insert_bids(
+        auction_id=100, user_id=123, bids=[_make_bid("bid_real_11_123456", 1000, 11)]
+    )
+
+    assert result == [True]
+    assert mock_execute.await_args.args[1]["ids"] == ["bid_real_11_123456"]
+
+
+@pytest.mark.asyncio
+async def test_reserve_and_insert_bids_budget_fail(mocker):
+    """예산 부족으로 실패하면 bid 를 저장하지 않음"""
+    _mock_transaction(mocker)
+    mocker.patch(
+        "services.auction_service.main.database.fetch_all",
+        new_callable=AsyncMock,
+        return_value=[],
+    )
+    mock_execute = mocker.patch("services.auction_service.main.database.execute", new_callable=AsyncMock)
+
+    result = await reserve_and_insert_bids(
+        auction_id=100, user_id=123, bids=[_make_bid("bid_real_11_123456", 1000, 11)]
+    )
+
+    assert result == [False]
+    assert not mock_execute.called
+
+
+@pytest.mark.asyncio
+async def test_reserve_and_insert_bids_platform_bid(mocker):
+    """플랫폼 입찰은 예산 검사 스킵"""
+    _mock_transaction(mocker)
+    mock_fetch_all = mocker.patch(
+        "services.auction_service.main.database.fetch_all", new_callable=AsyncMock
+    )
     mocker.patch("services.auction_service.main.database.execute", new_callable=AsyncMock)
-    
+
+    result = await reserve_and_insert_bids(
+        auction_id=100, user_id=123, bids=[_make_bid("platform_bid_coupang_123", 200, None)]
+    )
+
+    assert result == [True]
+    # 예산 예약 쿼리가 호출되지 않았는지 확인
+    assert not mock_fetch_all.called
+
+
+@pytest.mark.asyncio
+async def test_reserve_and_insert_bids_batch(mocker):
+    """광고주별 합계로 한 번에 예산 예약, 실패한 광고주의 bid 만 제외"""
+    _mock_transaction(mocker)
+    mock_fetch_all = mocker.patch(
+        "services.auction_service.main.database.fetch_all",
+        new_callable=AsyncMock,
+        return_value=[{"advertiser_id": 11}],
+    )
+    mock_execute = mocker.patch("services.auction_service.main.database.execute", new_callable=AsyncMock)
+
+    bids = [
+        _make_bid("bid_real_12_1", 700, 12),
+        _make_bid("bid_real_11_1", 1000, 11),
+        _make_bid("bid_real_11_2", 500, 11),
+        _make_bid("platform_bid_coupang_1", 200, None),
+    ]
+
+    result = await reserve_and_insert_bids(auction_id=100, user_id=123, bids=bids)
+
+    assert result == [False, True, True, True]
+    mock_fetch_all.assert_awaited_once_with(
+        ANY, {"advertiser_ids": [11, 12], "amounts": [1500, 700]}
+    )
+    mock_execute.assert_awaited_once()
+    inserted = mock_execute.await_args.args[1]
+    assert inserted["ids"] == ["bid_real_11_1", "bid_real_11_2", "platform_bid_coupang_1"]
+    assert inserted["types"] == ["ADVERTISER", "ADVERTISER", "PLATFORM"]
+
+
+@pytest.mark.asyncio
+async def test_log_auto_bids_is_queued_and_written_in_one_statement(mocker):
+    """자동 입찰 로그는 큐에만 넣고, writer 가 여러 경매의 행을 한 번에 기록"""
+    mock_execute = mocker.patch("services.auction_service.main.database.execute", new_callable=AsyncMock)
+    writer = BatchWriter(write_auto_bid_logs, name="auto_bid_logs", window=60)
+    mocker.patch("services.auction_service.main._auto_bid_log_writer", writer)
+
     bid = BidResponse(
-        id="bid_real_1_123456",
+        id="bid_real_11_1",
         buyerName="Test Ad",
-        price=1000,
+        price=700,
         bonus="Test Bonus",
         timestamp=datetime.now(timezone.utc),
         landingUrl="https://good.com",
         clickUrl="http://signed.url",
-        advertiserId=1
+        advertiserId=11,
+        reasons=["KW_EXACT:항공권"],
     )
-    
-    result = await reserve_and_insert_bid(auction_id=100, user_id=123, bid=bid)
-    
-    assert result is False
+    await log_auto_bids([bid], "항공권", 80)
+    await log_auto_bids([bid, bid], "제주 항공권", 60)
+    mock_execute.assert_not_awaited()
+
+    await writer.stop()
+
+    mock_execute.assert_awaited_once()
+    written = mock_execute.await_args.args[1]
+    assert written["search_queries"] == ["항공권", "제주 항공권", "제주 항공권"]
+    assert written["competitor_counts"] == [1, 2, 2]
+    assert [json.loads(r) for r in written["reasons"]] == [["KW_EXACT:항공권"]] * 3
 
 
 @pytest.mark.asyncio
-async def test_reserve_and_insert_bid_platform_bid(mocker):
-    """플랫폼 입찰은 예산 검사 스킵"""
-    mock_transaction = AsyncMock()
-    mock_transaction.__aenter__ = AsyncMock()
-    mock_transaction.__aexit__ = AsyncMock(return_value=False)
-    
-    mock_reserve_budget = AsyncMock()
-    mocker.patch("services.auction_service.main.database.transaction", return_value=mock_transaction)
-    mocker.patch("services.auction_service.main._reserve_budget_tx", new=mock_reserve_budget)
-    mocker.patch("services.auction_service.main.database.execute", new_callable=AsyncMock)
-    
-    bid = BidResponse(
-        id="platform_bid_coupang_123",
-        buyerName="Coupang",
-        price=200,
-        bonus="로켓배송",
-        timestamp=datetime.now(timezone.utc),
-        landingUrl="https://coupang.com",
-        clickUrl="http://signed.url",
-        advertiserId=None
+async def test_write_auto_bid_logs_uses_detected_legacy_schema(mocker):
+    """시작 시 reasons 컬럼이 없다고 감지되면 예외 폴백 없이 구버전 INSERT 한 번만 실행"""
+    mocker.patch(
+        "services.auction_service.main.database.fetch_one",
+        new_callable=AsyncMock,
+        return_value={"ok": False},
     )
-    
-    result = await reserve_and_insert_bid(auction_id=100, user_id=123, bid=bid)
-    
-    assert result is True
-    # _reserve_budget_tx가 호출되지 않았는지 확인
-    assert not mock_reserve_budget.called
+    mock_execute = mocker.patch("services.auction_service.main.database.execute", new_callable=AsyncMock)
+    mocker.patch("services.auction_service.main._auto_bid_logs_has_reasons", None)
+
+    assert await detect_auto_bid_logs_schema() is False
+    assert auto_bid_logs_schema_version() == "legacy"
+
+    row = {
+        "advertiser_id": 11,
+        "search_query": "항공권",
+        "match_type": "complex",
+        "match_score": 1.0,
+        "bid_amount": 700,
+        "bid_result": "won",
+        "quality_score": 80,
+        "competitor_count": 1,
+        "created_at": datetime(2025, 1, 1),
+        "reasons": "[]",
+    }
+    await write_auto_bid_logs([row])
+
+    mock_execute.assert_awaited_once()
+    assert "reasons" not in mock_execute.await_args.args[1]
 
 
 # ========================================
@@ -285,8 +336,8 @@ async def test_start_auction_happy_path(client, mocker):
         {"id": 99}  # 새 auction ID
     ])
     
-    # Mock reserve_and_insert_bid
-    mocker.patch("services.auction_service.main.reserve_and_insert_bid", return_value=True)
+    # Mock reserve_and_insert_bids
+    mocker.patch("services.auction_service.main.reserve_and_insert_bids", return_value=[True])
     mocker.patch("services.auction_service.main.log_auto_bids", new_callable=AsyncMock)
     
     # API Call
@@ -341,9 +392,9 @@ async def test_start_auction_all_bids_fail_fallback(client, mocker):
         {"id": 100}
     ])
     
-    # Mock reserve_and_insert_bid - 첫 번째는 실패, generate_platform_fallback_bids가 호출되면 성공
-    reserve_mock = mocker.patch("services.auction_service.main.reserve_and_insert_bid")
-    reserve_mock.side_effect = [False, True]  # real bid 실패, platform bid 성공
+    # Mock reserve_and_insert_bids - 첫 번째는 실패, generate_platform_fallback_bids가 호출되면 성공
+    reserve_mock = mocker.patch("services.auction_service.main.reserve_and_insert_bids")
+    reserve_mock.side_effect = [[False], [True]]  # real bid 실패, platform bid 성공
     
     # Mock generate_platform_fallback_bids
     mock_platform_bid = BidResponse(
@@ -378,7 +429,7 @@ async def test_select_bid_success(client, mocker):
     """/select API 테스트 (성공)"""
     # Mock auction 조회
     mocker.patch("services.auction_service.main.database.fetch_one", new_callable=AsyncMock, side_effect=[
-        {"id": 1, "search_id": "search_123", "status": "active"}
+        {"id": 1, "released_amount": 0}
     ])
     mocker.patch("services.auction_service.main.database.execute", new_callable=AsyncMock)
     mocker.patch("services.auction_service.main.simulate_real_time_delay", new_callable=AsyncMock)
@@ -432,13 +483,12 @@ async def test_get_auction_status_success(client, mocker):
     """/status/{search_id} API 테스트 (성공)"""
     # Mock auction과 bids 조회
     mocker.patch("services.auction_service.main.database.fetch_one", new_callable=AsyncMock, side_effect=[
-        {"id": 1, "search_id": "search_123", "status": "active"}
+        {"id": 1, "released_amount": 0}
     ])
     mocker.patch("services.auction_service.main.database.fetch_all", new_callable=AsyncMock, return_value=[
         {"id": "bid_1", "auction_id": 1, "price": 1000},
         {"id": "bid_2", "auction_id": 1, "price": 2000}
     ])
-    mocker.patch("services.auction_service.main.simulate_auction_update", new_callable=AsyncMock, return_value={"status": "active", "participants": 2})
     
     response = await client.get("/status/search_123")
     
@@ -446,6 +496,8 @@ async def test_get_auction_status_success(client, mocker):
     data = response.json()
     assert data["success"] is True
     assert len(data["data"]["bids"]) == 2
+    assert data["data"]["status"]["status"] == "active"
+    assert data["data"]["status"]["participants"] == 2
 
 
 @pytest.mark.asyncio
@@ -499,3 +551,127 @@ async def test_get_bid_info_not_found(client, mocker):
     
     assert response.status_code == 404
 
+
+
+@pytest.mark.asyncio
+async def test_system_status_serves_cached_snapshot(client, mocker):
+    """/system-status 는 스냅샷을 재사용하고 ?fresh=1 일 때만 집계 쿼리를 다시 실행"""
+    mocker.patch("services.auction_service.main._system_status_snapshot", None)
+    mock_fetch_one = mocker.patch(
+        "services.auction_service.main.database.fetch_one",
+        new_callable=AsyncMock,
+        return_value={
+            "total_advertisers": 5,
+            "approved_advertisers": 3,
+            "registered_keywords": 40,
+            "registered_categories": 7,
+            "total_bids": 12,
+            "avg_bid_price": 850.5,
+            "advertiser_bids": 9,
+            "platform_bids": 3,
+            "avg_match_score": 0.91234,
+        },
+    )
+
+    first = (await client.get("/system-status")).json()
+    second = (await client.get("/system-status")).json()
+    assert mock_fetch_one.await_count == 1
+    assert first["statistics"]["registered_keywords"] == 40
+    assert second["performance"]["recent_bids_last_hour"]["avg_price"] == 850.5
+    assert second["snapshot"]["age_seconds"] >= 0
+
+    await client.get("/system-status?fresh=1")
+    assert mock_fetch_one.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_start_auction_stream_emits_bids_before_complete(client, mocker):
+    """/start/stream 은 저장 전에 bid 이벤트를, 저장 후 complete 이벤트를 보냄"""
+    bid = BidResponse(
+        id="bid_real_11_1",
+        buyerName="Test Ad",
+        price=700,
+        bonus="Test Bonus",
+        timestamp=datetime.now(timezone.utc),
+        landingUrl="https://good.com",
+        clickUrl="http://signed.url",
+        advertiserId=11,
+    )
+    mocker.patch("services.auction_service.main.check_rate_limit", return_value=True)
+    mocker.patch(
+        "services.auction_service.main.start_reverse_auction",
+        new_callable=AsyncMock,
+        return_value=[bid],
+    )
+    mocker.patch(
+        "services.auction_service.main.database.fetch_one",
+        new_callable=AsyncMock,
+        return_value={"id": 1},
+    )
+    mocker.patch(
+        "services.auction_service.main.reserve_and_insert_bids",
+        new_callable=AsyncMock,
+        return_value=[True],
+    )
+
+    app.dependency_overrides[get_user_id_from_token] = lambda: None
+    try:
+        response = await client.post("/start/stream", json={"query": "항공권", "valueScore": 80})
+    finally:
+        app.dependency_overrides.pop(get_user_id_from_token, None)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        (block.split("\n")[0][len("event: "):], json.loads(block.split("\n")[1][len("data: "):]))
+        for block in response.text.strip().split("\n\n")
+    ]
+    assert [name for name, _ in events] == ["bid", "complete"]
+    assert events[0][1]["id"] == "bid_real_11_1"
+    assert events[1][1]["storedBidIds"] == ["bid_real_11_1"]
+    assert events[1][1]["data"]["searchId"].startswith("search_")
+
+
+@pytest.mark.asyncio
+async def test_start_auction_batch_persists_all_queries_together(client, mocker):
+    """/start-batch 는 매칭/저장을 한 번씩 수행하고 요청 순서대로 결과를 반환"""
+    mocker.patch(
+        "services.auction_service.main.find_matching_advertisers_batch",
+        new_callable=AsyncMock,
+        return_value=[[], []],
+    )
+    mock_fetch_all = mocker.patch(
+        "services.auction_service.main.database.fetch_all", new_callable=AsyncMock
+    )
+
+    async def fake_fetch_all(query, values=None):
+        return [{"id": i + 1, "search_id": s} for i, s in enumerate(values["search_ids"])]
+
+    mock_fetch_all.side_effect = fake_fetch_all
+    mock_groups = mocker.patch(
+        "services.auction_service.main.reserve_and_insert_bid_groups",
+        new_callable=AsyncMock,
+        side_effect=lambda uid, groups: [[True] * len(bids) for _, bids in groups],
+    )
+
+    app.dependency_overrides[get_user_id_from_token] = lambda: None
+    try:
+        response = await client.post(
+            "/start-batch",
+            json={"items": [{"query": "항공권", "valueScore": 80}, {"query": "호텔", "valueScore": 40}]},
+        )
+        too_many = await client.post(
+            "/start-batch",
+            json={"items": [{"query": "q", "valueScore": 1}] * (START_BATCH_MAX_ITEMS + 1)},
+        )
+    finally:
+        app.dependency_overrides.pop(get_user_id_from_token, None)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [d["query"] for d in data] == ["항공권", "호텔"]
+    assert len({d["searchId"] for d in data}) == 2
+    mock_fetch_all.assert_awaited_once()
+    mock_groups.assert_awaited_once()
+    assert [auction_id for auction_id, _ in mock_groups.await_args.args[1]] == [1, 2]
+    assert too_many.status_code == 400
@@ -0,0 +1,137 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+import services.auction_service.main as m
+from services.auction_service.utils.auction_status import AuctionStatusBroker
+
+
+@pytest.mark.asyncio
+async def test_broker_wakes_waiters_and_ignores_duplicate_states():
+    broker = AuctionStatusBroker()
+    broker.publish("s1", {"status": "active", "selectedBidId": None, "participants": 3})
+    version = broker.current("s1")[0]
+
+    # 다른 version 을 들고 오면 즉시 반환, 같으면 변경까지 대기
+    assert (await broker.wait_for_change("s1", None, 0.01))["participants"] == 3
+    assert await broker.wait_for_change("s1", version, 0.01) is None
+
+    waiter = asyncio.create_task(broker.wait_for_change("s1", version, 1.0))
+    await asyncio.sleep(0)
+    assert broker.publish("s1", {"status": "active", "selectedBidId": None, "participants": 3}) is False
+    assert not waiter.done()
+
+    broker.publish("s1", {"status": "completed", "selectedBidId": "bid_1", "participants": None})
+    state = await asyncio.wait_for(waiter, 1.0)
+    assert state["status"] == "completed"
+    assert state["participants"] == 3  # 모르는 값은 이전 상태 유지
+    assert broker.stats()["waiters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_long_poll_returns_when_select_changes_status(client, mocker):
+    mocker.patch.object(m, "_status_broker", AuctionStatusBroker())
+    mocker.patch.object(m, "simulate_real_time_delay", AsyncMock())
+    status_row = {"status": "active", "selected_bid_id": None, "participants": 2}
+    m.database.fetch_one.side_effect = lambda query, values=None: (
+        status_row if "participants" in query else {"id": 1, "released_amount": 0}
+    )
+
+    first = (await client.get("/status/s1/wait", params={"timeout": 0})).json()
+    assert first["changed"] is True
+    assert first["data"]["participants"] == 2
+
+    poll = asyncio.create_task(
+        client.get("/status/s1/wait", params={"since": first["data"]["version"], "timeout": 5})
+    )
+    await asyncio.sleep(0.05)
+    assert not poll.done()
+
+    response = await client.post("/select", json={"searchId": "s1", "selectedBidId": "bid_9"})
+    assert response.status_code == 200
+    result = (await asyncio.wait_for(poll, 2.0)).json()
+    assert result["changed"] is True
+    assert result["data"]["status"] == "completed"
+    assert result["data"]["selectedBidId"] == "bid_9"
+
+    # 다른 워커에도 NOTIFY
+    notify = [c for c in m.database.execute.await_args_list if "pg_notify" in c.args[0]]
+    assert notify and notify[0].args[1]["channel"] == m.AUCTION_STATUS_CHANNEL
+
+
+@pytest.mark.asyncio
+async def test_select_on_expired_auction_is_rejected(client, mocker):
+    mocker.patch.object(m, "_status_broker", AuctionStatusBroker())
+    m.database.fetch_one.side_effect = lambda query, values=None: (
+        None if "UPDATE auctions" in query else {"status": "expired", "past_expiry": True}
+    )
+
+    response = await client.post("/select", json={"searchId": "s1", "selectedBidId": "bid_9"})
+    assert response.status_code == 409
+    assert m._status_broker.current("s1") is None
+
+
+@pytest.mark.asyncio
+async def test_select_past_expiry_before_sweep_is_rejected(client, mocker):
+    mocker.patch.object(m, "_status_broker", AuctionStatusBroker())
+    queries = []
+
+    def fetch_one(query, values=None):
+        queries.append((query, values))
+        if "UPDATE auctions" in query:
+            return None  # expires_at > :now 조건에 걸림
+        return {"status": "active", "past_expiry": True}
+
+    m.database.fetch_one.side_effect = fetch_one
+
+    response = await client.post("/select", json={"searchId": "s1", "selectedBidId": "bid_9"})
+    assert response.status_code == 409
+    assert response.json()["detail"] == "만료된 경매입니다."
+    assert "expires_at > :now" in queries[0][0]
+    assert queries[0][1]["now"].tzinfo is None
+
+
+@pytest.mark.asyncio
+async def test_sweeper_expiry_wakes_waiters_and_notifies_other_workers(mocker):
+    broker = AuctionStatusBroker()
+    mocker.patch.object(m, "_status_broker", broker)
+    mocker.patch.object(m.database, "execute", AsyncMock())
+    broker.publish("s1", {"status": "active", "selectedBidId": None, "participants": 2})
+    version = broker.current("s1")[0]
+
+    waiter = asyncio.create_task(broker.wait_for_change("s1", version, 1.0))
+    await asyncio.sleep(0)
+    await m.publish_expired_auctions(["s1", "s2"])
+
+    state = await asyncio.wait_for(waiter, 1.0)
+    assert state["status"] == "expired"
+    assert state["participants"] == 2
+    assert broker.current("s2") is None  # 구독자 없는 경매는 보관하지 않음
+
+    (call,) = m.database.execute.await_args_list
+    assert "pg_notify" in call.args[0]
+    assert len(call.args[1]["payloads"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_select_releases_budget_of_unselected_bids(client, mocker):
+    mocker.patch.object(m, "_status_broker", AuctionStatusBroker())
+    mocker.patch.object(m, "simulate_real_time_delay", AsyncMock())
+    calls = []
+
+    def fetch_one(query, values=None):
+        calls.append((query, values))
+        return {"id": 1, "released_amount": 1700}
+
+    m.database.fetch_one.side_effect = fetch_one
+
+    response = await client.post("/select", json={"searchId": "s1", "selectedBidId": "bid_9"})
+    assert response.status_code == 200
+
+    # 선택 처리와 나머지 광고주 bid 환불이 한 문장(트랜잭션)으로 수행됨
+    (query, values), = calls
+    assert "UPDATE advertiser_daily_spend" in query
+    assert "b.id <> :selected_bid_id" in query
+    assert values["selected_bid_id"] == "bid_9"
+    assert values["platform_advertiser_id"] == m.PLATFORM_ADVERTISER_ID
@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import pytest
+
+from services.auction_service.utils.auction_sweeper import AuctionExpirySweeper
+
+NOW = datetime(2024, 5, 1, 12, 0, 0)
+
+
+class FakeDatabase:
+    """active 경매 backlog 개 중 batch_size 개씩 만료 처리하는 DB (경매당 예약 1000원)"""
+
+    def __init__(self, backlog):
+        self.backlog = backlog
+        self.calls = []
+
+    async def fetch_one(self, query, values=None):
+        self.calls.append(values)
+        expired = min(self.backlog, values["batch_size"])
+        self.backlog -= expired
+        return {
+            "expired": expired,
+            "refunded_rows": expired,
+            "released_amount": expired * 1000,
+            "search_ids": [f"s{self.backlog + i}" for i in range(expired)],
+        }
+
+
+@pytest.mark.asyncio
+async def test_sweep_processes_bounded_batches_until_drained():
+    db = FakeDatabase(backlog=250)
+    sweeper = AuctionExpirySweeper(db, batch_size=100, max_batches=5, now=lambda: NOW)
+
+    assert await sweeper.sweep() == 250
+    assert len(db.calls) == 3  # 100 + 100 + 50
+    assert db.calls[0]["now"] == NOW
+    stats = sweeper.stats()
+    assert stats["expired"] == 250
+    assert stats["released_amount"] == 250000
+    assert stats["backlog_remaining"] is False
+
+
+@pytest.mark.asyncio
+async def test_sweep_stops_at_max_batches_and_reports_backlog():
+    db = FakeDatabase(backlog=1000)
+    sweeper = AuctionExpirySweeper(db, batch_size=100, max_batches=3, now=lambda: NOW)
+
+    assert await sweeper.sweep() == 300
+    assert sweeper.stats()["backlog_remaining"] is True
+
+    # 다음 주기에 이어서 처리
+    await sweeper.sweep()
+    assert db.backlog == 400
+    assert sweeper.stats()["runs"] == 2
+
+
+@pytest.mark.asyncio
+async def test_sweep_publishes_expired_search_ids_and_survives_publish_errors():
+    published = []
+
+    async def on_expired(search_ids):
+        published.append(search_ids)
+        raise RuntimeError("notify failed")
+
+    db = FakeDatabase(backlog=3)
+    sweeper = AuctionExpirySweeper(
+        db, batch_size=2, max_batches=5, now=lambda: NOW, on_expired=on_expired
+    )
+
+    assert await sweeper.sweep() == 3
+    assert published == [["s1", "s2"], ["s0"]]
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from services.auction_service.utils.batch_writer import BatchWriter
+
+
+class RecordingFlush:
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+
+    async def __call__(self, items):
+        self.batches.append(list(items))
+        if self.fail_on is not None and self.fail_on in items:
+            raise RuntimeError("insert failed")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_one_flush():
+    flush = RecordingFlush()
+    writer = BatchWriter(flush, name="test", window=0.05)
+    await writer.start()
+    try:
+        await asyncio.gather(writer.write([1, 2]), writer.write([3]), writer.write([4]))
+    finally:
+        await writer.stop()
+
+    assert flush.batches == [[1, 2, 3, 4]]
+    assert writer.stats()["avg_batch"] == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_per_request():
+    flush = RecordingFlush(fail_on="bad")
+    writer = BatchWriter(flush, name="test", window=0.05)
+    await writer.start()
+    try:
+        results = await asyncio.gather(
+            writer.write(["ok"]), writer.write(["bad"]), return_exceptions=True
+        )
+    finally:
+        await writer.stop()
+
+    assert results[0] is None
+    assert isinstance(results[1], RuntimeError)
+    assert flush.batches == [["ok", "bad"], ["ok"], ["bad"]]
+    assert writer.stats()["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_write_nowait_drops_when_full_and_stop_flushes_rest():
+    flush = RecordingFlush()
+    writer = BatchWriter(flush, name="test", max_batch=2, max_pending=3)
+
+    assert writer.write_nowait([1, 2])
+    assert not writer.write_nowait([3, 4])
+    assert writer.write_nowait([5])
+    await writer.stop()
+
+    assert flush.batches == [[1, 2], [5]]
+    assert writer.stats()["dropped"] == 2
+    assert writer.pending_rows == 0
+
+
+class BlockingFlush(RecordingFlush):
+    """첫 flush 를 release 될 때까지 붙잡아 두는 flush"""
+
+    def __init__(self):
+        super().__init__()
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self, items):
+        self.started.set()
+        await self.release.wait()
+        await super().__call__(items)
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_in_flight_flush_and_drains_rest():
+    flush = BlockingFlush()
+    writer = BatchWriter(flush, name="test", window=0.001, max_batch=2)
+    await writer.start()
+
+    first = asyncio.create_task(writer.write([1, 2]))
+    await flush.started.wait()
+    second = asyncio.create_task(writer.write([3]))
+    await asyncio.sleep(0)
+
+    stopping = asyncio.create_task(writer.stop())
+    await asyncio.sleep(0.01)
+    assert not stopping.done()  # 진행 중인 flush 를 끊지 않음
+
+    flush.release.set()
+    await asyncio.wait_for(stopping, 1.0)
+    assert first.done() and first.result() is None
+    assert second.done() and second.result() is None
+    assert flush.batches == [[1, 2], [3]]
+    assert writer.pending_rows == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_flush_puts_batch_back():
+    flush = BlockingFlush()
+    writer = BatchWriter(flush, name="test", window=0.001)
+    await writer.start()
+
+    pending = asyncio.create_task(writer.write([1, 2]))
+    await flush.started.wait()
+    writer._task.cancel()
+    await asyncio.gather(writer._task, return_exceptions=True)
+    assert writer.pending_rows == 2
+    assert not pending.done()
+
+    flush.release.set()
+    await writer.stop()
+    assert await asyncio.wait_for(pending, 1.0) is None
+    assert flush.batches == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_waits_for_space_then_drops_after_timeout():
+    flush = BlockingFlush()
+    writer = BatchWriter(flush, name="test", window=0.001, max_batch=2, max_pending=2)
+    await writer.start()
+
+    assert await writer.enqueue([1, 2], timeout=0.1)
+    await flush.started.wait()  # [1, 2] 는 flush 중, 큐는 비어 있음
+    assert await writer.enqueue([3, 4], timeout=0.1)
+
+    # 큐가 가득 찬 동안 자리가 나지 않으면 timeout 후 버림
+    assert not await writer.enqueue([5], timeout=0.02)
+
+    # 자리가 나면 대기하던 호출은 들어감
+    waiting = asyncio.create_task(writer.enqueue([6], timeout=1.0))
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+    flush.release.set()
+    assert await asyncio.wait_for(waiting, 1.0)
+
+    await writer.stop()
+    assert [x for batch in flush.batches for x in batch] == [1, 2, 3, 4, 6]
+    assert writer.stats()["dropped"] == 1
+    assert writer.stats()["waited"] == 1  # 기다린 뒤 들어간 호출 수
@@ -0,0 +1,142 @@
+from contextlib import asynccontextmanager
+from datetime import date
+
+import pytest
+
+from services.auction_service.utils.budget_ledger import BudgetLedger
+
+
+class FakeDatabase:
+    """리스 발급 시 spend/budget/outstanding 조회 결과만 흉내내는 DB"""
+
+    def __init__(self, daily_budget, amount=0, outstanding=0):
+        self.daily_budget = daily_budget
+        self.amount = amount
+        self.outstanding = outstanding
+        self.executed = []
+        self.fail = False
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query, values=None):
+        if self.fail:
+            raise ConnectionError("db down")
+        self.executed.append((" ".join(query.split()), values))
+
+    async def fetch_one(self, query, values=None):
+        if "FOR UPDATE" in query:
+            return {"amount": self.amount}
+        return {
+            "amount": self.amount,
+            "daily_budget": self.daily_budget,
+            "outstanding": self.outstanding,
+        }
+
+    async def fetch_all(self, query, values=None):
+        return []
+
+    def statements(self, prefix):
+        return [v for q, v in self.executed if q.startswith(prefix)]
+
+
+def make_ledger(db):
+    return BudgetLedger(db, worker_id="w1", lease_fraction=0.1, today=lambda: date(2025, 1, 1))
+
+
+@pytest.mark.asyncio
+async def test_reserves_from_lease_without_db_round_trips():
+    db = FakeDatabase(daily_budget=10000)
+    ledger = make_ledger(db)
+
+    assert await ledger.reserve_many({7: 300}) == {7}
+    grants = db.statements("INSERT INTO advertiser_budget_leases")
+    assert [g["amt"] for g in grants] == [1000]  # 일일 예산의 10%
+
+    assert await ledger.reserve_many({7: 300}) == {7}
+    assert len(db.statements("INSERT INTO advertiser_budget_leases")) == 1
+    assert ledger.stats()["remaining"] == 400
+    assert ledger.stats()["unflushed"] == 600
+
+
+@pytest.mark.asyncio
+async def test_grant_never_exceeds_daily_budget():
+    # 지출 9000 + 다른 워커 리스 500 -> 가용 500
+    db = FakeDatabase(daily_budget=10000, amount=9000, outstanding=500)
+    ledger = make_ledger(db)
+
+    assert await ledger.reserve_many({7: 600}) == set()
+    assert ledger.stats()["grant_denials"] == 1
+
+    assert await ledger.reserve_many({7: 400}) == {7}
+    assert [g["amt"] for g in db.statements("INSERT INTO advertiser_budget_leases")] == [500]
+
+
+@pytest.mark.asyncio
+async def test_flush_moves_usage_to_daily_spend_and_refund_restores_lease():
+    db = FakeDatabase(daily_budget=10000)
+    ledger = make_ledger(db)
+    await ledger.reserve_many({7: 300, 8: 200})
+    ledger.refund({8: 200})
+
+    await ledger.flush()
+
+    spend_updates = db.statements("UPDATE advertiser_daily_spend")
+    assert spend_updates == [{"ids": [7], "used": [300], "d": date(2025, 1, 1)}]
+    assert ledger.stats()["unflushed"] == 0
+    assert ledger.stats()["remaining"] == 700 + 1000
+
+
+@pytest.mark.asyncio
+async def test_stop_releases_leases():
+    db = FakeDatabase(daily_budget=10000)
+    ledger = make_ledger(db)
+    await ledger.reserve_many({7: 300})
+
+    await ledger.stop()
+
+    assert db.statements("DELETE FROM advertiser_budget_leases WHERE worker_id") == [{"w": "w1"}]
+    assert ledger.stats()["leases"] == 0
+
+
+@pytest.mark.asyncio
+async def test_lease_past_ttl_without_flush_is_discarded_and_regranted():
+    db = FakeDatabase(daily_budget=10000)
+    now = [0.0]
+    ledger = BudgetLedger(
+        db,
+        worker_id="w1",
+        lease_fraction=0.1,
+        lease_ttl=30.0,
+        today=lambda: date(2025, 1, 1),
+        clock=lambda: now[0],
+    )
+    await ledger.reserve_many({7: 300})
+
+    # flush 가 lease_ttl 동안 계속 실패 -> 다른 워커가 outstanding 1000 을 회수했을 수 있음
+    db.fail = True
+    now[0] = 10.0
+    await ledger.flush()
+    now[0] = 31.0
+    assert await ledger.reserve_many({7: 300}) == set()
+    assert ledger.stats()["leases"] == 0
+    assert ledger.stats()["expired_leases"] == 1
+
+    # DB 복구 후 새 발급은 이전 리스 행을 먼저 정산하고 메모리 리스를 새로 시작
+    db.fail = False
+    assert await ledger.reserve_many({7: 300}) == {7}
+    settles = db.statements("WITH stale AS ( DELETE FROM advertiser_budget_leases")
+    assert settles == [{"w": "w1", "ids": [7], "d": date(2025, 1, 1)}]
+    assert [g["amt"] for g in db.statements("INSERT INTO advertiser_budget_leases")] == [
+        1000,
+        1000,
+    ]
+    assert ledger.stats()["remaining"] == 700
+    assert ledger.stats()["unflushed"] == 300
+
+    # 버린 미반영분 300 은 다시 지출로 반영하지 않음
+    await ledger.flush()
+    spend_updates = db.statements("UPDATE advertiser_daily_spend s SET amount = s.amount + u.used")
+    assert spend_updates == [{"ids": [7], "used": [300], "d": date(2025, 1, 1)}]
+    assert len(db.statements("WITH stale AS")) == 1
@@ -0,0 +1,80 @@
+import pytest
+
+import services.auction_service.main as m
+from services.auction_service.utils.category_trie import CategoryMatchIndex
+from services.auction_service.utils.matching_index import (
+    AutoBidSettingsCache,
+    KeywordMatchIndex,
+)
+
+CATEGORY_ROWS = [
+    {"name": "소프트웨어", "path": "IT>소프트웨어"},
+    {"name": "IT", "path": "IT"},
+    {"name": "항공권", "path": "여행>항공"},
+]
+ADVERTISER_ROWS = [
+    {"advertiser_id": 101, "category_path": "IT>소프트웨어>SaaS", "is_primary": True},
+    {"advertiser_id": 202, "category_path": "IT>하드웨어", "is_primary": False},
+    {"advertiser_id": 303, "category_path": "여행>항공", "is_primary": True},
+    {"advertiser_id": 404, "category_path": "여행>호텔", "is_primary": False},
+]
+
+
+def _ids(rows):
+    return sorted(r["advertiser_id"] for r in rows)
+
+
+def test_match_uses_name_substring_and_path_prefix():
+    index = CategoryMatchIndex.from_rows(CATEGORY_ROWS, ADVERTISER_ROWS)
+
+    assert _ids(index.match(["소프트"])) == [101]
+    assert _ids(index.match(["it"])) == [101, 202]  # 이름은 소문자로 비교, 하위 경로 포함
+    assert index.match(["항공권"]) == [
+        {"advertiser_id": 303, "category_path": "여행>항공", "is_primary": True}
+    ]
+    assert index.match(["호텔"]) == []  # 활성 카테고리 이름에 없음
+    assert index.match(["s"]) == []  # 2자 미만 토큰은 사용하지 않음
+    # 여러 카테고리에 걸쳐도 같은 행은 한 번만
+    assert _ids(index.match(["it", "소프트웨어"])) == [101, 202]
+
+
+def test_replace_advertisers_prunes_trie():
+    index = CategoryMatchIndex.from_rows(CATEGORY_ROWS, ADVERTISER_ROWS)
+    index.replace_advertisers(
+        [101, 202], [{"advertiser_id": 202, "category_path": "IT>소프트웨어", "is_primary": False}]
+    )
+
+    assert _ids(index.match(["소프트"])) == [202]
+    assert index.stats()["advertiser_categories"] == 3
+    index.remove_advertiser(202)
+    assert index.match(["it"]) == []
+
+
+@pytest.mark.asyncio
+async def test_find_matching_advertisers_uses_category_index(monkeypatch):
+    category_index = CategoryMatchIndex.from_rows(CATEGORY_ROWS, ADVERTISER_ROWS)
+    monkeypatch.setattr(m, "_matching_index", KeywordMatchIndex())
+    monkeypatch.setattr(m, "_category_index", category_index)
+    monkeypatch.setattr(
+        m,
+        "_settings_cache",
+        AutoBidSettingsCache.from_rows(
+            [{"advertiser_id": a, "min_quality_score": 50} for a in (101, 202, 303)]
+        ),
+    )
+    monkeypatch.setattr(m, "_match_cache", None)
+
+    async def fake_fetch_all(query, values=None):
+        if "advertiser_categories" in query:
+            return [{"advertiser_id": 303, "category_path": "IT>네트워크", "is_primary": True}]
+        raise AssertionError("카테고리 매칭에 SQL 을 사용하면 안 됨")
+
+    monkeypatch.setattr(m.database, "fetch_all", fake_fetch_all)
+
+    result = await m.find_matching_advertisers("소프트웨어", 80)
+    assert result == [
+        {"advertiser_id": 101, "match_score": 0.72, "reasons": ["CAT:IT>소프트웨어>SaaS"]}
+    ]
+
+    await m.apply_matching_changes({303: {"categories"}})
+    assert _ids(await m.find_matching_advertisers("IT", 80)) == [101, 202, 303]
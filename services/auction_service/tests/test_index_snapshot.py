@@ -0,0 +1,78 @@
+import pytest
+
+import services.auction_service.main as m
+from services.auction_service.utils.index_snapshot import IndexSnapshot, write_snapshot
+from services.auction_service.utils.matching_index import KeywordMatchIndex
+
+KEYWORD_ROWS = [
+    {"advertiser_id": 101, "keyword": "테스트키워드", "priority": 5, "match_type": "exact"},
+    {"advertiser_id": 202, "keyword": "제주도 항공권", "priority": None, "match_type": "phrase"},
+    {"advertiser_id": 303, "keyword": "Fast API", "priority": 2, "match_type": "broad"},
+    {"advertiser_id": 404, "keyword": "무시", "priority": 1, "match_type": "unknown"},
+]
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "index.snap")
+    assert write_snapshot(path, KEYWORD_ROWS, "3:abc") == 3
+
+    with IndexSnapshot.open(path) as snapshot:
+        assert snapshot.fingerprint == "3:abc"
+        rows = list(snapshot.rows())
+
+    assert rows == [
+        {"advertiser_id": 101, "keyword": "테스트키워드", "priority": 5, "match_type": "exact"},
+        {"advertiser_id": 202, "keyword": "제주도 항공권", "priority": 1, "match_type": "phrase"},
+        {"advertiser_id": 303, "keyword": "Fast API", "priority": 2, "match_type": "broad"},
+    ]
+    index = KeywordMatchIndex.from_rows(rows)
+    assert [r["advertiser_id"] for r in index.match(["제주도항공권"], ["fast"])] == [202, 303]
+
+
+def test_snapshot_keeps_priorities_beyond_int8(tmp_path):
+    path = str(tmp_path / "index.snap")
+    rows = [{"advertiser_id": 1, "keyword": "키워드", "priority": 300, "match_type": "exact"}]
+    write_snapshot(path, rows, "fp")
+
+    with IndexSnapshot.open(path) as snapshot:
+        assert [r["priority"] for r in snapshot.rows()] == [300]
+
+def test_invalid_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "index.snap"
+    assert IndexSnapshot.open(str(path)) is None
+
+    write_snapshot(str(path), KEYWORD_ROWS, "fp")
+    path.write_bytes(path.read_bytes()[:-8])
+    assert IndexSnapshot.open(str(path)) is None
+
+    path.write_bytes(b"XXXX" + b"\0" * 64)
+    assert IndexSnapshot.open(str(path)) is None
+
+
+@pytest.mark.asyncio
+async def test_build_keyword_index_uses_snapshot_until_fingerprint_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(m, "INDEX_SNAPSHOT_PATH", str(tmp_path / "index.snap"))
+    fingerprint_row = {"row_count": 3, "max_id": 3, "max_updated_at": "2025-01-01 00:00:00"}
+    fetches = []
+
+    async def fake_fetch_one(query, values=None):
+        return fingerprint_row
+
+    async def fake_fetch_all(query, values=None):
+        fetches.append(query)
+        return KEYWORD_ROWS
+
+    monkeypatch.setattr(m.database, "fetch_one", fake_fetch_one)
+    monkeypatch.setattr(m.database, "fetch_all", fake_fetch_all)
+
+    _, source = await m._build_keyword_index()
+    assert source == "database"
+    index, source = await m._build_keyword_index()
+    assert source == "snapshot"
+    assert len(fetches) == 1
+    assert len(index) == 3
+
+    fingerprint_row = {"row_count": 3, "max_id": 5, "max_updated_at": "2025-01-01 00:00:00"}
+    _, source = await m._build_keyword_index()
+    assert source == "database"
+    assert len(fetches) == 2
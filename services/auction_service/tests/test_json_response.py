@@ -0,0 +1,36 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+import services.auction_service.utils.json_response as jr
+from services.auction_service.main import BidResponse
+
+PAYLOAD = {
+    "auction": {"id": 1, "query_text": "제주도 항공권", "created_at": datetime(2024, 5, 1, 12, 0, 0, 5)},
+    "budget": Decimal("1500"),
+    "bids": [
+        BidResponse(
+            id="bid_1",
+            buyerName="광고주",
+            price=1000,
+            bonus="적립",
+            timestamp=datetime(2024, 5, 1, 12, 0, 0),
+            landingUrl="https://a.example.com",
+            clickUrl="https://gw.example.com/api/redirect/bid_1?sig=x",
+        )
+    ],
+}
+
+
+def test_fast_json_response_matches_json_response(monkeypatch):
+    expected = json.loads(JSONResponse(jsonable_encoder(PAYLOAD)).body)
+
+    assert json.loads(jr.FastJSONResponse(PAYLOAD).body) == expected
+
+    # orjson 이 없을 때도 같은 결과
+    monkeypatch.setattr(jr, "orjson", None)
+    assert json.loads(jr.FastJSONResponse(PAYLOAD).body) == expected
+    assert jr.json_backend() == "json"
@@ -0,0 +1,128 @@
+import pytest
+
+import services.auction_service.main as m
+from services.auction_service.utils.match_cache import MatchResultCache
+from services.auction_service.utils.matching_index import (
+    AutoBidSettingsCache,
+    KeywordMatchIndex,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class OfflineDatabase:
+    is_connected = False
+
+
+MATCHES = [{"advertiser_id": 1, "match_score": 1.275, "reasons": ["KW_PHRASE:항공권"]}]
+
+
+def test_key_ignores_case_and_repeated_spaces():
+    assert MatchResultCache.key("제주도  항공권 ") == MatchResultCache.key("제주도 항공권")
+    assert MatchResultCache.key("Fast API") == MatchResultCache.key("fast api")
+    assert MatchResultCache.key("제주도항공권") != MatchResultCache.key("제주도 항공권")
+
+
+@pytest.mark.asyncio
+async def test_local_ttl_and_lru():
+    clock = FakeClock()
+    cache = MatchResultCache(ttl_seconds=10, max_entries=2, clock=clock)
+    db = OfflineDatabase()
+
+    cache.put(db, "a", MATCHES, cache.generation)
+    cache.put(db, "b", [], cache.generation)
+    assert await cache.get(db, "a") == MATCHES
+    cache.put(db, "c", [], cache.generation)  # "b" 가 가장 오래 사용되지 않음
+
+    assert await cache.get(db, "b") is None
+    assert await cache.get(db, "c") == []
+
+    clock.now = 11
+    assert await cache.get(db, "a") is None
+    assert cache.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_put_after_invalidation_is_dropped():
+    cache = MatchResultCache()
+    db = OfflineDatabase()
+    generation = cache.generation
+    await cache.invalidate(db)
+    cache.put(db, "a", MATCHES, generation)
+    assert await cache.get(db, "a") is None
+
+
+@pytest.mark.asyncio
+async def test_cached_matches_are_refiltered_by_current_settings(monkeypatch):
+    index = KeywordMatchIndex.from_rows(
+        [{"advertiser_id": 101, "keyword": "키워드", "priority": 1, "match_type": "broad"}]
+    )
+    settings = AutoBidSettingsCache.from_rows(
+        [{"advertiser_id": 101, "min_quality_score": 50}]
+    )
+    monkeypatch.setattr(m, "_matching_index", index)
+    monkeypatch.setattr(m, "_settings_cache", settings)
+    monkeypatch.setattr(m, "_match_cache", MatchResultCache())
+
+    calls = []
+
+    async def fake_fetch_all(query, values=None):
+        calls.append(query)
+        return []
+
+    monkeypatch.setattr(m.database, "fetch_all", fake_fetch_all)
+
+    first = await m.find_matching_advertisers("키워드", 60)
+    assert [r["advertiser_id"] for r in first] == [101]
+    calls.clear()
+
+    # 설정 변경은 캐시 무효화 없이 다음 요청에 반영
+    settings.replace_advertisers([101], [{"advertiser_id": 101, "min_quality_score": 90}])
+    assert await m.find_matching_advertisers("키워드", 60) == []
+    assert calls == []
+
+    # 키워드 변경 이벤트(재조회 결과 없음 = 키워드 삭제)는 캐시 무효화
+    await m.apply_matching_changes({101: {"keywords"}})
+    assert m._match_cache.get_local(m._match_cache.key("키워드")) is None
+    assert await m.find_matching_advertisers("키워드", 95) == []
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_returns_same_scores_as_miss_path():
+    # 0.6 * 1.2 = 0.7199999999999999 처럼 반올림 전 값이 적중 경로와 달라지는 점수
+    matches = m._score_matches(
+        [{"advertiser_id": 1, "match_type": "broad", "priority": 3, "keyword": "항공권"}],
+        [{"advertiser_id": 2, "category_path": "여행/항공", "is_primary": True}],
+    )
+    cache = MatchResultCache()
+    db = OfflineDatabase()
+    cache.put(db, "k", matches, cache.generation)
+
+    assert await cache.get(db, "k") == matches
+    assert [r["match_score"] for r in matches] == [
+        round(r["match_score"], 4) for r in matches
+    ]
+
+
+@pytest.mark.asyncio
+async def test_settings_change_invalidates_cached_matches(monkeypatch):
+    # 캐시된 결과는 자동 입찰이 켜진 광고주만 포함하므로 설정 변경(on/off) 시 다시 계산해야 함
+    cache = MatchResultCache()
+    monkeypatch.setattr(m, "_match_cache", cache)
+    monkeypatch.setattr(m, "_settings_cache", None)
+    monkeypatch.setattr(m, "_profile_cache", None)
+
+    async def fake_fetch_all(query, values=None):
+        return []
+
+    monkeypatch.setattr(m.database, "fetch_all", fake_fetch_all)
+    cache.put(OfflineDatabase(), cache.key("키워드"), MATCHES, cache.generation)
+
+    await m.apply_matching_changes({101: {"settings"}})
+    assert cache.get_local(cache.key("키워드")) is None
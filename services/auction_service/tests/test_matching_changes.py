@@ -0,0 +1,158 @@
+import pytest
+
+import services.auction_service.main as m
+from services.auction_service.utils.change_events import parse_change_payload
+from services.auction_service.utils.matching_index import (
+    AutoBidSettingsCache,
+    KeywordMatchIndex,
+)
+
+KEYWORD_ROWS = [
+    {"advertiser_id": 101, "keyword": "테스트키워드", "priority": 5, "match_type": "exact"},
+    {"advertiser_id": 202, "keyword": "제주도 항공권", "priority": 4, "match_type": "phrase"},
+    {"advertiser_id": 202, "keyword": "항공권 특가", "priority": 3, "match_type": "broad"},
+]
+
+
+def _ids(index, tokens_norm, like_terms):
+    return {r["advertiser_id"] for r in index.match(tokens_norm, like_terms)}
+
+
+def test_parse_change_payload():
+    assert parse_change_payload('{"advertiser_id": 7, "kinds": ["keywords"]}') == (
+        7,
+        {"keywords"},
+    )
+    # kinds 가 없거나 모두 알 수 없으면 전체 재적재 대상
+    assert parse_change_payload('{"advertiser_id": "7"}') == (
+        7,
+        {"keywords", "categories", "settings", "profile"},
+    )
+    assert parse_change_payload('{"advertiser_id": 7, "kinds": ["bogus"]}')[1] == {
+        "keywords",
+        "categories",
+        "settings",
+        "profile",
+    }
+    assert parse_change_payload("not json") is None
+    assert parse_change_payload('{"kinds": ["keywords"]}') is None
+
+
+def test_replace_advertisers_removes_stale_postings():
+    index = KeywordMatchIndex.from_rows(KEYWORD_ROWS)
+    assert 202 in _ids(index, ["제주도"], ["제주도", "항공권"])
+
+    index.replace_advertisers(
+        [202],
+        [{"advertiser_id": 202, "keyword": "렌터카", "priority": 2, "match_type": "broad"}],
+    )
+
+    assert 202 not in _ids(index, ["제주도"], ["제주도", "항공권"])
+    assert 202 in _ids(index, [], ["렌터카"])
+    assert index.stats()["keywords"] == 2
+
+    # rows 가 비어 있으면 광고주 키워드 전체 삭제
+    index.replace_advertisers([101, 202], [])
+    assert len(index) == 0
+    assert index.stats() == {
+        "keywords": 0,
+        "advertisers": 0,
+        "phrase_grams": 0,
+        "broad_grams": 0,
+    }
+
+
+def test_settings_cache_replace():
+    cache = AutoBidSettingsCache.from_rows(
+        [{"advertiser_id": 1, "min_quality_score": 50}]
+    )
+    cache.replace_advertisers([1], [])
+    assert cache.get(1) is None
+    cache.replace_advertisers([2], [{"advertiser_id": 2, "min_quality_score": 0}])
+    assert cache.get(2) == 0
+
+
+@pytest.mark.asyncio
+async def test_apply_matching_changes_refetches_only_changed_advertisers(monkeypatch):
+    index = KeywordMatchIndex.from_rows(KEYWORD_ROWS)
+    cache = AutoBidSettingsCache.from_rows(
+        [
+            {"advertiser_id": 101, "min_quality_score": 50},
+            {"advertiser_id": 202, "min_quality_score": 50},
+        ]
+    )
+    monkeypatch.setattr(m, "_matching_index", index)
+    monkeypatch.setattr(m, "_settings_cache", cache)
+
+    calls = []
+
+    async def fake_fetch_all(query, values=None):
+        calls.append((query, values))
+        if "advertiser_keywords" in query:
+            return [
+                {"advertiser_id": 202, "keyword": "렌터카", "priority": 2, "match_type": "broad"}
+            ]
+        return [{"advertiser_id": 101, "min_quality_score": 90}]
+
+    monkeypatch.setattr(m.database, "fetch_all", fake_fetch_all)
+
+    await m.apply_matching_changes({202: {"keywords"}, 101: {"settings", "categories"}})
+
+    assert [values for _, values in calls] == [{"ids": [202]}, {"ids": [101]}]
+    assert 202 in _ids(index, [], ["렌터카"])
+    assert 101 in _ids(index, ["테스트키워드"], [])
+    assert cache.get(101) == 90
+    assert cache.get(202) == 50
+
+
+@pytest.mark.asyncio
+async def test_find_matching_advertisers_uses_settings_cache(monkeypatch):
+    monkeypatch.setattr(m, "_matching_index", KeywordMatchIndex.from_rows(KEYWORD_ROWS))
+    monkeypatch.setattr(
+        m,
+        "_settings_cache",
+        AutoBidSettingsCache.from_rows([{"advertiser_id": 101, "min_quality_score": 50}]),
+    )
+
+    queries = []
+
+    async def fake_fetch_all(query, values=None):
+        queries.append(query)
+        return []
+
+    monkeypatch.setattr(m.database, "fetch_all", fake_fetch_all)
+
+    result = await m.find_matching_advertisers("테스트 키워드", 80)
+
+    assert all("auto_bid_settings" not in q for q in queries)
+    assert [r["advertiser_id"] for r in result] == [101]
+
+
+@pytest.mark.asyncio
+async def test_listener_starts_for_caches_when_index_disabled(monkeypatch):
+    started = []
+
+    class FakeListener:
+        def __init__(self, dsn, channel, on_changes, on_resync):
+            self.ready = False
+
+        async def start(self):
+            started.append(self)
+
+        def mark_ready(self):
+            self.ready = True
+
+    async def fail_load():
+        raise AssertionError("index disabled")
+
+    monkeypatch.setattr(m, "MatchingChangeListener", FakeListener)
+    monkeypatch.setattr(m, "load_matching_index", fail_load)
+    monkeypatch.setattr(m, "MATCHING_INDEX_ENABLED", False)
+    monkeypatch.setattr(m, "_match_cache", object())
+    monkeypatch.setattr(m, "_profile_cache", None)
+
+    listener = await m.start_matching_listener()
+    assert started == [listener] and listener.ready
+
+    monkeypatch.setattr(m, "_match_cache", None)
+    assert await m.start_matching_listener() is None
@@ -0,0 +1,156 @@
+import pytest
+
+import services.auction_service.main as m
+from services.auction_service.utils.matching_index import KeywordMatchIndex, like_pattern
+
+KEYWORD_ROWS = [
+    {"advertiser_id": 101, "keyword": "테스트키워드", "priority": 5, "match_type": "exact"},
+    {"advertiser_id": 202, "keyword": "제주도 항공권", "priority": 4, "match_type": "phrase"},
+    {"advertiser_id": 303, "keyword": "키워드", "priority": 3, "match_type": "broad"},
+    {"advertiser_id": 404, "keyword": "Fast API", "priority": 2, "match_type": "broad"},
+    {"advertiser_id": 505, "keyword": "항공", "priority": 1, "match_type": "exact"},
+]
+
+
+def _match(index, query):
+    raw = m.build_tokens(query)
+    tokens_norm = list({m._normalize(t) for t in raw} | {m._normalize(query)})
+    return index.match(tokens_norm, m.build_like_terms(raw))
+
+
+def test_exact_matches_normalized_tokens():
+    index = KeywordMatchIndex.from_rows(KEYWORD_ROWS)
+    rows = _match(index, "테스트 키워드")
+    assert {"advertiser_id": 101, "keyword": "테스트키워드", "priority": 5, "match_type": "exact"} in rows
+    # SQL 경로와 동일하게 2-gram 토큰도 tokens_norm 에 포함되어 exact 일치 대상이 됨
+    assert 505 in {r["advertiser_id"] for r in _match(index, "항공권 예약")}
+    assert 505 not in {r["advertiser_id"] for r in _match(index, "공항 예약")}
+
+
+def test_phrase_matches_substring_of_normalized_keyword():
+    index = KeywordMatchIndex.from_rows(KEYWORD_ROWS)
+    rows = _match(index, "제주도")
+    assert [r["advertiser_id"] for r in rows if r["match_type"] == "phrase"] == [202]
+
+
+def test_broad_keeps_spaces_like_sql_lower():
+    index = KeywordMatchIndex.from_rows(KEYWORD_ROWS)
+    # lower(keyword) LIKE '%fastapi%' 는 공백 때문에 일치하지 않음
+    assert _match(index, "fastapi") == []
+    assert [r["advertiser_id"] for r in _match(index, "fast")] == [404]
+
+
+def test_like_wildcards_in_query_are_literal_on_both_paths():
+    index = KeywordMatchIndex.from_rows(
+        [
+            {"advertiser_id": 1, "keyword": "a_b 할인", "priority": 1, "match_type": "broad"},
+            {"advertiser_id": 2, "keyword": "axb 할인", "priority": 1, "match_type": "broad"},
+            {"advertiser_id": 3, "keyword": "50% 세일", "priority": 1, "match_type": "broad"},
+        ]
+    )
+    assert [r["advertiser_id"] for r in _match(index, "a_b")] == [1]
+    assert [r["advertiser_id"] for r in _match(index, "50%")] == [3]
+
+    # SQL 경로 패턴도 같은 문자 그대로 비교가 되도록 이스케이프
+    assert like_pattern("a_b") == "%a\\_b%"
+    assert like_pattern("50%") == "%50\\%%"
+    assert like_pattern("c:\\x") == "%c:\\\\x%"
+    assert m._query_terms("a_b")[2] == ["%a\\_b%"]
+
+
+def test_rows_are_ordered_by_stage():
+    index = KeywordMatchIndex.from_rows(KEYWORD_ROWS)
+    rows = _match(index, "테스트키워드")
+    assert [r["match_type"] for r in rows] == ["exact", "broad"]
+
+
+@pytest.mark.asyncio
+async def test_find_matching_advertisers_uses_index(monkeypatch):
+    index = KeywordMatchIndex.from_rows(KEYWORD_ROWS)
+    monkeypatch.setattr(m, "_matching_index", index)
+
+    queries = []
+
+    async def fake_fetch_all(query, values=None):
+        queries.append(query)
+        if "from auto_bid_settings" in query.lower():
+            return [
+                {"advertiser_id": adv_id, "min_quality_score": 50}
+                for adv_id in values["ids"]
+            ]
+        return []
+
+    monkeypatch.setattr(m.database, "fetch_all", fake_fetch_all)
+
+    result = await m.find_matching_advertisers("테스트 키워드", 80)
+
+    assert all("advertiser_keywords" not in q for q in queries)
+    by_id = {r["advertiser_id"]: r for r in result}
+    assert by_id[101]["reasons"] == ["KW_EXACT:테스트키워드"]
+    assert by_id[101]["match_score"] == pytest.approx(1.0 * 1.5)
+    assert by_id[303]["reasons"] == ["KW_BROAD:키워드"]
+
+
+@pytest.mark.asyncio
+async def test_find_matching_advertisers_sql_fallback_single_query(monkeypatch):
+    monkeypatch.setattr(m, "_matching_index", None)
+    monkeypatch.setattr(m, "_settings_cache", None)
+
+    calls = []
+
+    async def fake_fetch_all(query, values=None):
+        calls.append(values)
+        return [
+            {"stage": 1, "advertiser_id": 101, "keyword": "테스트키워드", "priority": 5,
+             "match_type": "exact", "category_path": None, "is_primary": None,
+             "min_quality_score": 90},
+            {"stage": 4, "advertiser_id": 303, "keyword": None, "priority": None,
+             "match_type": None, "category_path": "IT>소프트웨어", "is_primary": True,
+             "min_quality_score": 50},
+        ]
+
+    monkeypatch.setattr(m.database, "fetch_all", fake_fetch_all)
+
+    result = await m.find_matching_advertisers("테스트 키워드", 80)
+
+    assert len(calls) == 1
+    assert set(calls[0]) == {"tokens_norm", "tokens_like"}
+    assert all(isinstance(v, list) for v in calls[0].values())
+    by_id = {r["advertiser_id"]: r for r in result}
+    assert by_id[101]["reasons"] == ["KW_EXACT:테스트키워드"]
+    assert by_id[303]["reasons"] == ["CAT:IT>소프트웨어"]
+
+
+@pytest.mark.asyncio
+async def test_batch_matching_shares_queries_and_matches_single_path(monkeypatch):
+    monkeypatch.setattr(m, "_settings_cache", None)
+    monkeypatch.setattr(m, "_match_cache", None)
+    category_row = {"advertiser_id": 606, "category_path": "IT>소프트웨어", "is_primary": False}
+
+    calls = []
+
+    async def fake_fetch_all(query, values=None):
+        calls.append(query)
+        if query == m.BATCH_KEYWORD_CANDIDATES_SQL:
+            return KEYWORD_ROWS
+        if query == m.BATCH_CATEGORY_MATCH_SQL:
+            return [{"term": "%키워드%", **category_row}]
+        if query == m.CATEGORY_MATCH_SQL:
+            return [category_row] if "%키워드%" in values["tokens_like"] else []
+        if "from auto_bid_settings" in query.lower():
+            return [{"advertiser_id": a, "min_quality_score": 50} for a in values["ids"]]
+        return []
+
+    monkeypatch.setattr(m.database, "fetch_all", fake_fetch_all)
+    items = [("테스트 키워드", 80), ("제주도 항공권", 40), ("테스트 키워드", 40), ("??", 80)]
+
+    monkeypatch.setattr(m, "_matching_index", None)
+    batch = await m.find_matching_advertisers_batch(items)
+    assert len(calls) == 3  # 키워드 후보 + 카테고리 + 설정
+
+    monkeypatch.setattr(m, "_matching_index", KeywordMatchIndex.from_rows(KEYWORD_ROWS))
+    single = [await m.find_matching_advertisers(q, score) for q, score in items]
+
+    assert batch == single
+    assert {r["advertiser_id"] for r in batch[0]} == {101, 303, 606}
+    assert batch[3] == []
@@ -0,0 +1,78 @@
+import pytest
+from unittest.mock import AsyncMock
+
+import services.auction_service.main as m
+from services.auction_service.utils.batch_writer import BatchWriter
+from services.auction_service.utils.metrics import StageMetrics, percentile
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0.0
+
+
+def test_prometheus_histogram_is_cumulative():
+    metrics = StageMetrics(buckets=(0.01, 0.1))
+    for seconds in (0.005, 0.05, 0.5):
+        metrics.observe("build_tokens", seconds)
+
+    text = metrics.render_prometheus()
+    assert "# TYPE auction_stage_duration_seconds histogram" in text
+    assert 'auction_stage_duration_seconds_bucket{stage="build_tokens",le="0.01"} 1' in text
+    assert 'auction_stage_duration_seconds_bucket{stage="build_tokens",le="0.1"} 2' in text
+    assert 'auction_stage_duration_seconds_bucket{stage="build_tokens",le="+Inf"} 3' in text
+    assert 'auction_stage_duration_seconds_count{stage="build_tokens"} 3' in text
+
+
+def test_drain_rollup_resets_window_but_keeps_summary():
+    metrics = StageMetrics()
+    with metrics.timer("sign_click"):
+        pass
+    metrics.observe("sign_click", 0.002)
+
+    rollup = metrics.drain_rollup()
+    assert rollup["sign_click"]["count"] == 2
+    assert rollup["sign_click"]["max_ms"] == 2.0
+    assert metrics.drain_rollup() == {}
+    assert metrics.summary()["sign_click"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rollup_writes_one_statement(mocker):
+    metrics = StageMetrics()
+    metrics.observe("bid_insert", 0.004)
+    mocker.patch.object(m, "stage_metrics", metrics)
+    mock_execute = mocker.patch.object(m.database, "execute", new_callable=AsyncMock)
+
+    assert await m.rollup_stage_metrics() == 4
+    mock_execute.assert_awaited_once()
+    values = mock_execute.await_args.args[1]
+    assert values["metric_names"] == [
+        "stage.bid_insert.p50_ms",
+        "stage.bid_insert.p95_ms",
+        "stage.bid_insert.p99_ms",
+        "stage.bid_insert.avg_ms",
+    ]
+    assert values["metric_values"] == [4.0, 4.0, 4.0, 4.0]
+    assert await m.rollup_stage_metrics() == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client):
+    m.stage_metrics.observe("start_total", 0.01)
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'stage="start_total"' in response.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_dropped_log_rows(client, mocker):
+    writer = BatchWriter(AsyncMock(), name="auto_bid_logs", max_pending=1)
+    writer.dropped = 3
+    mocker.patch.object(m, "_auto_bid_log_writer", writer)
+    response = await client.get("/metrics")
+    assert 'auction_batch_writer_dropped_rows_total{writer="auto_bid_logs"} 3' in response.text
@@ -0,0 +1,57 @@
+import pytest
+
+from services.auction_service.utils.prepared import (
+    PreparedStatementRegistry,
+    to_positional,
+)
+
+
+class FakeStatement:
+    def __init__(self, sql):
+        self.sql = sql
+
+    async def fetch(self, *args):
+        return [{"sql": self.sql, "args": args}]
+
+
+class FakeConnection:
+    def __init__(self, pid):
+        self.pid = pid
+        self.prepared = []
+
+    def get_server_pid(self):
+        return self.pid
+
+    async def prepare(self, sql):
+        self.prepared.append(sql)
+        return FakeStatement(sql)
+
+
+def test_to_positional_reuses_index_and_skips_casts():
+    sql, names = to_positional(
+        "SELECT NULL::text WHERE a = ANY(CAST(:ids AS int[])) OR b = :x OR c = :ids"
+    )
+    assert sql == "SELECT NULL::text WHERE a = ANY(CAST($1 AS int[])) OR b = $2 OR c = $1"
+    assert names == ["ids", "x"]
+
+
+@pytest.mark.asyncio
+async def test_registry_prepares_once_per_connection():
+    registry = PreparedStatementRegistry()
+    conn_a, conn_b = FakeConnection(1), FakeConnection(2)
+    sql = "SELECT * FROM t WHERE id = ANY(:ids)"
+
+    rows = await registry.fetch(conn_a, sql, {"ids": [1, 2]})
+    await registry.fetch(conn_a, sql, {"ids": [3]})
+    await registry.fetch(conn_b, sql, {"ids": [4]})
+
+    assert rows == [{"sql": "SELECT * FROM t WHERE id = ANY($1)", "args": ([1, 2],)}]
+    assert len(conn_a.prepared) == 1
+    assert len(conn_b.prepared) == 1
+    assert registry.stats() == {
+        "hits": 1,
+        "misses": 2,
+        "hit_rate": 0.3333,
+        "connections": 2,
+        "statements": 2,
+    }
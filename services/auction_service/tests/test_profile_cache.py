@@ -0,0 +1,71 @@
+import pytest
+
+import services.auction_service.main as m
+from services.auction_service.utils.profile_cache import AdvertiserProfileCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _row(advertiser_id, max_bid=3000):
+    return {
+        "advertiser_id": advertiser_id,
+        "company_name": f"Advertiser-{advertiser_id}",
+        "website_url": f"https://adv{advertiser_id}.example.com",
+        "daily_budget": 100000,
+        "max_bid_per_keyword": max_bid,
+        "recommended_bid_min": 500,
+        "recommended_bid_max": None,
+    }
+
+
+def test_cache_stores_missing_advertisers_and_expires():
+    clock = FakeClock()
+    cache = AdvertiserProfileCache(ttl_seconds=10, clock=clock)
+
+    info, missing = cache.get_many([11, 12])
+    assert info == {} and missing == [11, 12]
+    cache.put_rows(missing, [_row(11)], cache.generation)
+
+    info, missing = cache.get_many([11, 12])
+    assert info == {11: _row(11)}
+    assert missing == []  # 12 는 비활성으로 캐시됨
+
+    clock.now = 10
+    assert cache.get_many([11])[1] == [11]
+
+
+def test_invalidation_discards_in_flight_results():
+    cache = AdvertiserProfileCache()
+    generation = cache.generation
+    cache.invalidate([11])
+    cache.put_rows([11], [_row(11)], generation)
+    assert cache.get_many([11])[1] == [11]
+
+
+@pytest.mark.asyncio
+async def test_fetch_advertiser_details_queries_only_uncached(monkeypatch):
+    monkeypatch.setattr(m, "_profile_cache", AdvertiserProfileCache())
+    queried = []
+
+    async def fake_fetch_all(query, values=None):
+        queried.append(values["ids"])
+        return [_row(a, max_bid=4000 if len(queried) > 2 else 3000) for a in values["ids"]]
+
+    monkeypatch.setattr(m.database, "fetch_all", fake_fetch_all)
+
+    assert set(await m.fetch_advertiser_details([11, 12])) == {11, 12}
+    info = await m.fetch_advertiser_details([11, 12, 13])
+    assert queried == [[11, 12], [13]]
+    assert info[11]["max_bid_per_keyword"] == 3000
+
+    # 설정/프로필 변경 이벤트는 해당 광고주만 무효화
+    await m.apply_matching_changes({11: {"profile"}})
+    info = await m.fetch_advertiser_details([11, 12])
+    assert queried[-1] == [11]
+    assert info[11]["max_bid_per_keyword"] == 4000
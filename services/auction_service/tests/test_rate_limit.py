@@ -0,0 +1,74 @@
+import pytest
+
+from services.auction_service.utils.rate_limit import (
+    PostgresRateLimiter,
+    SlidingWindowRateLimiter,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_sliding_window_allows_max_requests_per_window():
+    clock = FakeClock()
+    limiter = SlidingWindowRateLimiter(10, 3, clock=clock)
+
+    assert [limiter.allow("ip:q") for _ in range(4)] == [True, True, True, False]
+    assert limiter.allow("ip:other")
+
+    clock.now = 9.9
+    assert not limiter.allow("ip:q")
+    clock.now = 10.0
+    assert limiter.allow("ip:q")
+
+
+def test_keys_are_bounded_by_lru():
+    limiter = SlidingWindowRateLimiter(10, 1, max_keys=2, clock=FakeClock())
+
+    limiter.allow("a")
+    limiter.allow("b")
+    assert not limiter.allow("a")  # "b" 가 가장 오래 사용되지 않음
+    limiter.allow("c")
+
+    assert len(limiter) == 2
+    assert limiter.allow("b")  # 제거된 키는 새로 시작
+    assert limiter.stats()["evicted"] == 2
+
+
+class FakeDatabase:
+    is_connected = True
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.calls = []
+
+    async def fetch_one(self, query, values=None):
+        self.calls.append(values)
+        row = self.rows.pop(0)
+        if isinstance(row, Exception):
+            raise row
+        return row
+
+    async def execute(self, query, values=None):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_postgres_limiter_uses_returned_row_and_falls_back_on_error():
+    fallback = SlidingWindowRateLimiter(10, 1, clock=FakeClock())
+    limiter = PostgresRateLimiter(10, 3, fallback=fallback)
+    db = FakeDatabase([{"ok": 1}, None, RuntimeError("db down"), RuntimeError("db down")])
+
+    assert await limiter.allow(db, "k")
+    assert not await limiter.allow(db, "k")
+    assert db.calls[0] == {"key": "k", "window": 10, "max_requests": 3}
+
+    # DB 오류 시 로컬 리미터로 판정
+    assert await limiter.allow(db, "k")
+    assert not await limiter.allow(db, "k")
+    assert limiter.stats()["failures"] == 2
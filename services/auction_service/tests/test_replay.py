@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import pytest
+
+from services.auction_service.benchmarks.replay import (
+    ReplayReport,
+    diff_bids,
+    group_logged_auctions,
+    replay,
+)
+
+
+def _log(advertiser_id, query, bid_amount, competitor_count, auction_id=1, quality_score=80):
+    return {
+        "advertiser_id": advertiser_id,
+        "search_query": query,
+        "bid_amount": bid_amount,
+        "quality_score": quality_score,
+        "competitor_count": competitor_count,
+        "created_at": "2024-05-01 00:00:00",
+        "auction_id": auction_id,
+        "search_id": f"search_{auction_id}" if auction_id else None,
+    }
+
+
+def test_group_logged_auctions_splits_by_auction_and_competitor_count():
+    rows = [
+        _log(11, "노트북", 3000, 2, auction_id=1),
+        _log(12, "노트북", 2000, 2, auction_id=1),
+        # 같은 검색어가 연달아 기록돼도 competitor_count 만큼 모이면 다음 경매
+        _log(11, "노트북", 3000, 1, auction_id=None),
+        _log(None, "없는검색어", 100, 1, auction_id=3),
+    ]
+    groups = list(group_logged_auctions(rows))
+
+    assert [g.bids for g in groups] == [{11: 3000, 12: 2000}, {11: 3000}, {}]
+    assert [g.row_count for g in groups] == [2, 1, 1]
+    assert groups[0].search_id == "search_1"
+    assert groups[1].auction_id is None
+
+
+def test_diff_bids_reports_set_and_price_changes():
+    diff = diff_bids({11: 3000, 12: 2000}, {11: 2500, 13: 4000})
+    assert diff["added"] == [13]
+    assert diff["removed"] == [12]
+    assert diff["price_changes"] == {11: -500}
+    assert diff["jaccard"] == round(1 / 3, 4)
+    assert diff["top_changed"] is True
+    assert diff["identical"] is False
+
+    assert diff_bids({11: 3000}, {11: 3000})["identical"] is True
+
+
+@pytest.mark.asyncio
+async def test_replay_streams_logs_and_compares_bids():
+    rows = [
+        _log(11, "노트북", 3000, 2, auction_id=1),
+        _log(12, "노트북", 2000, 2, auction_id=1),
+        _log(11, "카메라", 1500, 1, auction_id=2),
+    ]
+
+    async def iterate(query, values):
+        for r in rows:
+            yield r
+
+    async def generate_real_advertiser_bids(query, quality_score):
+        if query == "카메라":
+            raise RuntimeError("boom")
+        return [
+            SimpleNamespace(advertiserId=11, price=3000),
+            SimpleNamespace(advertiserId=12, price=2000),
+            SimpleNamespace(advertiserId=None, price=500),
+        ]
+
+    main = SimpleNamespace(
+        database=SimpleNamespace(iterate=iterate),
+        generate_real_advertiser_bids=generate_real_advertiser_bids,
+    )
+    report = await replay(main, None, None, concurrency=2)
+    summary = report.summary()
+
+    assert isinstance(report, ReplayReport)
+    assert summary["auctions"] == 1
+    assert summary["errors"] == 1
+    assert summary["bids"]["identical"] == 1
+    assert summary["latency"]["count"] == 1
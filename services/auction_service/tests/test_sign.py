@@ -0,0 +1,45 @@
+import hmac
+import importlib.util
+from hashlib import sha256
+from pathlib import Path
+
+from services.auction_service.utils.sign import ClickSigner
+
+# verification-service 는 패키지 이름에 '-' 가 있어 파일 경로로 불러옴
+_spec = importlib.util.spec_from_file_location(
+    "verification_sign",
+    Path(__file__).resolve().parents[2] / "verification-service" / "utils" / "sign.py",
+)
+verification_sign = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(verification_sign)
+ClickVerifier = verification_sign.ClickVerifier
+
+
+def _legacy(secret, bid_id, payout, bid_type):
+    return hmac.new(secret.encode(), f"{bid_id}.{payout}.{bid_type}".encode(), sha256).hexdigest()
+
+
+def test_signer_without_key_id_matches_legacy_format():
+    signer = ClickSigner("s1")
+    assert signer.sign("bid_1", 700, "ADVERTISER") == _legacy("s1", "bid_1", 700, "ADVERTISER")
+    assert signer.sign_many([("bid_1", 700, "ADVERTISER"), ("bid_2", 200, "PLATFORM")]) == [
+        _legacy("s1", "bid_1", 700, "ADVERTISER"),
+        _legacy("s1", "bid_2", 200, "PLATFORM"),
+    ]
+
+
+def test_verifier_accepts_current_and_previous_keys():
+    old_sig = ClickSigner("old-secret", "k1").sign("bid_1", 700, "ADVERTISER")
+    new_sig = ClickSigner("new-secret", "k2").sign("bid_1", 700, "ADVERTISER")
+    assert new_sig.startswith("k2.")
+
+    verifier = ClickVerifier("new-secret", "k2", {"k1": "old-secret"})
+    assert verifier.verify("bid_1", 700, "ADVERTISER", new_sig)
+    assert verifier.verify("bid_1", 700, "ADVERTISER", old_sig)
+    assert verifier.verify("bid_1", 700, "ADVERTISER", _legacy("old-secret", "bid_1", 700, "ADVERTISER"))
+    assert not verifier.verify("bid_1", 701, "ADVERTISER", new_sig)
+    assert not verifier.verify("bid_1", 700, "ADVERTISER", "k9." + new_sig.split(".", 1)[1])
+
+
+def test_parse_previous_keys():
+    assert verification_sign._parse_previous_keys("k1:a, k2:b:c,bad,") == {"k1": "a", "k2": "b:c"}
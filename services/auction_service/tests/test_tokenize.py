@@ -28,3 +28,27 @@ def test_build_tokens_english():
 def test_build_tokens_empty():
     assert build_tokens("") == []
     assert build_tokens("  ") == []
+
+
+def test_build_tokens_is_ranked_and_deterministic():
+    tokens = build_tokens("제주 항공권")
+    assert tokens == [
+        "제주항공권",  # 정규화 전체
+        "제주",  # 공백 분리
+        "항공권",
+        "제주항",  # 3-gram
+        "주항공",
+        "주항",  # 2-gram (이미 나온 토큰은 제외)
+        "항공",
+        "공권",
+    ]
+    assert build_tokens("제주 항공권") == tokens
+
+
+def test_build_tokens_truncates_low_rank_bigrams_first():
+    query = "아주 긴 한국어 검색어 문장으로 토큰 개수 제한 확인"
+    tokens = build_tokens(query, max_tokens=12)
+    assert len(tokens) == 12
+    assert tokens[0] == "아주긴한국어검색어문장으로토큰개수제한확인"
+    assert "검색어" in tokens  # 공백 토큰은 유지
+    assert all(len(t) >= 3 for t in tokens[1:] if t not in query.split())
@@ -0,0 +1,206 @@
+"""
+경매 상태 변경 푸시 (SSE / long-poll)
+
+/start, /select 가 경매 상태를 바꾸면 AuctionStatusBroker 에 바로 반영하고
+pg_notify(channel, '{"searchId": ..., "status": ..., ...}') 로 다른 워커에도 알립니다.
+각 워커의 AuctionStatusListener 가 그 알림을 받아 자기 broker 에 반영하므로,
+클라이언트가 어느 워커에 long-poll / SSE 로 붙어 있어도 변경 즉시 응답을 받습니다.
+
+- 상태의 version 은 상태 값에서 만든 문자열이라 워커가 달라도 같은 상태면 같은 값입니다.
+  같은 상태가 다시 들어오면(자기 NOTIFY 수신 등) 무시합니다.
+- 대기는 asyncio.Event 로만 하므로 대기 중인 요청은 DB 연결이나 워커 스레드를 점유하지 않습니다.
+- 구독자가 없는 경매 상태는 max_entries 개까지만 LRU 로 보관합니다.
+"""
+
+import asyncio
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import asyncpg
+import structlog
+
+logger = structlog.get_logger()
+
+# 더 이상 바뀌지 않는 상태 (SSE 스트림은 이 상태를 보낸 뒤 종료)
+TERMINAL_STATUSES = ("completed", "expired")
+
+
+def status_version(state: Dict[str, Any]) -> str:
+    """워커와 무관하게 같은 상태면 같은 값이 되는 상태 버전 (participants 는 참고용이라 제외)"""
+    return f"{state.get('status') or ''}:{state.get('selectedBidId') or ''}"
+
+
+class _Entry:
+    __slots__ = ("state", "version", "changed", "waiters")
+
+    def __init__(self) -> None:
+        self.state: Optional[Dict[str, Any]] = None
+        self.version = ""
+        self.changed = asyncio.Event()
+        self.waiters = 0
+
+
+class AuctionStatusBroker:
+    """search_id 별 최신 상태와 변경 대기"""
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.published = 0
+        self.duplicates = 0
+        self.wakeups = 0
+
+    def _entry(self, search_id: str) -> _Entry:
+        entry = self._entries.get(search_id)
+        if entry is None:
+            entry = _Entry()
+            self._entries[search_id] = entry
+            self._evict()
+        else:
+            self._entries.move_to_end(search_id)
+        return entry
+
+    def _evict(self) -> None:
+        # 대기 중인 구독자가 있는 항목은 남겨 둠
+        for search_id in list(self._entries):
+            if len(self._entries) <= self._max_entries:
+                return
+            if not self._entries[search_id].waiters:
+                del self._entries[search_id]
+
+    def current(self, search_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        entry = self._entries.get(search_id)
+        if entry is None or entry.state is None:
+            return None
+        return entry.version, entry.state
+
+    def publish(self, search_id: str, state: Dict[str, Any], *, create: bool = True) -> bool:
+        """
+        상태 반영. 이전과 같은 상태면 False (대기자를 깨우지 않음)
+        create=False 면 이 워커가 모르는 경매(구독자도 없음)는 보관하지 않음
+        """
+        if not create and search_id not in self._entries:
+            return False
+        entry = self._entry(search_id)
+        version = status_version(state)
+        if entry.state is not None and version == entry.version:
+            self.duplicates += 1
+            return False
+        if state.get("participants") is None and entry.state is not None:
+            # participants 를 모르는 변경(/select 등)은 이전 값을 유지
+            state = {**state, "participants": entry.state.get("participants")}
+        entry.state = {**state, "searchId": search_id, "version": version}
+        entry.version = version
+        self.published += 1
+        if entry.waiters:
+            self.wakeups += entry.waiters
+        # 기다리던 요청을 모두 깨우고 다음 변경용 Event 로 교체
+        entry.changed.set()
+        entry.changed = asyncio.Event()
+        return True
+
+    async def wait_for_change(
+        self, search_id: str, since: Optional[str], timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        현재 version 이 since 와 다르면 즉시, 같으면 바뀔 때까지(최대 timeout 초) 기다린 뒤 상태 반환.
+        timeout 안에 바뀌지 않으면 None
+        """
+        entry = self._entry(search_id)
+        if entry.state is not None and entry.version != since:
+            return entry.state
+        changed = entry.changed
+        entry.waiters += 1
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            entry.waiters -= 1
+        return entry.state
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "waiters": sum(e.waiters for e in self._entries.values()),
+            "published": self.published,
+            "duplicates": self.duplicates,
+            "wakeups": self.wakeups,
+        }
+
+
+def status_payload(search_id: str, state: Dict[str, Any]) -> str:
+    """pg_notify payload (8000 바이트 제한 안쪽의 작은 JSON)"""
+    return json.dumps({**state, "searchId": search_id}, ensure_ascii=False, default=str)
+
+
+class AuctionStatusListener:
+    """전용 연결로 경매 상태 채널을 LISTEN 하여 broker 에 반영합니다."""
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        broker: AuctionStatusBroker,
+        *,
+        health_interval: float = 5.0,
+        max_backoff: float = 30.0,
+    ) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._broker = broker
+        self._health_interval = health_interval
+        self._max_backoff = max_backoff
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.events_received = 0
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._connection_loop())
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            data = json.loads(payload)
+            search_id = str(data.pop("searchId"))
+        except (ValueError, TypeError, KeyError, AttributeError):
+            logger.warning("auction_status_payload_invalid", payload=payload)
+            return
+        self.events_received += 1
+        data.pop("version", None)
+        # 구독자는 대기 시작 시 항목을 만들므로, 모르는 경매는 나중에 DB 에서 읽으면 됨
+        self._broker.publish(search_id, data, create=False)
+
+    async def _connection_loop(self) -> None:
+        backoff = 1.0
+        conn: Optional[asyncpg.Connection] = None
+        while not self._stopping:
+            try:
+                conn = await asyncpg.connect(self._dsn)
+                await conn.add_listener(self._channel, self._on_notify)
+                logger.info("auction_status_listener_connected", channel=self._channel)
+                backoff = 1.0
+                while not conn.is_closed():
+                    await asyncio.sleep(self._health_interval)
+                    await conn.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 끊긴 동안의 변경은 long-poll / SSE 가 DB 상태를 다시 읽으면서 보정됨
+                logger.warning("auction_status_listener_error", error=str(e), retry_in=backoff)
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            conn = None
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self._max_backoff)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"events_received": self.events_received}
@@ -0,0 +1,189 @@
+"""
+만료 경매 정리(sweeper)
+
+expires_at 이 지난 'active' 경매를 batch_size 개씩 'expired' 로 바꾸고, 선택되지 않은
+광고주 bid 가 예약해 둔 일일 예산(advertiser_daily_spend)을 bid 생성일(KST) 기준으로 돌려줍니다.
+선택이 끝난(completed) 경매의 나머지 bid 예약분은 /select 가 같은 규칙으로 선택 시점에 돌려줍니다.
+
+- 한 묶음 = 한 문장(트랜잭션). FOR UPDATE SKIP LOCKED 로 여러 워커가 동시에 돌아도
+  같은 경매를 두 번 처리하지 않고, select_bid 가 잠근 경매는 건너뜁니다.
+- 한 번 실행에 max_batches 묶음까지만 처리하고 다음 주기로 넘겨 DB 부하를 제한합니다.
+- 예산 페이싱 모드에서도 flush 가 spend.amount 를 증감으로 반영하므로 그대로 차감하면 됩니다.
+- 만료시킨 경매의 search_id 는 on_expired 로 넘겨 상태 구독자(long-poll / SSE)에게 알립니다.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+ExpiredCallback = Callable[[List[str]], Awaitable[None]]
+
+# 만료 경매 한 묶음 처리
+# - expired : 만료 대상 경매를 잠그고(다른 트랜잭션이 잠근 행은 건너뜀) 상태 변경
+# - released: 해당 경매의 광고주 bid 예약 금액을 광고주·지출일별로 합산
+# - refunded: advertiser_daily_spend 에서 차감 (0 미만으로 내려가지 않음)
+EXPIRE_AUCTIONS_SQL = """
+    WITH candidates AS (
+        SELECT id FROM auctions
+        WHERE status = 'active' AND expires_at < :now
+        ORDER BY expires_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    ), expired AS (
+        UPDATE auctions a
+        SET status = 'expired'
+        FROM candidates c
+        WHERE a.id = c.id
+        RETURNING a.id, a.search_id
+    ), released AS (
+        SELECT b.advertiser_id,
+               (timezone('Asia/Seoul', CAST(b.created_at AS timestamptz)))::date AS spend_date,
+               SUM(b.price) AS amount
+        FROM bids b
+        JOIN expired e ON e.id = b.auction_id
+        WHERE b.type = 'ADVERTISER'
+          AND b.advertiser_id IS NOT NULL
+          AND b.advertiser_id <> :platform_advertiser_id
+        GROUP BY 1, 2
+    ), refunded AS (
+        UPDATE advertiser_daily_spend s
+        SET amount = GREATEST(s.amount - r.amount, 0)
+        FROM released r
+        WHERE s.advertiser_id = r.advertiser_id AND s.spend_date = r.spend_date
+        RETURNING r.amount
+    )
+    SELECT
+        (SELECT COUNT(*) FROM expired) AS expired,
+        (SELECT COUNT(*) FROM refunded) AS refunded_rows,
+        (SELECT COALESCE(SUM(amount), 0) FROM refunded) AS released_amount,
+        (SELECT COALESCE(array_agg(search_id), ARRAY[]::text[]) FROM expired) AS search_ids
+"""
+
+
+def _utc_now_naive() -> datetime:
+    """auctions.expires_at 과 같은 tz 없는 UTC"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class AuctionExpirySweeper:
+    """만료 경매를 주기적으로 정리하고 진행 카운터를 제공합니다."""
+
+    def __init__(
+        self,
+        database: Any,
+        *,
+        interval: float = 30.0,
+        batch_size: int = 500,
+        max_batches: int = 20,
+        platform_advertiser_id: int = 1,
+        now: Callable[[], datetime] = _utc_now_naive,
+        on_expired: Optional[ExpiredCallback] = None,
+    ) -> None:
+        self._db = database
+        self._interval = interval
+        self._batch_size = batch_size
+        self._max_batches = max_batches
+        self._platform_advertiser_id = platform_advertiser_id
+        self._now = now
+        self._on_expired = on_expired
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.batches = 0
+        self.expired = 0
+        self.refunded_rows = 0
+        self.released_amount = 0
+        self.failures = 0
+        self.backlog_remaining = False
+        self.last_run_at: Optional[datetime] = None
+        self.last_run_ms = 0.0
+
+    async def sweep_batch(self) -> int:
+        """한 묶음 처리, 만료시킨 경매 수 반환"""
+        row = await self._db.fetch_one(
+            EXPIRE_AUCTIONS_SQL,
+            {
+                "now": self._now(),
+                "batch_size": self._batch_size,
+                "platform_advertiser_id": self._platform_advertiser_id,
+            },
+        )
+        expired = int(row["expired"] or 0) if row else 0
+        self.batches += 1
+        self.expired += expired
+        if row:
+            self.refunded_rows += int(row["refunded_rows"] or 0)
+            self.released_amount += int(row["released_amount"] or 0)
+            search_ids = list(row["search_ids"] or [])
+            if search_ids and self._on_expired is not None:
+                # 만료는 이미 커밋됨 - 알림 실패가 다음 묶음 처리를 막지 않도록 로그만 남김
+                try:
+                    await self._on_expired(search_ids)
+                except Exception as e:
+                    logger.warning(
+                        "expired_auctions_publish_failed", count=len(search_ids), error=str(e)
+                    )
+        return expired
+
+    async def sweep(self) -> int:
+        """
+        만료 대상이 없거나 max_batches 묶음을 처리할 때까지 반복합니다.
+        반환: 이번 실행에서 만료시킨 경매 수
+        """
+        started = time.perf_counter()
+        total = 0
+        full = False
+        for _ in range(self._max_batches):
+            expired = await self.sweep_batch()
+            total += expired
+            full = expired >= self._batch_size
+            if not full:
+                break
+        self.runs += 1
+        self.backlog_remaining = full
+        self.last_run_at = self._now()
+        self.last_run_ms = round((time.perf_counter() - started) * 1000, 3)
+        if total:
+            logger.info(
+                "expired_auctions_swept",
+                expired=total,
+                backlog_remaining=full,
+                duration_ms=self.last_run_ms,
+            )
+        return total
+
+    # --- 수명 주기 ---
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                self.failures += 1
+                logger.error("auction_sweep_failed", error=str(e), exc_info=True)
+            await asyncio.sleep(self._interval)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "batches": self.batches,
+            "expired": self.expired,
+            "refunded_rows": self.refunded_rows,
+            "released_amount": self.released_amount,
+            "failures": self.failures,
+            "backlog_remaining": self.backlog_remaining,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_run_ms": self.last_run_ms,
+        }
@@ -0,0 +1,216 @@
+"""
+짧은 시간 창(window) 동안 여러 요청의 행을 모아 한 번에 쓰는 배치 writer
+
+- write(items)        : 배치가 DB 에 반영될 때까지 대기 (실패 시 예외 전파)
+- write_nowait(items) : 대기하지 않고 큐에만 넣음 (write-behind). 큐가 가득 차면 False
+- enqueue(items, timeout) : write-behind 이되 큐에 자리가 날 때까지 최대 timeout 초 대기
+                            (backpressure). 그래도 자리가 없으면 버리고 False (dropped 에 집계)
+- stop()              : 새 flush 를 멈추지 않고 _run 이 남은 행을 모두 반영한 뒤 종료
+
+첫 행이 들어온 뒤 window 초 또는 max_batch 행이 모일 때까지 기다렸다가 flush 함수를
+한 번 호출합니다. 동시에 도착한 경매들의 INSERT 를 하나의 다중 행 문장으로 합치는 용도입니다.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+FlushFn = Callable[[List[Any]], Awaitable[None]]
+
+
+class BatchWriter:
+    """요청 간 배치 writer (flush 는 항상 한 번에 하나씩 실행)"""
+
+    def __init__(
+        self,
+        flush: FlushFn,
+        *,
+        name: str,
+        window: float = 0.005,
+        max_batch: int = 500,
+        max_pending: int = 10000,
+    ) -> None:
+        self._flush = flush
+        self.name = name
+        self._window = window
+        self._max_batch = max_batch
+        self._max_pending = max_pending
+        self._pending: Deque[Tuple[List[Any], Optional[asyncio.Future]]] = deque()
+        self._pending_rows = 0
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self._space = asyncio.Event()
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.rows = 0
+        self.failures = 0
+        self.dropped = 0
+        self.waited = 0
+        self.largest_batch = 0
+
+    @property
+    def pending_rows(self) -> int:
+        return self._pending_rows
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """남은 행을 모두 반영하고 종료합니다 (진행 중인 flush 도 끝까지 기다림)."""
+        self._stopping = True
+        self._wakeup.set()
+        self._full.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        # start 하지 않았거나 _run 이 비정상 종료한 경우의 잔여 행
+        while self._pending:
+            await self._flush_pending()
+
+    async def write(self, items: List[Any]) -> None:
+        if not items:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._append(items, future)
+        await future
+
+    def write_nowait(self, items: List[Any]) -> bool:
+        if not items:
+            return True
+        if self._pending_rows + len(items) > self._max_pending:
+            self.dropped += len(items)
+            return False
+        self._append(items, None)
+        return True
+
+    async def enqueue(self, items: List[Any], timeout: float) -> bool:
+        if not items:
+            return True
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        waited = False
+        # 큐가 비어 있으면 max_pending 보다 큰 묶음도 받음 (영원히 못 들어가는 것 방지)
+        while self._pending_rows and self._pending_rows + len(items) > self._max_pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0 or self._stopping:
+                self.dropped += len(items)
+                return False
+            waited = True
+            self._space.clear()
+            try:
+                await asyncio.wait_for(self._space.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+        self.waited += waited
+        self._append(items, None)
+        return True
+
+    def _append(self, items: List[Any], future: Optional[asyncio.Future]) -> None:
+        self._pending.append((items, future))
+        self._pending_rows += len(items)
+        self._wakeup.set()
+        if self._pending_rows >= self._max_batch:
+            self._full.set()
+
+    async def _run(self) -> None:
+        while not (self._stopping and not self._pending):
+            await self._wakeup.wait()
+            if self._pending_rows < self._max_batch and not self._stopping:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self._window)
+                except asyncio.TimeoutError:
+                    pass
+            await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        # max_batch 단위로 잘라서 반영 (요청 하나의 행은 나누지 않음)
+        batch: List[Tuple[List[Any], Optional[asyncio.Future]]] = []
+        rows = 0
+        while self._pending and (
+            not batch or rows + len(self._pending[0][0]) <= self._max_batch
+        ):
+            items, future = self._pending.popleft()
+            batch.append((items, future))
+            rows += len(items)
+        self._pending_rows -= rows
+        if rows:
+            self._space.set()
+        if not self._pending:
+            self._wakeup.clear()
+        if self._pending_rows < self._max_batch:
+            self._full.clear()
+        if not batch:
+            return
+
+        all_items = [item for items, _ in batch for item in items]
+        try:
+            await self._flush(all_items)
+        except asyncio.CancelledError:
+            # 꺼낸 묶음을 큐 앞에 되돌려 stop() 이 다시 반영하도록 함 (write() 대기자 유지)
+            self._requeue(batch)
+            raise
+        except Exception as e:
+            if len(batch) == 1:
+                self._fail(batch, e)
+                return
+            # 한 요청의 잘못된 행이 다른 요청까지 실패시키지 않도록 요청 단위로 재시도
+            for i, part in enumerate(batch):
+                try:
+                    await self._flush(part[0])
+                except asyncio.CancelledError:
+                    self._requeue(batch[i:])
+                    raise
+                except Exception as part_error:
+                    self._fail([part], part_error)
+                    continue
+                self._succeed([part])
+            return
+        self._succeed(batch)
+
+    def _requeue(self, batch: List[Tuple[List[Any], Optional[asyncio.Future]]]) -> None:
+        for part in reversed(batch):
+            self._pending.appendleft(part)
+        self._pending_rows += sum(len(items) for items, _ in batch)
+        self._wakeup.set()
+
+    def _succeed(self, batch: List[Tuple[List[Any], Optional[asyncio.Future]]]) -> None:
+        rows = sum(len(items) for items, _ in batch)
+        self.batches += 1
+        self.rows += rows
+        self.largest_batch = max(self.largest_batch, rows)
+        for _, future in batch:
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    def _fail(
+        self, batch: List[Tuple[List[Any], Optional[asyncio.Future]]], error: Exception
+    ) -> None:
+        self.failures += 1
+        for items, future in batch:
+            if future is None:
+                # write_nowait 행은 알려줄 호출자가 없으므로 로그만 남김
+                logger.error(
+                    "batch_writer_flush_failed",
+                    writer=self.name,
+                    rows=len(items),
+                    error=str(error),
+                )
+            elif not future.done():
+                future.set_exception(error)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "avg_batch": round(self.rows / self.batches, 2) if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "pending_rows": self._pending_rows,
+            "failures": self.failures,
+            "dropped": self.dropped,
+            "waited": self.waited,
+        }
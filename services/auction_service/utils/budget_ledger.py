@@ -0,0 +1,461 @@
+"""
+광고주 예산 리스(lease) 원장 - 선택적 예산 페이싱 모드
+
+기본 경로는 입찰마다 advertiser_daily_spend 행을 FOR UPDATE 로 잠그므로, 인기 광고주의
+행이 모든 경매 워커의 잠금 경합 지점이 됩니다. 이 모드에서는 각 워커가 광고주 일일 예산의
+일부를 리스로 확보해 두고 입찰 예약은 메모리에서 처리하며, 실제 지출은 주기적으로 모아서
+advertiser_daily_spend 에 반영합니다.
+
+불변식 (광고주·일자별):  spend.amount + SUM(leases.outstanding) <= daily_budget
+- 리스 발급: spend 행을 잠근 상태에서 위 불변식을 확인하고 outstanding 증가
+- flush     : 사용액만큼 spend.amount 증가 + outstanding 감소 (합계 불변)
+- 정상 종료: flush 후 리스 삭제 (미사용분 반환)
+- 워커 사망: heartbeat 가 끊긴 리스는 다른 워커가 회수하며, 미반영 사용액을 알 수 없으므로
+             outstanding 전체를 지출로 간주(보수적)합니다. 일일 한도는 넘지 않고 덜 쓸 뿐입니다.
+- 자기 리스 만료: 살아 있는 워커라도 마지막 heartbeat 성공 후 lease_ttl 이 지나면 이미 회수됐을
+             수 있으므로 메모리 리스(잔여·미반영분)를 버리고 해당 광고주 예약을 거절합니다.
+             남은 DB 리스 행은 다음 발급/flush 트랜잭션에서 회수와 같은 규칙으로 정산(삭제 +
+             outstanding 전체를 지출로 반영)한 뒤에만 새 리스를 발급하므로, 미반영분이 두 번
+             지출로 잡히지 않습니다.
+
+모든 경매 워커가 같은 모드로 동작해야 합니다 (기본 경로는 outstanding 을 고려하지 않음).
+"""
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+from zoneinfo import ZoneInfo
+
+import structlog
+
+logger = structlog.get_logger()
+
+_KST = ZoneInfo("Asia/Seoul")
+
+
+def kst_today() -> date:
+    """advertiser_daily_spend 와 같은 KST 기준 일자"""
+    return datetime.now(_KST).date()
+
+
+class _Lease:
+    __slots__ = ("remaining", "unflushed", "heartbeat")
+
+    def __init__(self, heartbeat: float) -> None:
+        self.remaining = 0  # 이 워커가 메모리에서 쓸 수 있는 잔여 리스
+        self.unflushed = 0  # 사용했지만 아직 DB 에 반영하지 않은 금액
+        # DB heartbeat_at 을 마지막으로 갱신한 트랜잭션의 시작 시각 (clock 기준, 보수적)
+        self.heartbeat = heartbeat
+
+
+class BudgetLedger:
+    """워커 단위 광고주 예산 리스 원장"""
+
+    def __init__(
+        self,
+        database: Any,
+        *,
+        worker_id: Optional[str] = None,
+        lease_fraction: float = 0.1,
+        flush_interval: float = 1.0,
+        lease_ttl: float = 30.0,
+        today: Callable[[], date] = kst_today,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._db = database
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._lease_fraction = lease_fraction
+        self._flush_interval = flush_interval
+        self._lease_ttl = lease_ttl
+        self._today = today
+        self._clock = clock
+        self._leases: Dict[Tuple[int, date], _Lease] = {}
+        # 메모리에서 버렸지만 DB 리스 행을 아직 정산하지 못한 키
+        self._expired: Set[Tuple[int, date]] = set()
+        self._grant_locks: Dict[int, asyncio.Lock] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.grants = 0
+        self.grant_denials = 0
+        self.flushes = 0
+        self.flush_failures = 0
+        self.reclaimed = 0
+        self.expired_leases = 0
+
+    def _is_stale(self, lease: _Lease) -> bool:
+        return self._clock() - lease.heartbeat >= self._lease_ttl
+
+    def _discard(self, key: Tuple[int, date]) -> None:
+        """
+        heartbeat 가 lease_ttl 을 넘긴 리스를 버립니다. 다른 워커가 이미 outstanding 전체를
+        지출로 회수했을 수 있으므로 미반영분도 flush 하지 않습니다.
+        """
+        lease = self._leases.pop(key)
+        self._expired.add(key)
+        self.expired_leases += 1
+        logger.warning(
+            "budget_lease_expired",
+            advertiser_id=key[0],
+            spend_date=str(key[1]),
+            remaining=lease.remaining,
+            unflushed=lease.unflushed,
+        )
+
+    # --- 예약 (핫 패스) ---
+    async def reserve_many(self, amounts: Dict[int, int]) -> Set[int]:
+        """
+        광고주별 금액을 메모리 리스에서 예약합니다. 리스가 부족하면 추가 발급을 시도합니다.
+        반환: 예약에 성공한 advertiser_id 집합
+        """
+        spend_date = self._today()
+        reserved: Set[int] = set()
+        for advertiser_id in sorted(amounts):
+            amount = amounts[advertiser_id]
+            key = (advertiser_id, spend_date)
+            lease = self._leases.get(key)
+            if lease is not None and self._is_stale(lease):
+                self._discard(key)
+                lease = None
+            if lease is None or lease.remaining < amount:
+                lease = await self._grant(advertiser_id, spend_date, amount)
+            if lease is not None and lease.remaining >= amount:
+                lease.remaining -= amount
+                lease.unflushed += amount
+                reserved.add(advertiser_id)
+        return reserved
+
+    def refund(self, amounts: Dict[int, int]) -> None:
+        """reserve_many 이후 bid 저장이 실패한 경우 메모리 리스로 되돌립니다."""
+        spend_date = self._today()
+        for advertiser_id, amount in amounts.items():
+            lease = self._leases.get((advertiser_id, spend_date))
+            if lease is not None:
+                take = min(amount, lease.unflushed)
+                lease.unflushed -= take
+                lease.remaining += take
+
+    async def _grant(
+        self, advertiser_id: int, spend_date: date, amount: int
+    ) -> Optional[_Lease]:
+        lock = self._grant_locks.setdefault(advertiser_id, asyncio.Lock())
+        async with lock:
+            key = (advertiser_id, spend_date)
+            lease = self._leases.get(key)
+            if lease is not None and self._is_stale(lease):
+                self._discard(key)
+                lease = None
+            if lease is not None and lease.remaining >= amount:
+                return lease  # 대기 중 다른 요청이 이미 발급받음
+            needed = amount - (lease.remaining if lease is not None else 0)
+            settle = key in self._expired
+            started = self._clock()
+            try:
+                granted = await self._grant_tx(advertiser_id, spend_date, needed, settle)
+            except Exception as e:
+                logger.error(
+                    "budget_lease_grant_failed",
+                    advertiser_id=advertiser_id,
+                    error=str(e),
+                    exc_info=True,
+                )
+                return lease
+            if settle:
+                self._expired.discard(key)
+            if granted <= 0:
+                self.grant_denials += 1
+                return lease
+            self.grants += 1
+            if lease is None:
+                lease = self._leases[key] = _Lease(started)
+            lease.remaining += granted
+            lease.heartbeat = max(lease.heartbeat, started)
+            return lease
+
+    async def _grant_tx(
+        self, advertiser_id: int, spend_date: date, needed: int, settle: bool = False
+    ) -> int:
+        """
+        spend 행을 잠그고 가용 예산 내에서 리스를 발급합니다. 발급액(0이면 거절)을 반환.
+        settle 이면 만료로 버린 이 워커의 이전 리스 행을 같은 트랜잭션에서 먼저 정산합니다.
+        """
+        params = {"aid": advertiser_id, "d": spend_date}
+        async with self._db.transaction():
+            await self._db.execute(
+                """
+                INSERT INTO advertiser_daily_spend(advertiser_id, spend_date, amount)
+                VALUES (:aid, :d, 0)
+                ON CONFLICT (advertiser_id, spend_date) DO NOTHING
+                """,
+                params,
+            )
+            if settle:
+                await self._settle_expired_tx([(advertiser_id, spend_date)])
+            # 잠금을 먼저 잡은 뒤 별도 문장으로 읽어야 다른 워커가 방금 커밋한 리스까지 보임
+            # (READ COMMITTED 는 문장 단위 스냅샷)
+            locked = await self._db.fetch_one(
+                """
+                SELECT amount FROM advertiser_daily_spend
+                WHERE advertiser_id = :aid AND spend_date = :d
+                FOR UPDATE
+                """,
+                params,
+            )
+            if not locked:
+                return 0
+            row = await self._db.fetch_one(
+                """
+                SELECT s.amount, abs.daily_budget,
+                       COALESCE((
+                           SELECT SUM(l.outstanding)
+                           FROM advertiser_budget_leases l
+                           WHERE l.advertiser_id = s.advertiser_id
+                             AND l.spend_date = s.spend_date
+                       ), 0) AS outstanding
+                FROM advertiser_daily_spend s
+                JOIN auto_bid_settings abs ON abs.advertiser_id = s.advertiser_id
+                WHERE s.advertiser_id = :aid AND s.spend_date = :d
+                """,
+                params,
+            )
+            if not row:
+                return 0
+            budget = int(row["daily_budget"] or 0)
+            available = budget - int(row["amount"] or 0) - int(row["outstanding"] or 0)
+            if available < needed:
+                return 0
+            grant = min(available, max(needed, int(budget * self._lease_fraction)))
+            await self._db.execute(
+                """
+                INSERT INTO advertiser_budget_leases
+                    (worker_id, advertiser_id, spend_date, outstanding, heartbeat_at)
+                VALUES (:w, :aid, :d, :amt, NOW())
+                ON CONFLICT (worker_id, advertiser_id, spend_date) DO UPDATE
+                SET outstanding = advertiser_budget_leases.outstanding + EXCLUDED.outstanding,
+                    heartbeat_at = NOW()
+                """,
+                {**params, "w": self.worker_id, "amt": grant},
+            )
+            return grant
+
+    # --- 주기 반영 ---
+    async def flush(self) -> None:
+        """사용액을 advertiser_daily_spend 에 일괄 반영하고 heartbeat 를 갱신합니다."""
+        async with self._flush_lock:
+            for key in [k for k, lease in self._leases.items() if self._is_stale(lease)]:
+                self._discard(key)
+            settle = sorted(self._expired)
+            pending: Dict[Tuple[int, date], int] = {}
+            for key, lease in self._leases.items():
+                if lease.unflushed:
+                    pending[key] = lease.unflushed
+                    lease.unflushed = 0
+            started = self._clock()
+            try:
+                await self._flush_tx(pending, settle)
+                self.flushes += 1
+            except Exception as e:
+                self.flush_failures += 1
+                for key, used in pending.items():
+                    lease = self._leases.get(key)
+                    if lease is not None:  # 대기 중 만료로 버려졌으면 정산에 맡김
+                        lease.unflushed += used
+                logger.error("budget_ledger_flush_failed", error=str(e), exc_info=True)
+                return
+            self._expired.difference_update(settle)
+            for lease in self._leases.values():
+                lease.heartbeat = max(lease.heartbeat, started)
+            # 지난 일자 리스는 반영이 끝났으면 정리 (미사용분은 그 날짜 한도와 함께 소멸)
+            today = self._today()
+            expired = [
+                k
+                for k, lease in self._leases.items()
+                if k[1] < today and not lease.unflushed
+            ]
+            for key in expired:
+                del self._leases[key]
+            if expired and not any(k[1] < today for k in self._leases):
+                try:
+                    await self._db.execute(
+                        """
+                        DELETE FROM advertiser_budget_leases
+                        WHERE worker_id = :w AND spend_date < :d
+                        """,
+                        {"w": self.worker_id, "d": today},
+                    )
+                except Exception as e:
+                    logger.warning("budget_lease_cleanup_failed", error=str(e))
+
+    async def _flush_tx(
+        self,
+        pending: Dict[Tuple[int, date], int],
+        settle: Sequence[Tuple[int, date]] = (),
+    ) -> None:
+        async with self._db.transaction():
+            if settle:
+                await self._settle_expired_tx(settle)
+            by_date: Dict[date, Dict[int, int]] = {}
+            for (advertiser_id, spend_date), used in pending.items():
+                by_date.setdefault(spend_date, {})[advertiser_id] = used
+            for spend_date, used_by_adv in by_date.items():
+                ids = sorted(used_by_adv)
+                params = {
+                    "ids": ids,
+                    "used": [used_by_adv[a] for a in ids],
+                    "d": spend_date,
+                    "w": self.worker_id,
+                }
+                # 워커 간 교착 방지를 위해 advertiser_id 순서로 먼저 잠금
+                await self._db.fetch_all(
+                    """
+                    SELECT advertiser_id FROM advertiser_daily_spend
+                    WHERE spend_date = :d AND advertiser_id = ANY(:ids)
+                    ORDER BY advertiser_id
+                    FOR UPDATE
+                    """,
+                    {"ids": ids, "d": spend_date},
+                )
+                await self._db.execute(
+                    """
+                    UPDATE advertiser_daily_spend s
+                    SET amount = s.amount + u.used
+                    FROM unnest(CAST(:ids AS integer[]), CAST(:used AS bigint[]))
+                        AS u(advertiser_id, used)
+                    WHERE s.advertiser_id = u.advertiser_id AND s.spend_date = :d
+                    """,
+                    {k: params[k] for k in ("ids", "used", "d")},
+                )
+                await self._db.execute(
+                    """
+                    UPDATE advertiser_budget_leases l
+                    SET outstanding = l.outstanding - u.used
+                    FROM unnest(CAST(:ids AS integer[]), CAST(:used AS bigint[]))
+                        AS u(advertiser_id, used)
+                    WHERE l.worker_id = :w
+                      AND l.advertiser_id = u.advertiser_id
+                      AND l.spend_date = :d
+                    """,
+                    params,
+                )
+            await self._db.execute(
+                "UPDATE advertiser_budget_leases SET heartbeat_at = NOW() WHERE worker_id = :w",
+                {"w": self.worker_id},
+            )
+
+    async def _settle_expired_tx(self, keys: Sequence[Tuple[int, date]]) -> None:
+        """
+        만료로 버린 이 워커의 리스 행을 삭제하고 outstanding 전체를 지출로 반영합니다
+        (reclaim_stale 과 같은 보수적 규칙). 이미 다른 워커가 회수했으면 아무 일도 없습니다.
+        트랜잭션 안에서 호출해야 합니다.
+        """
+        by_date: Dict[date, List[int]] = {}
+        for advertiser_id, spend_date in keys:
+            by_date.setdefault(spend_date, []).append(advertiser_id)
+        for spend_date, ids in by_date.items():
+            ids = sorted(ids)
+            await self._db.fetch_all(
+                """
+                SELECT advertiser_id FROM advertiser_daily_spend
+                WHERE spend_date = :d AND advertiser_id = ANY(:ids)
+                ORDER BY advertiser_id
+                FOR UPDATE
+                """,
+                {"ids": ids, "d": spend_date},
+            )
+            await self._db.execute(
+                """
+                WITH stale AS (
+                    DELETE FROM advertiser_budget_leases
+                    WHERE worker_id = :w AND spend_date = :d AND advertiser_id = ANY(:ids)
+                    RETURNING advertiser_id, outstanding
+                )
+                UPDATE advertiser_daily_spend s
+                SET amount = s.amount + st.outstanding
+                FROM stale st
+                WHERE s.advertiser_id = st.advertiser_id AND s.spend_date = :d
+                """,
+                {"w": self.worker_id, "ids": ids, "d": spend_date},
+            )
+
+    async def reclaim_stale(self) -> int:
+        """
+        heartbeat 가 끊긴(워커 사망) 리스를 회수합니다.
+        미반영 사용액을 알 수 없으므로 outstanding 전체를 지출로 반영합니다.
+        자기 리스는 회수하지 않고 _discard / _settle_expired_tx 로 처리합니다.
+        """
+        rows = await self._db.fetch_all(
+            """
+            WITH stale AS (
+                DELETE FROM advertiser_budget_leases
+                WHERE heartbeat_at < NOW() - CAST(:ttl AS integer) * INTERVAL '1 second'
+                  AND worker_id <> :w
+                RETURNING advertiser_id, spend_date, outstanding
+            ), totals AS (
+                SELECT advertiser_id, spend_date, SUM(outstanding) AS outstanding
+                FROM stale
+                GROUP BY advertiser_id, spend_date
+            )
+            UPDATE advertiser_daily_spend s
+            SET amount = s.amount + t.outstanding
+            FROM totals t
+            WHERE s.advertiser_id = t.advertiser_id AND s.spend_date = t.spend_date
+            RETURNING s.advertiser_id
+            """,
+            {"ttl": int(self._lease_ttl), "w": self.worker_id},
+        )
+        if rows:
+            self.reclaimed += len(rows)
+            logger.warning("budget_leases_reclaimed", advertisers=len(rows))
+        return len(rows)
+
+    # --- 수명 주기 ---
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+            try:
+                await self.reclaim_stale()
+            except Exception as e:
+                logger.error("budget_lease_reclaim_failed", error=str(e), exc_info=True)
+
+    async def stop(self) -> None:
+        """정상 종료: 사용액 반영 후 이 워커의 리스를 모두 반환합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+        if self._expired or any(lease.unflushed for lease in self._leases.values()):
+            # 반영하지 못한 사용액이나 정산하지 못한 만료 리스가 있으면 리스를 남겨 두고 다른 워커의 회수(보수적)에 맡김
+            logger.error("budget_lease_release_skipped", worker_id=self.worker_id)
+            return
+        try:
+            await self._db.execute(
+                "DELETE FROM advertiser_budget_leases WHERE worker_id = :w",
+                {"w": self.worker_id},
+            )
+            self._leases.clear()
+        except Exception as e:
+            logger.error("budget_lease_release_failed", error=str(e), exc_info=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "leases": len(self._leases),
+            "remaining": sum(lease.remaining for lease in self._leases.values()),
+            "unflushed": sum(lease.unflushed for lease in self._leases.values()),
+            "grants": self.grants,
+            "grant_denials": self.grant_denials,
+            "flushes": self.flushes,
+            "flush_failures": self.flush_failures,
+            "reclaimed": self.reclaimed,
+            "expired_leases": self.expired_leases,
+        }
@@ -0,0 +1,175 @@
+"""
+카테고리 인메모리 매칭 인덱스
+
+CATEGORY_MATCH_SQL 과 같은 판정을 Postgres 없이 수행합니다.
+
+- business_categories : lower(name) LIKE '%tok%' (is_active = true) -> 이름 2-gram 역색인
+- advertiser_categories: starts_with(category_path, mc.path)        -> category_path 문자 단위 접두사 트라이
+
+매칭된 카테고리 path 마다 트라이에서 해당 접두사 아래의 광고주 카테고리를 모으고,
+같은 advertiser_categories 행은 한 번만 반환합니다 (SQL 경로와 CAT: 사유/점수가 같음).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+_GRAM = 2
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i : i + _GRAM] for i in range(len(text) - _GRAM + 1)}
+
+
+class _Node:
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        # 이 노드에서 끝나는 category_path 의 entry ids
+        self.entries: Set[int] = set()
+
+
+class _Entry:
+    __slots__ = ("advertiser_id", "category_path", "is_primary")
+
+    def __init__(self, advertiser_id: int, category_path: str, is_primary: bool):
+        self.advertiser_id = advertiser_id
+        self.category_path = category_path
+        self.is_primary = is_primary
+
+    def as_row(self) -> Dict[str, Any]:
+        return {
+            "advertiser_id": self.advertiser_id,
+            "category_path": self.category_path,
+            "is_primary": self.is_primary,
+        }
+
+
+class CategoryMatchIndex:
+    """business_categories 이름 + advertiser_categories 경로 트라이"""
+
+    def __init__(self) -> None:
+        # 활성 카테고리 lower(name) -> path 목록
+        self._paths_by_name: Dict[str, Set[str]] = {}
+        self._name_grams: Dict[str, Set[str]] = {}
+        self._root = _Node()
+        self._entries: Dict[int, _Entry] = {}
+        self._by_advertiser: Dict[int, Set[int]] = {}
+        self._next_id = 0
+
+    @classmethod
+    def from_rows(
+        cls, category_rows: Iterable[Any], advertiser_rows: Iterable[Any]
+    ) -> "CategoryMatchIndex":
+        """category_rows: 활성 business_categories (name, path), advertiser_rows: advertiser_categories"""
+        index = cls()
+        for r in category_rows:
+            index.add_category(r["name"], r["path"])
+        for r in advertiser_rows:
+            index.add(r["advertiser_id"], r["category_path"], r["is_primary"])
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add_category(self, name: Optional[str], path: Optional[str]) -> None:
+        if not name or path is None:
+            return
+        lower = name.lower()
+        self._paths_by_name.setdefault(lower, set()).add(path)
+        for g in _grams(lower):
+            self._name_grams.setdefault(g, set()).add(lower)
+
+    def add(self, advertiser_id: int, category_path: Optional[str], is_primary: Optional[bool]) -> None:
+        if category_path is None:
+            return
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = _Entry(advertiser_id, category_path, bool(is_primary))
+        self._by_advertiser.setdefault(advertiser_id, set()).add(entry_id)
+
+        node = self._root
+        for ch in category_path:
+            node = node.children.setdefault(ch, _Node())
+        node.entries.add(entry_id)
+
+    def remove_advertiser(self, advertiser_id: int) -> int:
+        """광고주의 모든 카테고리를 트라이에서 제거하고 제거된 개수를 반환합니다."""
+        entry_ids = self._by_advertiser.pop(advertiser_id, set())
+        for entry_id in entry_ids:
+            entry = self._entries.pop(entry_id)
+            path: List[Tuple[_Node, str]] = []
+            node = self._root
+            for ch in entry.category_path:
+                path.append((node, ch))
+                node = node.children[ch]
+            node.entries.discard(entry_id)
+            # 비어 있는 가지 정리
+            for parent, ch in reversed(path):
+                child = parent.children[ch]
+                if child.entries or child.children:
+                    break
+                del parent.children[ch]
+        return len(entry_ids)
+
+    def replace_advertisers(
+        self, advertiser_ids: Iterable[int], rows: Iterable[Any]
+    ) -> None:
+        """
+        광고주 단위 델타 적용: advertiser_ids 의 기존 카테고리를 제거하고 rows 로 교체합니다.
+        rows 에 없는 광고주는 카테고리가 모두 삭제된 것으로 간주합니다.
+        """
+        for advertiser_id in advertiser_ids:
+            self.remove_advertiser(advertiser_id)
+        for r in rows:
+            self.add(r["advertiser_id"], r["category_path"], r["is_primary"])
+
+    def matched_paths(self, like_terms: Sequence[str]) -> Set[str]:
+        """lower(name) LIKE '%tok%' 인 활성 카테고리의 path 집합"""
+        paths: Set[str] = set()
+        for term in like_terms:
+            if len(term) < _GRAM:
+                continue
+            candidates: Optional[Set[str]] = None
+            for g in _grams(term):
+                names = self._name_grams.get(g)
+                if not names:
+                    candidates = set()
+                    break
+                candidates = set(names) if candidates is None else candidates & names
+                if not candidates:
+                    break
+            for name in candidates or ():
+                if term in name:
+                    paths |= self._paths_by_name[name]
+        return paths
+
+    def _subtree_entries(self, prefix: str) -> Set[int]:
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return set()
+        result: Set[int] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            result |= current.entries
+            stack.extend(current.children.values())
+        return result
+
+    def match(self, like_terms: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        CATEGORY_MATCH_SQL 과 같은 (advertiser_id, category_path, is_primary) 행 목록을 반환합니다.
+        like_terms 는 '%' 를 붙이기 전의 토큰(길이 2 이상)입니다.
+        """
+        entry_ids: Set[int] = set()
+        for path in self.matched_paths(like_terms):
+            entry_ids |= self._subtree_entries(path)
+        return [self._entries[i].as_row() for i in sorted(entry_ids)]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "categories": len(self._paths_by_name),
+            "advertiser_categories": len(self._entries),
+            "category_advertisers": len(self._by_advertiser),
+        }
@@ -0,0 +1,163 @@
+"""
+매칭 데이터 변경 이벤트 구독 (Postgres LISTEN/NOTIFY)
+
+advertiser-service / website-analysis-service 가 키워드·카테고리·자동입찰 설정·프로필
+(회사명/웹사이트/심사 추천 입찰가)을 바꾸면
+pg_notify(channel, '{"advertiser_id": 1, "kinds": ["keywords"]}') 를 발행합니다.
+이 리스너는 전용 asyncpg 연결로 채널을 LISTEN 하고, 짧은 시간 동안 들어온 이벤트를
+광고주별로 합쳐 on_changes({advertiser_id: {kinds}}) 로 전달합니다.
+
+연결이 끊기면 재연결하며, 끊긴 동안의 이벤트는 유실될 수 있으므로 재연결 직후
+on_resync() (전체 재적재)를 한 번 호출합니다.
+"""
+
+import asyncio
+import json
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+import asyncpg
+import structlog
+
+logger = structlog.get_logger()
+
+CHANGE_KINDS = ("keywords", "categories", "settings", "profile")
+
+ChangeHandler = Callable[[Dict[int, Set[str]]], Awaitable[None]]
+ResyncHandler = Callable[[], Awaitable[None]]
+
+
+def parse_change_payload(payload: str) -> Optional[tuple[int, Set[str]]]:
+    """NOTIFY payload -> (advertiser_id, kinds). 형식이 잘못되면 None"""
+    try:
+        data = json.loads(payload)
+        advertiser_id = int(data["advertiser_id"])
+    except (ValueError, TypeError, KeyError):
+        return None
+    kinds = {k for k in data.get("kinds") or CHANGE_KINDS if k in CHANGE_KINDS}
+    return advertiser_id, kinds or set(CHANGE_KINDS)
+
+
+class MatchingChangeListener:
+    """전용 연결로 매칭 변경 채널을 LISTEN 하고 광고주 단위 델타를 전달합니다."""
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        on_changes: ChangeHandler,
+        on_resync: ResyncHandler,
+        *,
+        coalesce_seconds: float = 0.05,
+        health_interval: float = 5.0,
+        max_backoff: float = 30.0,
+    ) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._on_changes = on_changes
+        self._on_resync = on_resync
+        self._coalesce_seconds = coalesce_seconds
+        self._health_interval = health_interval
+        self._max_backoff = max_backoff
+        self._queue: "asyncio.Queue[tuple[int, Set[str]]]" = asyncio.Queue()
+        self._ready = asyncio.Event()
+        self._stopping = False
+        self._tasks: list[asyncio.Task] = []
+        self.events_received = 0
+        self.batches_applied = 0
+        self.resyncs = 0
+
+    async def start(self) -> None:
+        """
+        LISTEN 연결 및 델타 적용 태스크를 시작합니다.
+        초기 전체 적재 전에 호출해야 적재 도중 발생한 변경도 놓치지 않습니다.
+        """
+        conn = None
+        try:
+            conn = await self._connect()
+        except Exception as e:
+            logger.warning("matching_change_listener_error", error=str(e))
+        self._tasks = [
+            asyncio.create_task(self._connection_loop(conn)),
+            asyncio.create_task(self._apply_loop()),
+        ]
+
+    def mark_ready(self) -> None:
+        """초기 전체 적재 완료 후 호출 - 그 전에 받은 이벤트는 대기했다가 적용됩니다."""
+        self._ready.set()
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        parsed = parse_change_payload(payload)
+        if parsed is None:
+            logger.warning("matching_change_payload_invalid", payload=payload)
+            return
+        self.events_received += 1
+        self._queue.put_nowait(parsed)
+
+    async def _connect(self) -> asyncpg.Connection:
+        conn = await asyncpg.connect(self._dsn)
+        await conn.add_listener(self._channel, self._on_notify)
+        logger.info("matching_change_listener_connected", channel=self._channel)
+        return conn
+
+    async def _connection_loop(self, conn: Optional[asyncpg.Connection]) -> None:
+        backoff = 1.0
+        while not self._stopping:
+            try:
+                if conn is None:
+                    conn = await self._connect()
+                    if self._ready.is_set():
+                        # 끊긴 동안 유실된 이벤트를 보정하기 위해 전체 재적재
+                        self.resyncs += 1
+                        await self._on_resync()
+                backoff = 1.0
+                while not conn.is_closed():
+                    await asyncio.sleep(self._health_interval)
+                    await conn.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "matching_change_listener_error", error=str(e), retry_in=backoff
+                )
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            conn = None
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self._max_backoff)
+
+    async def _apply_loop(self) -> None:
+        await self._ready.wait()
+        while True:
+            advertiser_id, kinds = await self._queue.get()
+            changes: Dict[int, Set[str]] = {advertiser_id: set(kinds)}
+            # 짧은 시간 동안 몰린 이벤트를 광고주별로 합쳐 한 번에 적용
+            await asyncio.sleep(self._coalesce_seconds)
+            while not self._queue.empty():
+                adv_id, more = self._queue.get_nowait()
+                changes.setdefault(adv_id, set()).update(more)
+            try:
+                await self._on_changes(changes)
+                self.batches_applied += 1
+            except Exception as e:
+                logger.error(
+                    "matching_change_apply_failed",
+                    error=str(e),
+                    advertiser_ids=list(changes),
+                    exc_info=True,
+                )
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "events_received": self.events_received,
+            "batches_applied": self.batches_applied,
+            "resyncs": self.resyncs,
+            "pending": self._queue.qsize(),
+        }
@@ -0,0 +1,159 @@
+"""
+키워드 매칭 인덱스 스냅샷 파일 (mmap)
+
+advertiser_keywords 행을 고정 폭 배열로 묶어 파일 하나에 저장하고, 워커는 mmap 으로 열어
+Postgres 전체 조회 없이 KeywordMatchIndex 를 구축합니다. 줄어드는 것은 시작 시 DB 에서 행을
+받아 오는 비용뿐이며, 각 워커는 여전히 자기 프로세스 메모리에 인덱스를 따로 만듭니다.
+
+파일 구조 (모든 배열은 8바이트 정렬, 기록한 머신의 바이트 순서)
+- 헤더     : magic(4) | format_version(u16) | byteorder(u16) | count(u32) | fingerprint_len(u32)
+- fingerprint (utf-8, 만든 시점의 advertiser_keywords 지문. 현재 지문과 다르면 사용하지 않음)
+- advertiser_ids : int64[count]
+- priorities     : int32[count]  (advertiser_keywords.priority 가 INTEGER 이므로 같은 폭)
+- match_types    : int8[count]   (MATCH_TYPES 의 인덱스)
+- offsets        : uint32[count + 1]  (keywords 블록 내 시작 위치)
+- keywords       : utf-8 문자열을 이어 붙인 블록
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import structlog
+
+from .matching_index import MATCH_TYPES
+
+logger = structlog.get_logger()
+
+MAGIC = b"GKMI"
+FORMAT_VERSION = 2
+_HEADER = struct.Struct("<4sHHII")
+_BYTEORDER = 1 if sys.byteorder == "little" else 2
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_snapshot(path: str, rows: Iterable[Any], fingerprint: str) -> int:
+    """
+    rows(advertiser_keywords 행)를 스냅샷으로 저장하고 행 수를 반환합니다.
+    임시 파일에 쓴 뒤 rename 하므로 읽는 워커는 항상 완전한 파일만 봅니다.
+    """
+    advertiser_ids = array("q")
+    priorities = array("i")
+    match_types = array("b")
+    offsets = array("I", [0])
+    blob = bytearray()
+    for r in rows:
+        keyword, match_type = r["keyword"], r["match_type"]
+        if not keyword or match_type not in MATCH_TYPES:
+            continue
+        advertiser_ids.append(r["advertiser_id"])
+        priorities.append(r["priority"] or 1)
+        match_types.append(MATCH_TYPES.index(match_type))
+        blob += keyword.encode("utf-8")
+        offsets.append(len(blob))
+
+    fp = fingerprint.encode("utf-8")
+    sections = [
+        _HEADER.pack(MAGIC, FORMAT_VERSION, _BYTEORDER, len(advertiser_ids), len(fp)) + fp,
+        advertiser_ids.tobytes(),
+        priorities.tobytes(),
+        match_types.tobytes(),
+        offsets.tobytes(),
+        bytes(blob),
+    ]
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        position = 0
+        for section in sections:
+            padding = _align(position) - position
+            f.write(b"\0" * padding)
+            f.write(section)
+            position += padding + len(section)
+    os.replace(tmp_path, path)
+    return len(advertiser_ids)
+
+
+class IndexSnapshot:
+    """읽기 전용 mmap 스냅샷. open() 이 None 을 반환하면 DB 에서 다시 구축해야 합니다."""
+
+    def __init__(self, mm: mmap.mmap, fingerprint: str, count: int, offset: int) -> None:
+        self._mm = mm
+        self.fingerprint = fingerprint
+        self._count = count
+        view = memoryview(mm)
+        self._views = [view]
+
+        def take(size: int, fmt: str) -> memoryview:
+            nonlocal offset
+            offset = _align(offset)
+            if offset + size > len(mm):
+                raise ValueError("snapshot truncated")
+            section = view[offset : offset + size].cast(fmt)
+            self._views.append(section)
+            offset += size
+            return section
+
+        try:
+            self._advertiser_ids = take(8 * count, "q")
+            self._priorities = take(4 * count, "i")
+            self._match_types = take(count, "b")
+            self._offsets = take(4 * (count + 1), "I")
+            self._keywords = take(self._offsets[count], "B")
+        except Exception:
+            self._release_views()
+            raise
+
+    @classmethod
+    def open(cls, path: str) -> Optional["IndexSnapshot"]:
+        try:
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            magic, version, byteorder, count, fp_len = _HEADER.unpack_from(mm, 0)
+            if (magic, version, byteorder) != (MAGIC, FORMAT_VERSION, _BYTEORDER):
+                raise ValueError("snapshot format mismatch")
+            fp_end = _HEADER.size + fp_len
+            fingerprint = mm[_HEADER.size : fp_end].decode("utf-8")
+            return cls(mm, fingerprint, count, fp_end)
+        except (struct.error, ValueError, TypeError, IndexError) as e:
+            logger.warning("matching_index_snapshot_invalid", path=path, error=str(e))
+            mm.close()
+            return None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "IndexSnapshot":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """KeywordMatchIndex.from_rows 에 바로 넘길 수 있는 행 (advertiser_keywords 의 id 순)"""
+        keywords, offsets = self._keywords, self._offsets
+        for i in range(self._count):
+            yield {
+                "advertiser_id": self._advertiser_ids[i],
+                "keyword": str(keywords[offsets[i] : offsets[i + 1]], "utf-8"),
+                "priority": self._priorities[i],
+                "match_type": MATCH_TYPES[self._match_types[i]],
+            }
+
+    def _release_views(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+
+    def close(self) -> None:
+        self._release_views()
+        self._mm.close()
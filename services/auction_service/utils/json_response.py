@@ -0,0 +1,39 @@
+"""
+경매 API 기본 응답 클래스
+
+orjson 이 설치되어 있으면 orjson 으로, 없으면 표준 json 으로 직렬화합니다.
+datetime 은 두 경우 모두 ISO 8601 문자열이 되고, 그 밖에 바로 직렬화할 수 없는 값
+(pydantic 모델, Decimal, DB Record 등)은 FastAPI 의 jsonable_encoder 로 변환합니다.
+따라서 엔드포인트가 dict / 모델을 그대로 담아 반환해도 됩니다.
+"""
+
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 은 선택 의존성
+    orjson = None  # type: ignore[assignment]
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse 와 같은 출력(compact, UTF-8)을 더 빠르게 생성"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+            default=jsonable_encoder,
+        ).encode("utf-8")
+
+
+def json_backend() -> str:
+    return "orjson" if orjson is not None else "json"
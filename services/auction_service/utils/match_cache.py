@@ -0,0 +1,234 @@
+"""
+검색어 단위 매칭 결과 캐시 (2단계)
+
+1차: 프로세스 내 LRU (TTL)
+2차: advertiser_matching_cache 테이블 (워커/재시작 간 공유)
+
+캐시에는 품질 점수 필터 적용 전의 매칭 결과(advertiser_id, match_score, reasons)를 저장하고,
+min_quality_score 필터는 조회 시점에 최신 설정으로 다시 적용합니다. 따라서 키는 정규화된
+검색어만으로 충분합니다. 다만 매칭 결과 자체가 자동 입찰이 켜진(is_enabled) 광고주만 포함하므로
+자동 입찰 설정 변경은 캐시 무효화가 필요합니다.
+
+키워드/카테고리/자동 입찰 설정 변경 이벤트가 오면 어떤 검색어의 결과가 바뀌는지 알 수 없으므로
+두 계층을 모두 비웁니다. 계산 도중 무효화가 일어난 결과는 generation 비교로 버립니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# 검색어 단위 "계산 완료" 표시 행 (매칭 광고주 0건인 결과도 캐시하기 위함)
+_SENTINEL_ADVERTISER_ID = 0
+
+# 테이블 쓰기 N회마다 만료 행 정리
+_EXPIRED_CLEANUP_EVERY = 100
+
+_CachedMatch = Tuple[int, float, Tuple[str, ...]]
+
+
+def normalize_score(score: float) -> float:
+    """
+    advertiser_matching_cache.match_score(NUMERIC(6,4)) 와 같은 자릿수로 반올림.
+    매칭 계산 결과에도 같은 값을 써야 캐시 적중/미스에 따라 입찰가가 달라지지 않음
+    """
+    return round(float(score), 4)
+
+
+def normalize_query(query: str) -> str:
+    """토큰화 결과가 같은 검색어를 같은 키로 (소문자 + 연속 공백 축약)"""
+    return " ".join(query.lower().split())
+
+
+class MatchResultCache:
+    """find_matching_advertisers 의 품질 필터 전 매칭 결과 캐시"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 10000,
+        db_ttl_seconds: float = 300.0,
+        max_pending_writes: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._db_ttl = db_ttl_seconds
+        self._max_pending_writes = max_pending_writes
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, List[_CachedMatch]]]" = (
+            OrderedDict()
+        )
+        self._pending: Set[asyncio.Task] = set()
+        self.generation = 0
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.db_write_failures = 0
+        self._writes = 0
+
+    @staticmethod
+    def key(query: str) -> str:
+        return hashlib.sha256(normalize_query(query).encode()).hexdigest()
+
+    # --- 1차 (메모리) ---
+    def get_local(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, matches = item
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return _as_dicts(matches)
+
+    def put_local(self, key: str, matches: List[_CachedMatch]) -> None:
+        self._entries[key] = (self._clock() + self._ttl, matches)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear_local(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    # --- 1차 + 2차 ---
+    async def get(self, database: Any, key: str) -> Optional[List[Dict[str, Any]]]:
+        matches = self.get_local(key)
+        if matches is not None:
+            self.hits += 1
+            return matches
+        if database.is_connected is True:
+            generation = self.generation
+            rows = await database.fetch_all(
+                """
+                SELECT advertiser_id, match_score, match_reasons
+                FROM advertiser_matching_cache
+                WHERE search_query_hash = :hash AND expires_at > NOW()
+                ORDER BY id
+                """,
+                {"hash": key},
+            )
+            if rows:
+                self.db_hits += 1
+                cached = [
+                    (
+                        r["advertiser_id"],
+                        float(r["match_score"]),
+                        tuple(r["match_reasons"] or ()),
+                    )
+                    for r in rows
+                    if r["advertiser_id"] != _SENTINEL_ADVERTISER_ID
+                ]
+                if generation == self.generation:
+                    self.put_local(key, cached)
+                return _as_dicts(cached)
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        database: Any,
+        key: str,
+        matches: List[Dict[str, Any]],
+        generation: int,
+    ) -> None:
+        """
+        계산 결과를 저장합니다. generation 이 바뀌었으면(계산 도중 무효화) 버립니다.
+        테이블 쓰기는 응답을 지연시키지 않도록 백그라운드로 수행합니다.
+        """
+        if generation != self.generation:
+            return
+        cached = [
+            (
+                m["advertiser_id"],
+                normalize_score(m["match_score"]),
+                tuple(m["reasons"]),
+            )
+            for m in matches
+        ]
+        self.put_local(key, cached)
+        if database.is_connected is not True:
+            return
+        if len(self._pending) >= self._max_pending_writes:
+            return
+        task = asyncio.create_task(self._write(database, key, cached, generation))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _write(
+        self, database: Any, key: str, cached: List[_CachedMatch], generation: int
+    ) -> None:
+        rows = [
+            {"advertiser_id": _SENTINEL_ADVERTISER_ID, "match_score": 0, "match_reasons": []}
+        ] + [
+            {"advertiser_id": a, "match_score": s, "match_reasons": list(r)}
+            for a, s, r in cached
+        ]
+        try:
+            async with database.transaction():
+                if generation != self.generation:
+                    return
+                await database.execute(
+                    "DELETE FROM advertiser_matching_cache WHERE search_query_hash = :hash",
+                    {"hash": key},
+                )
+                await database.execute(
+                    """
+                    INSERT INTO advertiser_matching_cache
+                        (search_query_hash, advertiser_id, match_score, match_reasons, expires_at)
+                    SELECT :hash, r.advertiser_id, r.match_score, r.match_reasons,
+                           NOW() + CAST(:ttl AS integer) * INTERVAL '1 second'
+                    FROM jsonb_to_recordset(CAST(:rows AS jsonb))
+                        AS r(advertiser_id integer, match_score numeric, match_reasons text[])
+                    ON CONFLICT (search_query_hash, advertiser_id) DO NOTHING
+                    """,
+                    {
+                        "hash": key,
+                        "ttl": int(self._db_ttl),
+                        "rows": json.dumps(rows, ensure_ascii=False),
+                    },
+                )
+                self._writes += 1
+                if self._writes % _EXPIRED_CLEANUP_EVERY == 0:
+                    await database.execute(
+                        "DELETE FROM advertiser_matching_cache WHERE expires_at <= NOW()"
+                    )
+        except Exception as e:
+            self.db_write_failures += 1
+            logger.warning("match_cache_write_failed", error=str(e))
+
+    async def invalidate(self, database: Any) -> None:
+        """키워드/카테고리 변경: 메모리 캐시와 테이블 캐시를 모두 비웁니다."""
+        self.clear_local()
+        if database.is_connected is not True:
+            return
+        await database.execute("DELETE FROM advertiser_matching_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.db_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": (
+                round((self.hits + self.db_hits) / lookups, 4) if lookups else 0.0
+            ),
+            "pending_writes": len(self._pending),
+            "db_write_failures": self.db_write_failures,
+        }
+
+
+def _as_dicts(matches: List[_CachedMatch]) -> List[Dict[str, Any]]:
+    return [
+        {"advertiser_id": a, "match_score": s, "reasons": list(r)}
+        for a, s, r in matches
+    ]
@@ -0,0 +1,226 @@
+"""
+광고주 키워드 인메모리 매칭 인덱스
+
+advertiser_keywords 전체를 프로세스 메모리에 올려 두고, find_matching_advertisers 의
+EXACT / PHRASE / BROAD SQL 과 동일한 판정을 Postgres 없이 수행합니다.
+
+- EXACT : lower(replace(keyword, ' ', '')) = ANY(tokens_norm)  -> 정규화 키워드 해시맵
+- PHRASE: 정규화 키워드 일치 OR 정규화 키워드 LIKE '%tok%'       -> 해시맵 + 2-gram 역색인
+- BROAD : lower(keyword) LIKE '%tok%'                            -> 2-gram 역색인
+
+부분 문자열 판정은 토큰의 2-gram posting 을 교집합으로 좁힌 뒤 실제 포함 여부로 검증하므로
+LIKE '%tok%' 와 같은 결과를 돌려줍니다 (길이 2 미만 토큰은 SQL 경로와 동일하게 사용하지 않음).
+검색어의 '%', '_' 는 와일드카드가 아닌 문자 그대로 비교합니다. SQL 경로도 like_pattern() 으로
+이스케이프한 패턴을 사용하므로 두 경로의 결과가 같습니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+MATCH_TYPES = ("exact", "phrase", "broad")
+_GRAM = 2
+
+
+def sql_norm(keyword: str) -> str:
+    """SQL 의 lower(replace(keyword, ' ', '')) 와 동일한 정규화"""
+    return keyword.lower().replace(" ", "")
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i : i + _GRAM] for i in range(len(text) - _GRAM + 1)}
+
+
+class _Entry:
+    __slots__ = ("advertiser_id", "keyword", "priority", "match_type", "norm", "lower")
+
+    def __init__(self, advertiser_id: int, keyword: str, priority: int, match_type: str):
+        self.advertiser_id = advertiser_id
+        self.keyword = keyword
+        self.priority = priority
+        self.match_type = match_type
+        self.norm = sql_norm(keyword)
+        self.lower = keyword.lower()
+
+    def as_row(self) -> Dict[str, Any]:
+        return {
+            "advertiser_id": self.advertiser_id,
+            "keyword": self.keyword,
+            "priority": self.priority,
+            "match_type": self.match_type,
+        }
+
+
+class KeywordMatchIndex:
+    """advertiser_keywords 기반 인메모리 매칭 인덱스"""
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, _Entry] = {}
+        self._by_advertiser: Dict[int, Set[int]] = {}
+        self._next_id = 0
+        # match_type -> 정규화 키워드 -> entry ids
+        self._norm_map: Dict[str, Dict[str, Set[int]]] = {
+            "exact": {},
+            "phrase": {},
+        }
+        # PHRASE 는 정규화 키워드, BROAD 는 lower(keyword) 기준 2-gram posting
+        self._phrase_grams: Dict[str, Set[int]] = {}
+        self._broad_grams: Dict[str, Set[int]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> "KeywordMatchIndex":
+        index = cls()
+        for r in rows:
+            index.add(r["advertiser_id"], r["keyword"], r["priority"], r["match_type"])
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, advertiser_id: int, keyword: str, priority: Optional[int], match_type: str) -> None:
+        if not keyword or match_type not in MATCH_TYPES:
+            return
+        entry = _Entry(advertiser_id, keyword, priority or 1, match_type)
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = entry
+        self._by_advertiser.setdefault(advertiser_id, set()).add(entry_id)
+
+        if match_type in self._norm_map:
+            self._norm_map[match_type].setdefault(entry.norm, set()).add(entry_id)
+        if match_type == "phrase":
+            for g in _grams(entry.norm):
+                self._phrase_grams.setdefault(g, set()).add(entry_id)
+        elif match_type == "broad":
+            for g in _grams(entry.lower):
+                self._broad_grams.setdefault(g, set()).add(entry_id)
+
+    def remove_advertiser(self, advertiser_id: int) -> int:
+        """광고주의 모든 키워드를 인덱스에서 제거하고 제거된 개수를 반환합니다."""
+        entry_ids = self._by_advertiser.pop(advertiser_id, set())
+        for entry_id in entry_ids:
+            entry = self._entries.pop(entry_id)
+            if entry.match_type in self._norm_map:
+                _discard(self._norm_map[entry.match_type], entry.norm, entry_id)
+            if entry.match_type == "phrase":
+                for g in _grams(entry.norm):
+                    _discard(self._phrase_grams, g, entry_id)
+            elif entry.match_type == "broad":
+                for g in _grams(entry.lower):
+                    _discard(self._broad_grams, g, entry_id)
+        return len(entry_ids)
+
+    def replace_advertisers(
+        self, advertiser_ids: Iterable[int], rows: Iterable[Any]
+    ) -> None:
+        """
+        광고주 단위 델타 적용: advertiser_ids 의 기존 키워드를 제거하고 rows 로 교체합니다.
+        rows 에 없는 광고주는 키워드가 모두 삭제된 것으로 간주합니다.
+        """
+        for advertiser_id in advertiser_ids:
+            self.remove_advertiser(advertiser_id)
+        for r in rows:
+            self.add(r["advertiser_id"], r["keyword"], r["priority"], r["match_type"])
+
+    def _substring_candidates(self, grams_map: Dict[str, Set[int]], term: str) -> Set[int]:
+        postings = []
+        for g in _grams(term):
+            ids = grams_map.get(g)
+            if not ids:
+                return set()
+            postings.append(ids)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+    def match(
+        self, tokens_norm: Sequence[str], like_terms: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        SQL 경로의 exact_rows + phrase_rows + broad_rows 와 같은 행 목록을 반환합니다.
+        like_terms 는 '%' 를 붙이기 전의 토큰(길이 2 이상)입니다.
+        """
+        terms = [t for t in like_terms if len(t) >= _GRAM]
+
+        exact_ids: Set[int] = set()
+        for tok in tokens_norm:
+            exact_ids |= self._norm_map["exact"].get(tok, set())
+
+        phrase_ids: Set[int] = set()
+        for tok in tokens_norm:
+            phrase_ids |= self._norm_map["phrase"].get(tok, set())
+        for term in terms:
+            for entry_id in self._substring_candidates(self._phrase_grams, term):
+                if term in self._entries[entry_id].norm:
+                    phrase_ids.add(entry_id)
+
+        broad_ids: Set[int] = set()
+        for term in terms:
+            for entry_id in self._substring_candidates(self._broad_grams, term):
+                if term in self._entries[entry_id].lower:
+                    broad_ids.add(entry_id)
+
+        rows: List[Dict[str, Any]] = []
+        for ids in (exact_ids, phrase_ids, broad_ids):
+            rows.extend(self._entries[i].as_row() for i in sorted(ids))
+        return rows
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "keywords": len(self._entries),
+            "advertisers": len(self._by_advertiser),
+            "phrase_grams": len(self._phrase_grams),
+            "broad_grams": len(self._broad_grams),
+        }
+
+
+def _discard(postings: Dict[str, Set[int]], key: str, entry_id: int) -> None:
+    ids = postings.get(key)
+    if ids is None:
+        return
+    ids.discard(entry_id)
+    if not ids:
+        del postings[key]
+
+
+class AutoBidSettingsCache:
+    """활성화된 auto_bid_settings 의 광고주별 min_quality_score 캐시"""
+
+    def __init__(self) -> None:
+        self._min_quality: Dict[int, int] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> "AutoBidSettingsCache":
+        cache = cls()
+        cache.replace_advertisers((), rows)
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._min_quality)
+
+    def get(self, advertiser_id: int) -> Optional[int]:
+        """활성화된 광고주면 min_quality_score, 아니면 None"""
+        return self._min_quality.get(advertiser_id)
+
+    def replace_advertisers(
+        self, advertiser_ids: Iterable[int], rows: Iterable[Any]
+    ) -> None:
+        """advertiser_ids 를 비우고 rows(is_enabled = true 인 행만)로 교체합니다."""
+        for advertiser_id in advertiser_ids:
+            self._min_quality.pop(advertiser_id, None)
+        for r in rows:
+            self._min_quality[r["advertiser_id"]] = r["min_quality_score"]
+
+
+def like_pattern(term: str) -> str:
+    """'%term%' LIKE 패턴 (term 의 \\, %, _ 는 이스케이프하여 문자 그대로 비교)"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def build_like_terms(raw_tokens: Sequence[str]) -> List[str]:
+    """LIKE 에 사용할 토큰(길이 2 이상) 목록 - 순서 유지, 중복 제거"""
+    return list(dict.fromkeys(t for t in raw_tokens if len(t) >= _GRAM))
+
@@ -0,0 +1,166 @@
+"""
+경매 파이프라인 단계별 지연 시간 히스토그램
+
+- observe(stage, seconds) / timer(stage) 로 기록
+- render_prometheus() : /metrics 용 Prometheus 텍스트 포맷 (histogram)
+- summary()           : 최근 샘플 기준 p50/p95/p99 (ms), /system-status 용
+- drain_rollup()      : 마지막 롤업 이후 샘플의 집계를 반환하고 비움 (auction_performance_metrics 저장용)
+- render_counter()    : 라벨별 누적 카운터를 /metrics 용 Prometheus 텍스트 포맷으로
+
+외부 의존성 없이 프로세스(워커) 단위로 집계합니다.
+"""
+
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence
+
+# 초 단위 버킷 (0.5ms ~ 5s)
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """정렬된 값의 nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float], reservoir_size: int, rollup_size: int):
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.recent: Deque[float] = deque(maxlen=reservoir_size)
+        self.rollup: List[float] = []
+        self.rollup_size = rollup_size
+        self.rollup_dropped = 0
+
+
+class StageMetrics:
+    """단계 이름별 히스토그램 모음"""
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        reservoir_size: int = 2048,
+        rollup_size: int = 10000,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._reservoir_size = reservoir_size
+        self._rollup_size = rollup_size
+        self._stages: Dict[str, _Histogram] = {}
+
+    def observe(self, stage: str, seconds: float) -> None:
+        hist = self._stages.get(stage)
+        if hist is None:
+            hist = _Histogram(self.buckets, self._reservoir_size, self._rollup_size)
+            self._stages[stage] = hist
+        hist.count += 1
+        hist.sum += seconds
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                hist.bucket_counts[i] += 1
+                break
+        hist.recent.append(seconds)
+        if len(hist.rollup) < hist.rollup_size:
+            hist.rollup.append(seconds)
+        else:
+            hist.rollup_dropped += 1
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """with 블록 실행 시간을 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 최근 샘플 p50/p95/p99 (ms) 와 누적 건수"""
+        result: Dict[str, Dict[str, Any]] = {}
+        for stage, hist in sorted(self._stages.items()):
+            values = sorted(hist.recent)
+            result[stage] = {
+                "count": hist.count,
+                **_percentiles_ms(values),
+            }
+        return result
+
+    def drain_rollup(self) -> Dict[str, Dict[str, Any]]:
+        """마지막 호출 이후 샘플의 단계별 집계 (샘플이 없는 단계는 제외)"""
+        result: Dict[str, Dict[str, Any]] = {}
+        for stage, hist in sorted(self._stages.items()):
+            if not hist.rollup:
+                continue
+            values = sorted(hist.rollup)
+            result[stage] = {
+                "count": len(values) + hist.rollup_dropped,
+                "avg_ms": round(sum(values) / len(values) * 1000, 3),
+                "max_ms": round(values[-1] * 1000, 3),
+                **_percentiles_ms(values),
+            }
+            hist.rollup = []
+            hist.rollup_dropped = 0
+        return result
+
+    def render_prometheus(
+        self, name: str = "auction_stage_duration_seconds", help_text: Optional[str] = None
+    ) -> str:
+        lines = [
+            f"# HELP {name} {help_text or 'Auction pipeline stage latency in seconds'}",
+            f"# TYPE {name} histogram",
+        ]
+        for stage, hist in sorted(self._stages.items()):
+            label = _escape_label(stage)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, hist.bucket_counts):
+                cumulative += bucket_count
+                lines.append(
+                    f'{name}_bucket{{stage="{label}",le="{_format_bound(bound)}"}} {cumulative}'
+                )
+            lines.append(f'{name}_bucket{{stage="{label}",le="+Inf"}} {hist.count}')
+            lines.append(f'{name}_sum{{stage="{label}"}} {hist.sum:.6f}')
+            lines.append(f'{name}_count{{stage="{label}"}} {hist.count}')
+        return "\n".join(lines) + "\n"
+
+
+def render_counter(name: str, help_text: str, label: str, values: Dict[str, float]) -> str:
+    """{라벨 값: 누적값} 을 Prometheus counter 텍스트로"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    for key, value in sorted(values.items()):
+        lines.append(f'{name}{{{label}="{_escape_label(key)}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def _percentiles_ms(sorted_values: Sequence[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": round(percentile(sorted_values, 50) * 1000, 3),
+        "p95_ms": round(percentile(sorted_values, 95) * 1000, 3),
+        "p99_ms": round(percentile(sorted_values, 99) * 1000, 3),
+    }
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,104 @@
+"""
+연결별 prepared statement 레지스트리
+
+고정 SQL(= ANY(:arr) / LIKE ANY(:arr))을 asyncpg 연결마다 한 번만 PREPARE 하고 재사용합니다.
+databases 는 SQL 을 매번 컴파일해 asyncpg 에 넘기므로, 핫 패스 쿼리는 이 레지스트리를 거쳐
+서버 측 plan 재사용 여부를 직접 관리하고 적중률을 /system-status 로 노출합니다.
+
+- :name 바인드는 SQL 텍스트당 한 번만 $1, $2 ... 로 변환하여 캐시
+- 연결은 백엔드 PID 로 구분 (풀에서 매번 다른 proxy 가 반환되어도 같은 서버 세션이면 재사용)
+- 연결이 닫혀 statement 가 무효화되면 해당 연결의 캐시를 비우고 다시 PREPARE
+"""
+
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import asyncpg
+
+# ::type 캐스트는 제외하고 :name 만 바인드로 인식 (sqlalchemy text() 와 동일한 규칙)
+_BIND_RE = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+
+
+def to_positional(sql: str) -> Tuple[str, List[str]]:
+    """':name' 바인드를 asyncpg 의 '$n' 으로 변환하고 인자 순서를 반환합니다."""
+    names: List[str] = []
+
+    def _sub(match: "re.Match[str]") -> str:
+        name = match.group(1)
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+
+    return _BIND_RE.sub(_sub, sql), names
+
+
+class PreparedStatementRegistry:
+    """asyncpg 연결(백엔드 PID)별 PreparedStatement 캐시"""
+
+    def __init__(self, max_statements: int = 64, max_connections: int = 64) -> None:
+        self._max_statements = max_statements
+        self._max_connections = max_connections
+        self._compiled: Dict[str, Tuple[str, List[str]]] = {}
+        self._statements: "OrderedDict[int, OrderedDict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _compile(self, sql: str) -> Tuple[str, List[str]]:
+        compiled = self._compiled.get(sql)
+        if compiled is None:
+            compiled = self._compiled[sql] = to_positional(sql)
+        return compiled
+
+    def _connection_cache(self, pid: int) -> "OrderedDict[str, Any]":
+        cache = self._statements.get(pid)
+        if cache is None:
+            cache = self._statements[pid] = OrderedDict()
+            if len(self._statements) > self._max_connections:
+                self._statements.popitem(last=False)
+        else:
+            self._statements.move_to_end(pid)
+        return cache
+
+    async def _statement(self, raw_connection: Any, sql: str) -> Tuple[Any, List[str]]:
+        positional_sql, names = self._compile(sql)
+        cache = self._connection_cache(raw_connection.get_server_pid())
+        stmt = cache.get(sql)
+        if stmt is not None:
+            self.hits += 1
+            cache.move_to_end(sql)
+            return stmt, names
+
+        self.misses += 1
+        stmt = await raw_connection.prepare(positional_sql)
+        cache[sql] = stmt
+        if len(cache) > self._max_statements:
+            cache.popitem(last=False)
+        return stmt, names
+
+    async def fetch(
+        self,
+        raw_connection: Any,
+        sql: str,
+        values: Optional[Mapping[str, Any]] = None,
+    ) -> List[Any]:
+        """raw asyncpg 연결에서 prepared statement 로 조회합니다."""
+        stmt, names = await self._statement(raw_connection, sql)
+        args = [(values or {})[name] for name in names]
+        try:
+            return await stmt.fetch(*args)
+        except (asyncpg.InterfaceError, asyncpg.InvalidSQLStatementNameError):
+            # 연결 재생성/DISCARD 등으로 statement 가 무효화된 경우 한 번 재시도
+            self._statements.pop(raw_connection.get_server_pid(), None)
+            stmt, names = await self._statement(raw_connection, sql)
+            return await stmt.fetch(*args)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "connections": len(self._statements),
+            "statements": sum(len(c) for c in self._statements.values()),
+        }
@@ -0,0 +1,117 @@
+"""
+광고주 프로필 캐시 (입찰가 계산용)
+
+ADVERTISER_DETAILS_SQL (advertisers ⨝ auto_bid_settings ⨝ advertiser_reviews) 결과를
+광고주별 __slots__ 레코드로 보관합니다. 경매마다 같은 조인을 다시 실행하지 않고
+캐시에 없는 광고주만 조회합니다.
+
+- 변경 이벤트(settings / profile)가 오면 해당 광고주만 무효화
+- 이벤트 유실에 대비해 TTL 이 지나면 다시 조회
+- 자동입찰이 비활성화되어 조회 결과가 없는 광고주도 "없음"으로 캐시
+- 조회 도중 무효화가 일어나면 generation 비교로 그 결과를 버림
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+PROFILE_FIELDS = (
+    "advertiser_id",
+    "company_name",
+    "website_url",
+    "daily_budget",
+    "max_bid_per_keyword",
+    "recommended_bid_min",
+    "recommended_bid_max",
+)
+
+
+class AdvertiserProfile:
+    """ADVERTISER_DETAILS_SQL 한 행"""
+
+    __slots__ = PROFILE_FIELDS
+
+    def __init__(self, row: Any) -> None:
+        for field in PROFILE_FIELDS:
+            setattr(self, field, row[field])
+
+    def as_info(self) -> Dict[str, Any]:
+        """_build_advertiser_bids 가 받는 info 딕셔너리 (SQL 행과 같은 키)"""
+        return {field: getattr(self, field) for field in PROFILE_FIELDS}
+
+
+class AdvertiserProfileCache:
+    """광고주 ID -> (만료 시각, AdvertiserProfile | None) LRU"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 50000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[int, Tuple[float, Optional[AdvertiserProfile]]]" = (
+            OrderedDict()
+        )
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(
+        self, advertiser_ids: Iterable[int]
+    ) -> Tuple[Dict[int, Dict[str, Any]], List[int]]:
+        """(캐시된 info 맵, 조회가 필요한 광고주 ID 목록). 비활성 광고주는 info 맵에서 빠짐"""
+        now = self._clock()
+        found: Dict[int, Dict[str, Any]] = {}
+        missing: List[int] = []
+        for advertiser_id in advertiser_ids:
+            item = self._entries.get(advertiser_id)
+            if item is None or item[0] <= now:
+                missing.append(advertiser_id)
+                continue
+            self._entries.move_to_end(advertiser_id)
+            self.hits += 1
+            if item[1] is not None:
+                found[advertiser_id] = item[1].as_info()
+        self.misses += len(missing)
+        return found, missing
+
+    def put_rows(
+        self, advertiser_ids: Iterable[int], rows: Iterable[Any], generation: int
+    ) -> None:
+        """advertiser_ids 를 조회한 결과 rows 를 저장 (rows 에 없는 광고주는 "없음")"""
+        if generation != self.generation:
+            return
+        expires_at = self._clock() + self._ttl
+        profiles = {r["advertiser_id"]: AdvertiserProfile(r) for r in rows}
+        for advertiser_id in advertiser_ids:
+            self._entries[advertiser_id] = (expires_at, profiles.get(advertiser_id))
+            self._entries.move_to_end(advertiser_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, advertiser_ids: Optional[Iterable[int]] = None) -> None:
+        """광고주들의 프로필을 비웁니다 (None 이면 전체)"""
+        self.generation += 1
+        self.invalidations += 1
+        if advertiser_ids is None:
+            self._entries.clear()
+            return
+        for advertiser_id in advertiser_ids:
+            self._entries.pop(advertiser_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+        }
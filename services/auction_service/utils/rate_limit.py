@@ -0,0 +1,149 @@
+"""
+/start 레이트리밋 (슬라이딩 윈도우: window 초 동안 최대 max_requests 회)
+
+- SlidingWindowRateLimiter : 프로세스 내 LRU (키 수 상한, 키당 타임스탬프 최대 max_requests 개)
+- PostgresRateLimiter      : UNLOGGED 테이블 auction_rate_limits 를 공유하여 모든 워커가 같은 한도를 적용
+                             (한 문장 upsert 로 판정, DB 오류 시 로컬 리미터로 대체)
+"""
+
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+# 공유 테이블 쓰기 N회마다 만료 행 정리
+_EXPIRED_CLEANUP_EVERY = 1000
+
+
+class SlidingWindowRateLimiter:
+    """키별 최근 요청 시각을 deque 로 보관하는 슬라이딩 윈도우 (max_keys 초과 시 LRU 제거)"""
+
+    def __init__(
+        self,
+        window_seconds: float,
+        max_requests: int,
+        max_keys: int = 100000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window = window_seconds
+        self.max_requests = max_requests
+        self._max_keys = max_keys
+        self._clock = clock
+        self._hits: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self.allowed = 0
+        self.limited = 0
+        self.evicted = 0
+
+    def allow(self, key: str) -> bool:
+        now = self._clock()
+        hits = self._hits.get(key)
+        if hits is None:
+            hits = deque()
+            self._hits[key] = hits
+            if len(self._hits) > self._max_keys:
+                self._hits.popitem(last=False)
+                self.evicted += 1
+        else:
+            self._hits.move_to_end(key)
+            # 윈도우를 벗어난 요청 제거 (키당 최대 max_requests 개라 상수 시간)
+            while hits and now - hits[0] >= self.window:
+                hits.popleft()
+
+        if len(hits) >= self.max_requests:
+            self.limited += 1
+            return False
+        hits.append(now)
+        self.allowed += 1
+        return True
+
+    def __len__(self) -> int:
+        return len(self._hits)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "local",
+            "keys": len(self._hits),
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "evicted": self.evicted,
+        }
+
+
+class PostgresRateLimiter:
+    """auction_rate_limits 테이블 기반 워커 간 공유 슬라이딩 윈도우"""
+
+    # 윈도우 내 요청 수가 한도 미만일 때만 현재 시각을 추가 (행이 반환되지 않으면 제한)
+    ALLOW_SQL = """
+        INSERT INTO auction_rate_limits AS r (key, hits, expires_at)
+        VALUES (:key, ARRAY[clock_timestamp()],
+                clock_timestamp() + CAST(:window AS double precision) * INTERVAL '1 second')
+        ON CONFLICT (key) DO UPDATE
+        SET hits = ARRAY(
+                SELECT h FROM unnest(r.hits) AS h
+                WHERE h > clock_timestamp() - CAST(:window AS double precision) * INTERVAL '1 second'
+            ) || clock_timestamp(),
+            expires_at = EXCLUDED.expires_at
+        WHERE (
+            SELECT count(*) FROM unnest(r.hits) AS h
+            WHERE h > clock_timestamp() - CAST(:window AS double precision) * INTERVAL '1 second'
+        ) < CAST(:max_requests AS integer)
+        RETURNING 1 AS ok
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        max_requests: int,
+        fallback: Optional[SlidingWindowRateLimiter] = None,
+    ) -> None:
+        self.window = window_seconds
+        self.max_requests = max_requests
+        self._fallback = (
+            fallback
+            if fallback is not None
+            else SlidingWindowRateLimiter(window_seconds, max_requests)
+        )
+        self.allowed = 0
+        self.limited = 0
+        self.failures = 0
+        self._writes = 0
+
+    async def allow(self, database: Any, key: str) -> bool:
+        if database.is_connected is not True:
+            return self._fallback.allow(key)
+        try:
+            row = await database.fetch_one(
+                self.ALLOW_SQL,
+                {"key": key, "window": self.window, "max_requests": self.max_requests},
+            )
+        except Exception as e:
+            self.failures += 1
+            logger.warning("rate_limit_backend_failed", error=str(e))
+            return self._fallback.allow(key)
+
+        self._writes += 1
+        if self._writes % _EXPIRED_CLEANUP_EVERY == 0:
+            try:
+                await database.execute(
+                    "DELETE FROM auction_rate_limits WHERE expires_at <= clock_timestamp()"
+                )
+            except Exception as e:
+                logger.warning("rate_limit_cleanup_failed", error=str(e))
+
+        if row is None:
+            self.limited += 1
+            return False
+        self.allowed += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "postgres",
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "failures": self.failures,
+            "fallback": self._fallback.stats(),
+        }
@@ -1,6 +1,51 @@
 import hmac
 import os
 from hashlib import sha256
+from typing import Iterable, List, Optional, Tuple
+
+
+class ClickSigner:
+    """
+    클릭 URL HMAC-SHA256 서명기
+
+    키로 초기화한 hmac 상태를 한 번만 만들어 두고 메시지마다 copy() 해서 사용합니다.
+    key_id 가 있으면 서명 앞에 "<key_id>." 를 붙여 검증 측이 키를 고를 수 있게 합니다
+    (키 교체 시 이전 키로 만든 서명도 검증 가능). key_id 가 없으면 기존 형식(hex)과 같습니다.
+    """
+
+    def __init__(self, secret: str, key_id: Optional[str] = None) -> None:
+        if key_id is not None and (not key_id or "." in key_id):
+            raise ValueError("key_id 는 비어 있지 않고 '.' 을 포함하지 않아야 합니다.")
+        self.key_id = key_id
+        self._prefix = f"{key_id}." if key_id else ""
+        self._base = hmac.new(secret.encode(), digestmod=sha256)
+
+    @classmethod
+    def from_env(cls) -> "ClickSigner":
+        return cls(
+            os.getenv("CLICK_HMAC_SECRET", "dev-click-secret"),
+            os.getenv("CLICK_HMAC_KEY_ID") or None,
+        )
+
+    def sign(self, bid_id: str, payout: int, bid_type: str) -> str:
+        mac = self._base.copy()
+        mac.update(f"{bid_id}.{payout}.{bid_type}".encode())
+        return self._prefix + mac.hexdigest()
+
+    def sign_many(self, items: Iterable[Tuple[str, int, str]]) -> List[str]:
+        """경매 한 번의 입찰들을 한 번에 서명 ((bid_id, payout, bid_type) 순서대로)"""
+        return [self.sign(bid_id, payout, bid_type) for bid_id, payout, bid_type in items]
+
+
+_signer: Optional[ClickSigner] = None
+
+
+def get_signer() -> ClickSigner:
+    """환경 변수로 만든 프로세스 공용 서명기 (첫 호출 시 생성)"""
+    global _signer
+    if _signer is None:
+        _signer = ClickSigner.from_env()
+    return _signer
 
 
 def sign_click(bid_id: str, payout: int, bid_type: str) -> str:
@@ -13,8 +58,11 @@ def sign_click(bid_id: str, payout: int, bid_type: str) -> str:
         bid_type (str): 입찰 타입 ('PLATFORM' 또는 'ADVERTISER')
 
     Returns:
-        str: HMAC-SHA256 서명
+        str: HMAC-SHA256 서명 (CLICK_HMAC_KEY_ID 가 있으면 "<key_id>.<hex>")
     """
-    secret = os.getenv("CLICK_HMAC_SECRET", "dev-click-secret").encode()
-    msg = f"{bid_id}.{payout}.{bid_type}".encode()
-    return hmac.new(secret, msg, sha256).hexdigest()
+    return get_signer().sign(bid_id, payout, bid_type)
+
+
+def sign_clicks(items: Iterable[Tuple[str, int, str]]) -> List[str]:
+    """여러 입찰의 클릭 URL 서명 ((bid_id, payout, bid_type) 목록)"""
+    return get_signer().sign_many(items)
@@ -1,6 +1,79 @@
 import hmac
 import os
 from hashlib import sha256
+from typing import Dict, Optional
+
+
+def _parse_previous_keys(value: str) -> Dict[str, str]:
+    """CLICK_HMAC_PREVIOUS_KEYS="kid1:secret1,kid2:secret2" -> {kid: secret}"""
+    keys: Dict[str, str] = {}
+    for item in value.split(","):
+        kid, sep, secret = item.strip().partition(":")
+        if sep and kid and secret:
+            keys[kid] = secret
+    return keys
+
+
+class ClickVerifier:
+    """
+    클릭 URL HMAC-SHA256 서명 검증기
+
+    키마다 초기화한 hmac 상태를 한 번만 만들어 두고 메시지마다 copy() 해서 사용합니다.
+    - "<key_id>.<hex>" 서명: 현재 키 또는 이전 키 중 key_id 가 같은 키로 검증
+    - key_id 없는 hex 서명 (기존 형식): 알고 있는 모든 키로 검증
+    비교는 hmac.compare_digest 로 상수 시간에 수행합니다.
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        key_id: Optional[str] = None,
+        previous_keys: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self._keyed: Dict[str, "hmac.HMAC"] = {
+            kid: hmac.new(s.encode(), digestmod=sha256)
+            for kid, s in (previous_keys or {}).items()
+        }
+        current = hmac.new(secret.encode(), digestmod=sha256)
+        if key_id:
+            self._keyed[key_id] = current
+        self._all = [current] + [
+            mac for kid, mac in self._keyed.items() if kid != key_id
+        ]
+
+    @classmethod
+    def from_env(cls) -> "ClickVerifier":
+        return cls(
+            os.getenv("CLICK_HMAC_SECRET", "dev-click-secret"),
+            os.getenv("CLICK_HMAC_KEY_ID") or None,
+            _parse_previous_keys(os.getenv("CLICK_HMAC_PREVIOUS_KEYS", "")),
+        )
+
+    def verify(self, bid_id: str, payout: int, bid_type: str, sig: str) -> bool:
+        msg = f"{bid_id}.{payout}.{bid_type}".encode()
+        kid, sep, digest = sig.rpartition(".")
+        if sep:
+            base = self._keyed.get(kid)
+            candidates = [base] if base is not None else []
+        else:
+            candidates = self._all
+        valid = False
+        for base in candidates:
+            mac = base.copy()
+            mac.update(msg)
+            valid |= hmac.compare_digest(mac.hexdigest(), digest)
+        return valid
+
+
+_verifier: Optional[ClickVerifier] = None
+
+
+def get_verifier() -> ClickVerifier:
+    """환경 변수로 만든 프로세스 공용 검증기 (첫 호출 시 생성)"""
+    global _verifier
+    if _verifier is None:
+        _verifier = ClickVerifier.from_env()
+    return _verifier
 
 
 def verify_sig(bid_id: str, payout: int, bid_type: str, sig: str) -> bool:
@@ -11,12 +84,9 @@ def verify_sig(bid_id: str, payout: int, bid_type: str, sig: str) -> bool:
         bid_id (str): 입찰 ID
         payout (int): 지급 금액
         bid_type (str): 입찰 타입 ('PLATFORM' 또는 'ADVERTISER')
-        sig (str): 검증할 서명
+        sig (str): 검증할 서명 ("<key_id>.<hex>" 또는 hex)
 
     Returns:
         bool: 서명이 유효한지 여부
     """
-    secret = os.getenv("CLICK_HMAC_SECRET", "dev-click-secret").encode()
-    msg = f"{bid_id}.{payout}.{bid_type}".encode()
-    expected = hmac.new(secret, msg, sha256).hexdigest()
-    return hmac.compare_digest(expected, sig)
+    return get_verifier().verify(bid_id, payout, bid_type, sig)
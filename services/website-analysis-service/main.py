@@ -38,6 +38,11 @@ if not API_KEY.strip():
 genai.configure(api_key=API_KEY)  # type: ignore[attr-defined]
 model: Any = cast(Any, genai).GenerativeModel(MODEL_NAME)  # type: ignore[attr-defined]
 
+# auction-service 인메모리 매칭 캐시 갱신용 NOTIFY 채널
+MATCHING_CHANGES_CHANNEL = os.getenv(
+    "MATCHING_CHANGES_CHANNEL", "auction_matching_changes"
+)
+
 app = FastAPI()
 
 
@@ -207,6 +212,20 @@ async def analyze_with_gemini(text_content: str) -> dict:
         return {}
 
 
+async def publish_matching_change(advertiser_id: int, *kinds: str) -> None:
+    """
+    광고주 매칭 데이터 변경을 Postgres NOTIFY 로 알립니다. (실패해도 저장은 계속)
+    """
+    payload = json.dumps({"advertiser_id": advertiser_id, "kinds": list(kinds)})
+    try:
+        await database.execute(
+            "SELECT pg_notify(:channel, :payload)",
+            {"channel": MATCHING_CHANGES_CHANNEL, "payload": payload},
+        )
+    except Exception as e:
+        logger.warning(f"⚠️ [{advertiser_id}] 매칭 변경 이벤트 발행 실패: {e}")
+
+
 async def save_analysis_results(advertiser_id: int, results: dict):
     """
     분석 결과를 데이터베이스에 저장합니다.
@@ -260,7 +279,14 @@ async def save_analysis_results(advertiser_id: int, results: dict):
         "UPDATE advertisers SET approval_status = 'pending' WHERE id = :advertiser_id",
         {"advertiser_id": advertiser_id},
     )
-    
+
+    # 심사 상태가 pending 으로 바뀌어 경매 쪽 추천 입찰가(프로필)도 다시 읽어야 함
+    # (모든 변경을 반영한 뒤 발행해야 수신 측이 이전 상태를 다시 캐시하지 않음)
+    if keyword_count or category_count:
+        await publish_matching_change(advertiser_id, "keywords", "categories", "profile")
+    else:
+        await publish_matching_change(advertiser_id, "profile")
+
     logger.info(f"💾 [{advertiser_id}] 분석 결과 저장 완료: 키워드 {keyword_count}개, 카테고리 {category_count}개")
 
 